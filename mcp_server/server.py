@@ -652,20 +652,24 @@ async def invoke_cli_command_async(command_func, args: list[str]) -> dict:
 # ============================================================================
 
 @mcp.tool()
-async def oar_check_cve_tracker_bug(release: str, notify: bool = False) -> str:
+async def oar_check_cve_tracker_bug(release: str, notify: bool = False, refresh: bool = False) -> str:
     """
     Check CVE tracker bug coverage for a z-stream release.
 
     This is a READ-ONLY operation (when notify=False) - it only checks bug status.
+    Elliott find-bugs results are cached while ocp-build-data is unchanged.
 
     Args:
         release: Z-stream release version (e.g., "4.19.1")
         notify: Send notifications (default: False for read-only behavior)
+        refresh: Run elliott even if cached results are valid (default: False)
 
     Returns:
         CVE tracker bug analysis
     """
     args = [] if notify else ["--no-notify"]
+    if refresh:
+        args.append("--refresh")
     result = await invoke_oar_command_async(release, "check-cve-tracker-bug", args)
     return format_result(result)
 
@@ -13,8 +13,9 @@ logger = logging.getLogger(__name__)
 
 @click.command()
 @click.option("--notify/--no-notify", default=True, help="Send notification to release artist, default value is true")
+@click.option("--refresh", is_flag=True, default=False, help="Run elliott even if cached find-bugs results are valid")
 @click.pass_context
-def check_cve_tracker_bug(ctx, notify):
+def check_cve_tracker_bug(ctx, notify, refresh):
     """
     Check if there is any missed CVE tracker bug from both advisory and shipment data.
     Creates blocking issue in StateBox when CVE bugs are found.
@@ -31,7 +32,7 @@ def check_cve_tracker_bug(ctx, notify):
         util.log_task_status(TASK_CHECK_CVE_TRACKER_BUG, TASK_STATUS_INPROGRESS)
 
         # Check for missed CVE tracker bugs from both advisory and shipment sources
-        advisory_cve_bugs, shipment_cve_bugs = cve_operator.check_cve_tracker_bugs()
+        advisory_cve_bugs, shipment_cve_bugs = cve_operator.check_cve_tracker_bugs(refresh=refresh)
         all_cve_bugs = advisory_cve_bugs + shipment_cve_bugs
 
         if len(all_cve_bugs):
@@ -70,7 +70,7 @@ def create_test_report(ctx):
 
         # Send notification for new StateBox creation
         try:
-            nm = NotificationManager(cs)
+            nm = NotificationManager(cs, async_dispatch=True)
             nm.share_new_statebox(statebox_url, cs.release)
             logger.info(f"Sent notification for StateBox creation: {statebox_url}")
         except Exception as e:
@@ -43,7 +43,7 @@ def drop_bugs(ctx):
         approved_doc_ads, approved_prodsec_ads = operator._am.get_doc_prodsec_approved_ads()
         dropped_bugs = operator.drop_bugs()
         # check if all bugs are verified
-        nm = NotificationManager(cs)
+        nm = NotificationManager(cs, async_dispatch=True)
         requested_doc_ads = []
         requested_prodsec_ads = []
         if len(dropped_bugs):
@@ -10,8 +10,10 @@ logger = logging.getLogger(__name__)
 
 
 @click.command()
+@click.option("--watch", is_flag=True, default=False,
+              help="Keep polling push jobs and trigger blocked ones until all are completed, default value is false")
 @click.pass_context
-def push_to_cdn_staging(ctx):
+def push_to_cdn_staging(ctx, watch):
     """
     Trigger push job for cdn stage targets
     """
@@ -25,7 +27,7 @@ def push_to_cdn_staging(ctx):
         am = AdvisoryManager(cs)
         # trigger push job for cdn stage targets
         # only mark the task to pass when all jobs are completed
-        all_jobs_completed = am.push_to_cdn_staging()
+        all_jobs_completed = am.push_to_cdn_staging(watch=watch)
         if all_jobs_completed:
             # Log pass status for cli_result_callback parsing
             util.log_task_status(TASK_PUSH_TO_CDN_STAGING, TASK_STATUS_PASS)
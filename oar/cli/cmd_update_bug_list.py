@@ -50,17 +50,17 @@ def update_bug_list(ctx, notify, confirm_droppable, notify_managers):
             if confirm_droppable:
                 high_severity_issues, _ = JiraManager(cs).get_high_severity_and_can_drop_issues(jira_issues)
                 if len(high_severity_issues):
-                    NotificationManager(cs).share_high_severity_bugs(high_severity_issues)
+                    NotificationManager(cs, async_dispatch=True).share_high_severity_bugs(high_severity_issues)
                 else:
                     logger.info("No high severity issues found.")
             elif notify_managers:
                 unverified_cve_issues = JiraManager(cs).get_unverified_cve_issues(jira_issues)
                 if len(unverified_cve_issues):
-                    NotificationManager(cs).share_unverified_cve_issues_to_managers(unverified_cve_issues)
+                    NotificationManager(cs, async_dispatch=True).share_unverified_cve_issues_to_managers(unverified_cve_issues)
                 else:
                     logger.info("No unverified CVE issues found.")
             else:
-                NotificationManager(cs).share_bugs_to_be_verified(jira_issues)
+                NotificationManager(cs, async_dispatch=True).share_bugs_to_be_verified(jira_issues)
         # check if all bugs are verified
         if report.are_all_bugs_verified():
             # Log pass status for cli_result_callback parsing
@@ -1,20 +1,64 @@
 import json
 import logging
 import re
-import subprocess
+import threading
+import time
 import koji
+import requests
 import urllib3
 import oar.core.util as util
 from oar.core.configstore import ConfigStore
 from oar.core.const import *
-from oar.core.exceptions import AdvisoryException
+from oar.core.elliott import find_cve_bugs
+from oar.core.exceptions import AdvisoryException, ElliottException
 from oar.core.jira import JiraManager
+from oar.core.pyxis_cache import PyxisCache, get_freshness_grades_ttl
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from dateutil import parser
+from requests.adapters import HTTPAdapter
+from requests_gssapi import HTTPSPNEGOAuth
 from errata_tool import Erratum, ErrataException, security
 
 logger = logging.getLogger(__name__)
 
+# max number of advisories loaded from errata tool concurrently
+ADVISORY_MAX_WORKERS = 8
+PYXIS_API_URL = "https://pyxis.engineering.redhat.com/v1"
+# max number of NVRs in one pyxis multi-NVR filter
+PYXIS_NVR_BATCH_SIZE = 50
+PYXIS_PAGE_SIZE = 500
+# max number of concurrent pyxis requests of single NVR
+PYXIS_MAX_WORKERS = 8
+# first and max interval between polls of push job status in watch mode
+CDN_PUSH_POLL_INTERVAL = 30
+CDN_PUSH_MAX_POLL_INTERVAL = 5 * 60
+# watch mode gives up when push jobs are not completed in this period
+CDN_PUSH_WATCH_TIMEOUT = 3 * 60 * 60
+# max number of times failed push jobs of one advisory are triggered again in one invocation
+CDN_PUSH_MAX_RETRIES = 2
+
+_pyxis_session = None
+_pyxis_session_lock = threading.Lock()
+
+
+def get_pyxis_session() -> requests.Session:
+    """Get the shared Kerberos session with pooled connections for Pyxis build grade requests
+
+    Errata tool connector sends every request with module level requests.get, so connections are not reused
+
+    Returns:
+        requests.Session: Session authenticated with SPNEGO
+    """
+    global _pyxis_session
+    with _pyxis_session_lock:
+        if _pyxis_session is None:
+            session = requests.Session()
+            session.auth = HTTPSPNEGOAuth()
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=PYXIS_MAX_WORKERS))
+            _pyxis_session = session
+        return _pyxis_session
+
 
 class AdvisoryManager:
     """
@@ -24,22 +68,91 @@ class AdvisoryManager:
 
     def __init__(self, cs: ConfigStore):
         self._cs = cs
+        self._advisories = None
+        self._advisories_lock = threading.Lock()
 
-    def get_advisories(self):
+    def get_advisories(self, refresh: bool = False):
         """
         Get all advisories
 
+        Advisories are loaded concurrently on first call and memoized in this manager,
+        later calls return the same advisory wrappers until refresh is requested
+
+        Args:
+            refresh (bool, optional): reload advisories from errata tool. Defaults to False.
+
         Returns:
             list[Advisory]: all advisory wrappers
         """
-        ads = []
-        for k, v in self._cs.get_advisories().items():
-            # in errata flow, handle all advisories except MICROSHIFT and DROPPED_NO_SHIP
-            if k != AD_IMPETUS_MICROSHIFT:
-                ad = Advisory(errata_id=v, impetus=k)
-                if ad.errata_state != AD_STATUS_DROPPED_NO_SHIP:
-                    ads.append(ad)
-        return ads
+        with self._advisories_lock:
+            if self._advisories is None or refresh:
+                self._advisories = self._load_advisories()
+            return list(self._advisories)
+
+    def _load_advisories(self):
+        """
+        Load advisories of release concurrently
+
+        Returns:
+            list[Advisory]: advisory wrappers in the order of config store, dropped advisories are excluded
+        """
+        # in errata flow, handle all advisories except MICROSHIFT and DROPPED_NO_SHIP
+        impetus_ads = [(k, v) for k, v in self._cs.get_advisories().items() if k != AD_IMPETUS_MICROSHIFT]
+        if not impetus_ads:
+            return []
+
+        def load(impetus_ad):
+            impetus, errata_id = impetus_ad
+            start = time.perf_counter()
+            ad = Advisory(errata_id=errata_id, impetus=impetus)
+            logger.debug(f"advisory {errata_id} ({impetus}) is loaded in {time.perf_counter() - start:.2f}s")
+            return ad
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=min(ADVISORY_MAX_WORKERS, len(impetus_ads))) as executor:
+            ads = list(executor.map(load, impetus_ads))
+        logger.info(f"{len(ads)} advisories are loaded in {time.perf_counter() - start:.2f}s")
+
+        return [ad for ad in ads if ad.errata_state != AD_STATUS_DROPPED_NO_SHIP]
+
+    def map_advisories(self, func, ads=None, max_workers=ADVISORY_MAX_WORKERS):
+        """
+        Run a per-advisory function concurrently in a bounded thread pool
+
+        Args:
+            func (Callable[[Advisory], Any]): function called with each advisory
+            ads (list[Advisory], optional): advisories to visit. Defaults to all advisories.
+            max_workers (int, optional): max number of concurrent calls. Defaults to ADVISORY_MAX_WORKERS.
+
+        Raises:
+            AdvisoryException: if the function failed for any advisory, all the failures are logged
+
+        Returns:
+            list: results in the order of advisories
+        """
+        if ads is None:
+            ads = self.get_advisories()
+        if not ads:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(ads))) as executor:
+            futures = [executor.submit(func, ad) for ad in ads]
+
+        results = []
+        errors = []
+        for ad, future in zip(ads, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.error(f"advisory {ad.errata_id} check failed: {e}")
+                errors.append((ad.errata_id, e))
+
+        if errors:
+            raise AdvisoryException(
+                f"check failed for advisories {[errata_id for errata_id, _ in errors]}"
+            ) from errors[0][1]
+
+        return results
 
     def get_jira_issues(self):
         """
@@ -72,19 +185,21 @@ class AdvisoryManager:
         updated_ads = []
         abnormal_ads = []
         try:
-            for ad in self.get_advisories():
-                # check advisory status, if it is not QE, log warn message
-                # if the advisory is released, the state is like [REP_PREP/SHIPPED LIVE], it is not [QE], we should not send alert to ART
-                # only check if the state is [NEW_FILES]
-                if ad.errata_state == AD_STATUS_NEW_FILES:
-                    logger.warning(
-                        f"advisory state is not QE, it is {ad.errata_state}")
-                    abnormal_ads.append(ad.errata_id)
-                ad.change_qe_email(self._cs.get_owner())
-                updated_ads.append(ad.errata_id)
-        except ErrataException as e:
+            ads = self.get_advisories()
+            self.map_advisories(lambda ad: ad.change_qe_email(self._cs.get_owner()), ads)
+        except (ErrataException, AdvisoryException) as e:
             raise AdvisoryException("change advisory owner failed") from e
 
+        for ad in ads:
+            # check advisory status, if it is not QE, log warn message
+            # if the advisory is released, the state is like [REP_PREP/SHIPPED LIVE], it is not [QE], we should not send alert to ART
+            # only check if the state is [NEW_FILES]
+            if ad.errata_state == AD_STATUS_NEW_FILES:
+                logger.warning(
+                    f"advisory state is not QE, it is {ad.errata_state}")
+                abnormal_ads.append(ad.errata_id)
+            updated_ads.append(ad.errata_id)
+
         return updated_ads, abnormal_ads
 
     def check_greenwave_cvp_tests(self):
@@ -102,63 +217,63 @@ class AdvisoryManager:
         valid_status = [CVP_TEST_STATUS_PASSED, CVP_TEST_STATUS_WAIVED]
         try:
             ads = self.get_advisories()
-            for ad in ads:
+            logger.info(
+                f"checking Greenwave CVP test for advisories {[ad.errata_id for ad in ads]} ..."
+            )
+            ads_tests = self.map_advisories(lambda ad: ad.get_greenwave_cvp_tests(), ads)
+        except (ErrataException, AdvisoryException) as e:
+            raise AdvisoryException("Get greenwave cvp test failed") from e
+
+        for ad, tests in zip(ads, ads_tests):
+            all_passed = True
+            if len(tests):
+                for t in tests:
+                    status = t["attributes"]["status"]
+                    logger.info(
+                        f"Greenwave CVP test {t['id']} status is {status}")
+                    if status not in valid_status:
+                        all_passed = False
+                        logger.error(
+                            f"Greenwave CVP test {t['id']} status is not {valid_status}"
+                        )
+                        abnormal_tests.append(t)
                 logger.info(
-                    f"checking Greenwave CVP test for advisory {ad.errata_id} ..."
+                    f"Greenwave CVP tests in advisory {ad.errata_id} are {'all' if all_passed else 'not all'} passed"
+                )
+            else:
+                logger.info(
+                    f"advisory {ad.errata_id} does not have Greenwave CVP tests"
                 )
-                tests = ad.get_greenwave_cvp_tests()
-                all_passed = True
-                if len(tests):
-                    for t in tests:
-                        status = t["attributes"]["status"]
-                        logger.info(
-                            f"Greenwave CVP test {t['id']} status is {status}")
-                        if status not in valid_status:
-                            all_passed = False
-                            logger.error(
-                                f"Greenwave CVP test {t['id']} status is not {valid_status}"
-                            )
-                            abnormal_tests.append(t)
-                    logger.info(
-                        f"Greenwave CVP tests in advisory {ad.errata_id} are {'all' if all_passed else 'not all'} passed"
-                    )
-                else:
-                    logger.info(
-                        f"advisory {ad.errata_id} does not have Greenwave CVP tests"
-                    )
-        except ErrataException as e:
-            raise AdvisoryException("Get greenwave cvp test failed") from e
 
         if len(abnormal_tests):
             logger.error(f"NOT all Greenwave CVP tests are passed")
 
         return abnormal_tests
 
-    def push_to_cdn_staging(self):
+    def push_to_cdn_staging(self, watch=False, timeout=CDN_PUSH_WATCH_TIMEOUT):
         """
         Trigger push job for stage, if job is triggered, check the result
 
+        Args:
+            watch (bool, optional): keep polling and triggering push jobs until all are completed. Defaults to False.
+            timeout (int, optional): max seconds to watch push jobs. Defaults to CDN_PUSH_WATCH_TIMEOUT.
+
         Raises:
             AdvisoryException: error when communicate with errata
 
         Returns:
-            bool: job is triggered or not
+            bool: all push jobs are completed or not
         """
 
         # check if all push jobs are completed, if not, trigger new push job with default value [stage]
         # request with default value will not redo any push which has already successfully completed since the last respin of the advisory. It will redo failed pushes
 
-        triggered_ads = []
         try:
-            ads = self.get_advisories()
-            for ad in ads:
-                if (ad.push_to_cdn()):
-                    triggered_ads.append(ad.errata_id)
+            orchestrator = CdnPushOrchestrator(self.get_advisories())
+            return orchestrator.run(watch=watch, timeout=timeout)
         except Exception as e:
             raise AdvisoryException("push to cdn failed") from e
 
-        return len(triggered_ads) == len(ads)
-
     def change_advisory_status(self, target_status=AD_STATUS_REL_PREP):
         """
         Change advisories status, e.g. REL_PREP
@@ -170,7 +285,8 @@ class AdvisoryManager:
             AdvisoryException: error when update advisory status
         """
         try:
-            ads = self.get_advisories()
+            # state transition depends on current state, reload advisories
+            ads = self.get_advisories(refresh=True)
             for ad in ads:
                 if target_status == AD_STATUS_REL_PREP and ad.get_state() != AD_STATUS_QE:
                     logger.warning(
@@ -221,45 +337,32 @@ class AdvisoryManager:
 
         return all_dropped_bugs
 
-    def check_cve_tracker_bug(self):
+    def check_cve_tracker_bug(self, refresh: bool = False):
         """
         Call elliott cmd to check if any new CVE tracker bug found
 
+        Args:
+            refresh (bool, optional): run elliott even if cached result is valid. Defaults to False.
+
         Raises:
             AdvisoryException: error when invoke elliott cmd
 
         Returns:
             list: CVE tracker bugs not found in RHSA advisories
         """
-        cmd = [
-            "elliott",
-            "--data-path",
-            "https://github.com/openshift-eng/ocp-build-data.git",
-            "--group",
-            f"openshift-{util.get_y_release(self._cs.release)}",
-            "--assembly",
-            util.get_release_key(self._cs.release),
-            "--build-system",
-            "brew",
-            "find-bugs",
-            "--cve-only",
-            "--output",
-            "json",
-            "--permissive"
-        ]
-
-        logger.debug(f"elliott cmd {cmd}")
-
-        p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=util.get_elliott_env())
-        stdout, stderr = p.communicate()
-        if p.returncode != 0:
-            raise AdvisoryException(f"elliott cmd error:\n {stderr}")
+        try:
+            json_obj = find_cve_bugs(
+                f"openshift-{util.get_y_release(self._cs.release)}",
+                util.get_release_key(self._cs.release),
+                "brew",
+                ["--output", "json", "--permissive"],
+                refresh=refresh,
+            )
+        except ElliottException as e:
+            raise AdvisoryException(str(e)) from e
 
         cve_tracker_bugs = []
-        result = stdout.decode("utf-8")
-        if result:
-            logger.debug(result)
-            json_obj = json.loads(result)
+        if json_obj:
             # OCPERT-66 double check if the bug is already attached on advisory
             # get all jira issues from RHSA advisories
             rhsa_ads = [ad for ad in self.get_advisories() if ad.is_rhsa()]
@@ -282,14 +385,12 @@ class AdvisoryManager:
         Get Docs and product security approved advisories
         """
         try:
-            approved_doc_ads = []
-            approved_prodsec_ads = []
             ads = self.get_advisories()
-            for ad in ads:
-                if ad.is_doc_approved():
-                    approved_doc_ads.append(ad)
-                if ad.errata_type == "RHSA" and ad.is_prodsec_approved():
-                    approved_prodsec_ads.append(ad)
+            approvals = self.map_advisories(
+                lambda ad: (ad.is_doc_approved(), ad.errata_type == "RHSA" and ad.is_prodsec_approved()), ads
+            )
+            approved_doc_ads = [ad for ad, (doc_approved, _) in zip(ads, approvals) if doc_approved]
+            approved_prodsec_ads = [ad for ad, (_, prodsec_approved) in zip(ads, approvals) if prodsec_approved]
             return approved_doc_ads, approved_prodsec_ads
         except Exception as e:
             raise AdvisoryException(
@@ -305,18 +406,23 @@ class AdvisoryManager:
         """
         unhealthy_advisories = []
 
-        for ad in self.get_advisories():
+        def check_grades(ad):
+            if ad.impetus == AD_IMPETUS_RPM:
+                return None, []
+            ad_grade = ad.get_overall_grade()
+            unhealthy_builds = [] if util.is_grade_healthy(ad_grade) else ad.get_unhealthy_builds()
+            return ad_grade, unhealthy_builds
+
+        ads = self.get_advisories()
+        for ad, (ad_grade, unhealthy_builds) in zip(ads, self.map_advisories(check_grades, ads)):
             if ad.impetus == AD_IMPETUS_RPM:
                 logger.info(
                     f"skipping RPM advisory - {ad.errata_id}, it has no container")
                 continue
 
-            ad_grade = ad.get_overall_grade()
-
             if not util.is_grade_healthy(ad_grade):
                 logger.error(
                     f"advisory {ad.errata_id} is unhealthy, overall grade is {ad_grade}")
-                unhealthy_builds = ad.get_unhealthy_builds()
                 unhealthy_advisories.append(
                     {"errata_id": ad.errata_id, "ad_grade": ad_grade, "unhealthy_builds": unhealthy_builds})
 
@@ -339,14 +445,198 @@ class AdvisoryManager:
         jm = JiraManager(self._cs)
         has_finished_all_advisories_jiras = True
 
-        for ad in self.get_advisories():
-            for jira_key in ad.jira_issues:
-                if not jm.get_issue(jira_key).is_finished():
-                    logger.warning(f"Advisory {ad.errata_id} has unfinished jira {jira_key}")
-                    has_finished_all_advisories_jiras = False
+        ads = self.get_advisories()
+        unfinished = self.map_advisories(
+            lambda ad: [key for key in ad.jira_issues if not jm.get_issue(key).is_finished()], ads
+        )
+        for ad, jira_keys in zip(ads, unfinished):
+            for jira_key in jira_keys:
+                logger.warning(f"Advisory {ad.errata_id} has unfinished jira {jira_key}")
+                has_finished_all_advisories_jiras = False
 
         return has_finished_all_advisories_jiras
 
+class CdnPushOrchestrator:
+    """
+    Orchestrate CDN push jobs of advisories and their blocking advisories
+
+    The blocking advisory graph is resolved once and push jobs are triggered in topological order,
+    i.e. push job of an advisory is triggered only when push jobs of all its blocking advisories are completed.
+    Push job status is cached by each advisory, only status of unfinished advisories is refreshed on poll.
+    """
+
+    def __init__(self, ads, target="stage", poll_interval=CDN_PUSH_POLL_INTERVAL,
+                 max_poll_interval=CDN_PUSH_MAX_POLL_INTERVAL, max_retries=CDN_PUSH_MAX_RETRIES):
+        """
+        Args:
+            ads (list[Advisory]): advisories to push
+            target (str, optional): push target, stage or live. Defaults to "stage".
+            poll_interval (int, optional): first interval in seconds between polls. Defaults to CDN_PUSH_POLL_INTERVAL.
+            max_poll_interval (int, optional): max interval in seconds between polls. Defaults to CDN_PUSH_MAX_POLL_INTERVAL.
+            max_retries (int, optional): max number of times failed push jobs are triggered again. Defaults to CDN_PUSH_MAX_RETRIES.
+        """
+        self.target = target
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.max_retries = max_retries
+        self._ads = {ad.errata_id: ad for ad in ads}
+        # errata id -> ids of blocking advisories
+        self._blocking = None
+        self._order = None
+        self._completed = set()
+        self._retries = {}
+        self._triggered = 0
+
+    def resolve(self):
+        """
+        Resolve the blocking advisory graph, blocking advisories not in the release are loaded once
+
+        Raises:
+            AdvisoryException: circular dependency found between advisories
+
+        Returns:
+            list[int]: errata ids in topological order, blocking advisories come first
+        """
+        if self._order is not None:
+            return self._order
+
+        blocking = {}
+        pending = list(self._ads)
+        while pending:
+            errata_id = pending.pop(0)
+            if errata_id in blocking:
+                continue
+            blocking_ids = list(dict.fromkeys(self._ads[errata_id].get_erratum_data()["blocking_advisories"]))
+            if blocking_ids:
+                logger.info(f"advisory {errata_id} has blocking advisory {blocking_ids}")
+            blocking[errata_id] = blocking_ids
+            for blocking_id in blocking_ids:
+                if blocking_id not in self._ads:
+                    self._ads[blocking_id] = Advisory(errata_id=blocking_id)
+                pending.append(blocking_id)
+
+        dependents = {errata_id: [] for errata_id in blocking}
+        in_degree = {}
+        for errata_id, blocking_ids in blocking.items():
+            in_degree[errata_id] = len(blocking_ids)
+            for blocking_id in blocking_ids:
+                dependents[blocking_id].append(errata_id)
+
+        order = []
+        ready = [errata_id for errata_id, degree in in_degree.items() if degree == 0]
+        while ready:
+            errata_id = ready.pop(0)
+            order.append(errata_id)
+            for dependent in dependents[errata_id]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) != len(blocking):
+            raise AdvisoryException(
+                f"circular dependency found between advisories {sorted(set(blocking) - set(order))}")
+
+        self._blocking = blocking
+        self._order = order
+        return order
+
+    def step(self):
+        """
+        Check cached push job status of all advisories and trigger push jobs which are ready
+
+        if all push jobs of an advisory are completed, it is done
+        if any push job is running and there is no failed job, wait for it
+        if no jobs are triggered or there is any failed job found (retry), trigger the push job when blocking advisories are completed
+
+        Raises:
+            AdvisoryException: push jobs of an advisory are still failed after max retries
+
+        Returns:
+            bool: all push jobs are completed or not
+        """
+        for errata_id in self.resolve():
+            if errata_id in self._completed:
+                continue
+            ad = self._ads[errata_id]
+            if ad.are_push_jobs_completed():
+                self._completed.add(errata_id)
+                continue
+            if ad.are_push_jobs_running() and not ad.has_failed_push_job():
+                continue
+            waiting = [b for b in self._blocking[errata_id] if b not in self._completed]
+            if waiting:
+                logger.warning(
+                    f"push jobs of blocking advisories {waiting} are not completed yet, will not trigger push job for {errata_id}")
+                continue
+            self._trigger(ad)
+
+        return len(self._completed) == len(self._order)
+
+    def _trigger(self, ad):
+        if ad.has_failed_push_job():
+            retries = self._retries.get(ad.errata_id, 0)
+            if retries >= self.max_retries:
+                raise AdvisoryException(
+                    f"push job for advisory {ad.errata_id} is still failed after {retries} retries")
+            self._retries[ad.errata_id] = retries + 1
+
+        if self.target in ["stage", "live"]:
+            ad.push(target=self.target)
+        else:
+            ad.push()
+        # drop cached status, new jobs are fetched on next poll
+        ad.push_job_status = {}
+        ad.no_push_job = False
+        self._triggered += 1
+        logger.info(f"push job for advisory {ad.errata_id} is triggered")
+
+    def refresh(self):
+        """
+        Refresh push job status of unfinished advisories concurrently
+        """
+        ads = [self._ads[errata_id] for errata_id in self.resolve() if errata_id not in self._completed]
+        if not ads:
+            return
+        with ThreadPoolExecutor(max_workers=min(ADVISORY_MAX_WORKERS, len(ads))) as executor:
+            list(executor.map(lambda ad: ad.refresh_push_job_status(), ads))
+
+    def run(self, watch=False, timeout=CDN_PUSH_WATCH_TIMEOUT):
+        """
+        Trigger push jobs, in watch mode poll push jobs with backoff until all are completed
+
+        Args:
+            watch (bool, optional): keep polling until all push jobs are completed. Defaults to False.
+            timeout (int, optional): max seconds to watch push jobs. Defaults to CDN_PUSH_WATCH_TIMEOUT.
+
+        Raises:
+            AdvisoryException: error found when resolving or triggering push jobs
+
+        Returns:
+            bool: all push jobs are completed or not
+        """
+        start = time.monotonic()
+        interval = self.poll_interval
+        while True:
+            triggered = self._triggered
+            if self.step():
+                logger.info(f"all push jobs of advisories {self._order} are completed")
+                return True
+            if not watch:
+                return False
+            # poll again soon after new jobs are triggered, otherwise back off
+            if self._triggered > triggered:
+                interval = self.poll_interval
+            elapsed = time.monotonic() - start
+            if elapsed + interval > timeout:
+                logger.warning(f"push jobs are not completed in {timeout}s, advisories done: {sorted(self._completed)}")
+                return False
+            logger.info(
+                f"push jobs of {len(self._order) - len(self._completed)} advisories are not completed, checking again in {interval}s")
+            time.sleep(interval)
+            interval = min(interval * 2, self.max_poll_interval)
+            self.refresh()
+
+
 class Advisory(Erratum):
     """
     Wrapper class of Erratum, add more functionalities and properties
@@ -420,46 +710,6 @@ class Advisory(Erratum):
         """
         return self.externalTests(test_type="greenwave_cvp")
 
-    def push_to_cdn(self, target="stage"):
-        """
-        Trigger push job with default target. e.g. stage or live
-
-        if all push jobs are completed, return true
-        if any push job is running and there is no failed job, return false. i.e. action is in progress
-        if no jobs are triggered or there is any failed job found (retry), trigger the push job with target [stage]
-        if any blocking advisory found, trigger push job for it
-        if all the blocking jobs are completed, trigger push job for current advisory
-
-        """
-
-        if self.are_push_jobs_completed():
-            return True
-        elif self.are_push_jobs_running() and not self.has_failed_push_job():
-            return False
-        else:
-            # logic to trigger jobs for blocking advisories
-            if self.has_dependency():
-                blocking_ads = self.get_blocking_advisories()
-                for ad in blocking_ads:
-                    ad.push_to_cdn()
-                blocking_jobs_completed = True
-                for ad in blocking_ads:
-                    if ad.are_push_jobs_running():
-                        blocking_jobs_completed = False
-                        logger.warning(
-                            f"push jobs of blocking advisory {ad.errata_id} are not completed yet, will not trigger push job for {self.errata_id}, please try again later")
-                if not blocking_jobs_completed:
-                    return False
-            # logic to trigger jobs for current advisory
-            if target and target in ["stage", "live"]:
-                self.push(target=target)
-            else:
-                self.push()
-
-            logger.info(f"push job for advisory {self.errata_id} is triggered")
-
-            return False
-
     def get_push_job_status(self):
         """
         Get push jobs' status
@@ -500,6 +750,14 @@ class Advisory(Erratum):
             logger.info(
                 f"push job for target <{cached_target}> is {cached_status}")
 
+    def refresh_push_job_status(self):
+        """
+        Drop cached push jobs' status and get it again
+        """
+        self.push_job_status = {}
+        self.no_push_job = False
+        self.get_push_job_status()
+
     def are_push_jobs_completed(self):
         """
         Check all push jobs status for different types  e.g. cdn_stage, cdn_docker_stage etc.
@@ -688,12 +946,13 @@ class Advisory(Erratum):
         """
         unhealthy_builds = []
 
-        for product_version in self.errata_builds:
-            for nvr in self.errata_builds[product_version]:
-                build_grades = self.get_build_grades(nvr)
-                for bg in build_grades:
-                    if not util.is_grade_healthy(bg["grade"]):
-                        unhealthy_builds.append(bg)
+        nvrs = list(dict.fromkeys(
+            nvr for product_version in self.errata_builds for nvr in self.errata_builds[product_version]))
+        builds_grades = self.get_builds_grades(nvrs)
+        for nvr in nvrs:
+            for bg in builds_grades[nvr]:
+                if not util.is_grade_healthy(bg["grade"]):
+                    unhealthy_builds.append(bg)
 
         return unhealthy_builds
 
@@ -704,37 +963,161 @@ class Advisory(Erratum):
         Returns:
             list: All architecture grades of build {nvr, architecture, grade}.
         """
-        nvr_url = "https://pyxis.engineering.redhat.com/v1/images/nvr/%s?include=data.freshness_grades&include=data.architecture" % nvr
-        resp = self._get(nvr_url, raw=True)
-        nvr_grades = []
+        return self.get_builds_grades([nvr])[nvr]
 
-        if resp.ok:
-            for arch in resp.json()["data"]:
-                effective_grade = None
-                for fg in arch["freshness_grades"]:
-                    checked_grade = fg["grade"]
-                    start_date = parser.parse(fg["start_date"])
+    def get_builds_grades(self, nvrs):
+        """
+        Get all architecture grades of builds.
 
-                    # skip if checked grade is not effective yet
-                    if start_date > datetime.now(timezone.utc):
-                        continue
+        Freshness grades are read from the Pyxis cache, stale ones are refreshed in background.
+        Builds not cached are queried from Pyxis in batches with multi-NVR filter, builds not found in batch result
+        are queried one by one concurrently.
 
-                    # skip if checked grade is no longer effective
-                    if "end_date" in fg and parser.parse(fg["end_date"]) < datetime.now(timezone.utc):
-                        continue
+        Args:
+            nvrs (list[str]): build NVRs
 
-                    # skip if checked grade is smaller than current effective grade (if intervals are overlapping, bigger grade is taken)
-                    if effective_grade and checked_grade < effective_grade:
-                        continue
+        Raises:
+            AdvisoryException: error when accessing build nvr
 
-                    # save new effective grade
-                    effective_grade = checked_grade
+        Returns:
+            dict: All architecture grades of build {nvr, architecture, grade} by NVR.
+        """
+        def fetch(keys):
+            start = time.perf_counter()
+            queried, not_found = self._fetch_builds_freshness([key.split(":", 1)[1] for key in keys])
+            logger.info(
+                f"grades of {len(keys)} builds are retrieved from pyxis in {time.perf_counter() - start:.2f}s, "
+                f"{len(not_found)} queried by nvr")
+            return self._to_freshness_cache_entries(queried)
 
-                nvr_grades.append(
-                    {"nvr": nvr, "arch": arch["architecture"], "grade": effective_grade})
-        else:
+        builds_freshness = {
+            key.split(":", 1)[1]: value
+            for key, value in PyxisCache.get_instance().get_many([f"build:{nvr}" for nvr in nvrs], fetch).items()
+        }
+
+        now = datetime.now(timezone.utc)
+        return {
+            nvr: [
+                {"nvr": nvr, "arch": arch["arch"], "grade": self._get_effective_grade(arch["freshness_grades"], now)}
+                for arch in freshness
+            ]
+            for nvr, freshness in builds_freshness.items()
+        }
+
+    def _fetch_builds_freshness(self, nvrs):
+        """
+        Query freshness grades of builds in batches, builds not found in batch result are queried by NVR concurrently
+
+        Args:
+            nvrs (list[str]): build NVRs
+
+        Raises:
+            AdvisoryException: error when accessing build nvr
+
+        Returns:
+            tuple[dict, list]: architecture freshness grades {arch, freshness_grades} by NVR, NVRs queried one by one
+        """
+        queried = {}
+        for i in range(0, len(nvrs), PYXIS_NVR_BATCH_SIZE):
+            queried.update(self._query_builds_freshness(nvrs[i:i + PYXIS_NVR_BATCH_SIZE]))
+
+        not_found = [nvr for nvr in nvrs if nvr not in queried]
+        if not_found:
+            with ThreadPoolExecutor(max_workers=min(PYXIS_MAX_WORKERS, len(not_found))) as executor:
+                queried.update(zip(not_found, executor.map(self._query_build_freshness, not_found)))
+
+        return queried, not_found
+
+    @staticmethod
+    def _to_freshness_cache_entries(builds_freshness):
+        return {
+            f"build:{nvr}": (freshness, min(
+                (get_freshness_grades_ttl(arch["freshness_grades"]) for arch in freshness),
+                default=get_freshness_grades_ttl([])
+            ))
+            for nvr, freshness in builds_freshness.items()
+        }
+
+    def _query_build_freshness(self, nvr):
+        """
+        Query all architecture freshness grades of build by NVR.
+
+        Raises:
+            AdvisoryException: error when accessing build nvr
+
+        Returns:
+            list: All architecture freshness grades of build {arch, freshness_grades}.
+        """
+        nvr_url = f"{PYXIS_API_URL}/images/nvr/{nvr}?include=data.freshness_grades&include=data.architecture"
+        resp = get_pyxis_session().get(nvr_url, verify=self.ssl_verify)
+
+        if not resp.ok:
             raise AdvisoryException(f"error when accessing build nvr - {nvr}")
-        return nvr_grades
+
+        return [
+            {"arch": arch["architecture"], "freshness_grades": arch["freshness_grades"]}
+            for arch in resp.json()["data"]
+        ]
+
+    def _query_builds_freshness(self, nvrs):
+        """
+        Query all architecture freshness grades of builds with multi-NVR filter.
+
+        Args:
+            nvrs (list[str]): build NVRs
+
+        Returns:
+            dict: All architecture freshness grades of build by NVR, builds not found or failed query are not included.
+        """
+        builds_freshness = {}
+        wanted = set(nvrs)
+        page = 0
+        while True:
+            url = (
+                f"{PYXIS_API_URL}/images?filter=brew.build=in=({','.join(nvrs)})"
+                f"&include=data.brew.build&include=data.freshness_grades&include=data.architecture"
+                f"&include=total&page_size={PYXIS_PAGE_SIZE}&page={page}"
+            )
+            resp = get_pyxis_session().get(url, verify=self.ssl_verify)
+            if not resp.ok:
+                logger.warning(f"cannot query grades of {len(nvrs)} builds from pyxis, status code: {resp.status_code}")
+                return {}
+
+            result = resp.json()
+            for arch in result.get("data", []):
+                nvr = arch.get("brew", {}).get("build")
+                if nvr in wanted:
+                    builds_freshness.setdefault(nvr, []).append({
+                        "arch": arch["architecture"],
+                        "freshness_grades": arch["freshness_grades"],
+                    })
+
+            page += 1
+            if page * PYXIS_PAGE_SIZE >= result.get("total", 0):
+                return builds_freshness
+
+    @staticmethod
+    def _get_effective_grade(freshness_grades, now):
+        """
+        Get effective grade from freshness grades.
+        If intervals are overlapping, bigger grade is taken.
+
+        Args:
+            freshness_grades (list): freshness grades with start_date and optional end_date
+            now (datetime): time when the grade is effective
+
+        Returns:
+            str: effective grade, None if no grade is effective
+        """
+        return max(
+            (
+                fg["grade"]
+                for fg in freshness_grades
+                if parser.parse(fg["start_date"]) <= now
+                and ("end_date" not in fg or parser.parse(fg["end_date"]) >= now)
+            ),
+            default=None,
+        )
 
     def get_overall_grade(self):
         """
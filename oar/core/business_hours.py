@@ -0,0 +1,153 @@
+import bisect
+import logging
+
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterable, List, Optional
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger(__name__)
+
+SECONDS_PER_DAY = 24 * 60 * 60
+# date.toordinal() of 0001-01-01 is 1 and the day is Monday
+FIRST_ORDINAL = 1
+
+
+class BusinessCalendar:
+    """
+    Business time calendar computing business hours between datetimes in constant time.
+
+    Business time is the wall-clock time of workdays, excluding holidays, in the calendar time zone.
+    Only sorted holiday lookups (logarithmic in the number of holidays) are needed, the computation
+    does not depend on the length of the interval.
+
+    Attributes:
+        tz (ZoneInfo): Time zone in which workdays and holidays are evaluated.
+        workdays (tuple[int, ...]): Sorted workday numbers, Monday is 0 and Sunday is 6.
+        holidays (List[int]): Sorted ordinals of holidays falling on workdays.
+    """
+
+    def __init__(self, tz: str = "UTC", holidays: Optional[Iterable[date | str]] = None, workdays: Iterable[int] = (0, 1, 2, 3, 4)):
+        """
+        Initialize the BusinessCalendar object.
+
+        Args:
+            tz (str): IANA time zone name, e.g. "UTC" or "Europe/Prague"
+            holidays (Optional[Iterable[date | str]]): Holiday dates or ISO formatted date strings
+            workdays (Iterable[int]): Workday numbers, Monday is 0 and Sunday is 6
+
+        Raises:
+            ValueError: If no workday is provided or a workday is out of range
+        """
+        self.tz = ZoneInfo(tz)
+        self.workdays = tuple(sorted(set(workdays)))
+        if not self.workdays or any(d < 0 or d > 6 for d in self.workdays):
+            raise ValueError(f"Invalid workdays: {workdays}")
+
+        ordinals = set()
+        for holiday in holidays or []:
+            holiday_date = date.fromisoformat(holiday) if isinstance(holiday, str) else holiday
+            if holiday_date.weekday() in self.workdays:
+                ordinals.add(holiday_date.toordinal())
+        self.holidays: List[int] = sorted(ordinals)
+        self._holiday_set = set(self.holidays)
+
+    def _workdays_before(self, ordinal: int) -> int:
+        """
+        Count workdays, including holidays, before the given date ordinal.
+        """
+        full_weeks, remainder = divmod(ordinal - FIRST_ORDINAL, 7)
+        return full_weeks * len(self.workdays) + bisect.bisect_left(self.workdays, remainder)
+
+    def _business_days_before(self, ordinal: int) -> int:
+        """
+        Count business days, excluding holidays, before the given date ordinal.
+        """
+        return self._workdays_before(ordinal) - bisect.bisect_left(self.holidays, ordinal)
+
+    def _workday_ordinal(self, n: int) -> int:
+        """
+        Return the ordinal of the workday with exactly n workdays before it.
+        """
+        full_weeks, remainder = divmod(n, len(self.workdays))
+        return FIRST_ORDINAL + full_weeks * 7 + self.workdays[remainder]
+
+    def _business_day_ordinal(self, n: int) -> int:
+        """
+        Return the ordinal of the business day with exactly n business days before it.
+        Iterates only over holidays in the skipped range.
+        """
+        m = n
+        while True:
+            ordinal = self._workday_ordinal(m)
+            business_days_before = m - bisect.bisect_left(self.holidays, ordinal)
+            if business_days_before < n:
+                m += n - business_days_before
+            elif ordinal in self._holiday_set:
+                m += 1
+            else:
+                return ordinal
+
+    def is_business_day(self, day: date) -> bool:
+        """
+        Check if the date is a workday and not a holiday.
+
+        Args:
+            day (date): The date to check
+
+        Returns:
+            bool: True if the date is a business day, False otherwise
+        """
+        return day.weekday() in self.workdays and day.toordinal() not in self._holiday_set
+
+    def _to_local(self, dt: datetime) -> datetime:
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.astimezone(self.tz)
+
+    def _business_seconds_since_epoch(self, dt: datetime) -> float:
+        """
+        Business seconds between 0001-01-01 and the datetime in the calendar time zone.
+        """
+        local = self._to_local(dt)
+        day = local.date()
+        seconds = self._business_days_before(day.toordinal()) * SECONDS_PER_DAY
+        if self.is_business_day(day):
+            seconds += (local.replace(tzinfo=None) - datetime.combine(day, time())).total_seconds()
+        return seconds
+
+    def business_hours_between(self, start: datetime, end: datetime) -> float:
+        """
+        Compute business hours between two datetimes. Naive datetimes are considered UTC.
+
+        Args:
+            start (datetime): The start datetime
+            end (datetime): The end datetime
+
+        Returns:
+            float: Business hours between start and end, 0 if end is not after start
+        """
+        if end <= start:
+            return 0.0
+        return (self._business_seconds_since_epoch(end) - self._business_seconds_since_epoch(start)) / 3600
+
+    def add_business_hours(self, start: datetime, hours: float) -> datetime:
+        """
+        Compute the earliest datetime when the given business hours have elapsed since start.
+
+        Args:
+            start (datetime): The start datetime
+            hours (float): Business hours to add
+
+        Returns:
+            datetime: The resulting datetime in UTC
+        """
+        target = self._business_seconds_since_epoch(start) + hours * 3600
+        business_days, seconds = divmod(target, SECONDS_PER_DAY)
+        if seconds == 0 and business_days > 0:
+            # the target is reached at the end of the previous business day
+            ordinal = self._business_day_ordinal(int(business_days) - 1)
+            seconds = SECONDS_PER_DAY
+        else:
+            ordinal = self._business_day_ordinal(int(business_days))
+        local = datetime.combine(date.fromordinal(ordinal), time()) + timedelta(seconds=seconds)
+        return local.replace(tzinfo=self.tz).astimezone(timezone.utc)
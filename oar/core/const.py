@@ -37,6 +37,9 @@ LABEL_SIPPY_AUTO_RELEASE = "A27"
 LABEL_BUG_FIRST_CELL = "C8"
 LABEL_ISSUES_OTHERS_COLUMN = "H"
 LABEL_ISSUES_OTHERS_ROW = 8
+# ranges of test report loaded into TestReport snapshot, fixed header/task/link regions and bug/others table
+LABEL_REPORT_FIXED_RANGE = "A1:H40"
+LABEL_REPORT_TABLE_RANGE = "C8:H"
 ALL_TASKS = [
     LABEL_TASK_OWNERSHIP,
     LABEL_TASK_BUGS_TO_VERIFY,
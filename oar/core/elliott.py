@@ -0,0 +1,140 @@
+import json
+import logging
+import os
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import Future
+from typing import Optional
+
+from oar.core.exceptions import ElliottException
+from oar.core.json_cache import JsonFileCache
+from oar.core.util import get_elliott_env
+
+logger = logging.getLogger(__name__)
+
+OCP_BUILD_DATA_URL = "https://github.com/openshift-eng/ocp-build-data.git"
+ENV_VAR_ELLIOTT_CACHE_FILE = "OAR_ELLIOTT_CACHE_FILE"
+DEFAULT_ELLIOTT_CACHE_FILE = os.path.join(tempfile.gettempdir(), "oar_elliott_cache.json")
+# find-bugs results are reused for this period while ocp-build-data is unchanged,
+# trackers filed in Jira meanwhile are found after it
+ELLIOTT_CACHE_TTL = 60 * 60
+# timeout of resolving branch head of ocp-build-data
+LS_REMOTE_TIMEOUT = 60
+
+# cache key -> future of the running elliott invocation
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def get_build_data_commit(group: str) -> Optional[str]:
+    """
+    Get head commit of the ocp-build-data branch of the group
+
+    Args:
+        group (str): group name, e.g. openshift-4.19
+
+    Returns:
+        str: commit SHA, None if it cannot be resolved
+    """
+    try:
+        p = subprocess.run(
+            ["git", "ls-remote", OCP_BUILD_DATA_URL, f"refs/heads/{group}"],
+            capture_output=True, text=True, timeout=LS_REMOTE_TIMEOUT,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.warning(f"Failed to get ocp-build-data commit of {group}: {e}")
+        return None
+    if p.returncode != 0 or not p.stdout.strip():
+        logger.warning(f"Failed to get ocp-build-data commit of {group}: {p.stderr.strip()}")
+        return None
+    return p.stdout.split()[0]
+
+
+def find_cve_bugs(group: str, assembly: str, build_system: str, args: list[str] = None, refresh: bool = False) -> dict:
+    """
+    Run elliott find-bugs --cve-only and get parsed json output
+
+    Results are cached on disk by group, assembly, build system and ocp-build-data commit.
+    Concurrent invocations with the same key in the process wait for the running one.
+    Results are not cached when ocp-build-data commit cannot be resolved.
+
+    Args:
+        group (str): group name, e.g. openshift-4.19
+        assembly (str): assembly name, e.g. 4.19.9
+        build_system (str): brew or konflux
+        args (list[str], optional): additional find-bugs options. Defaults to json output.
+        refresh (bool, optional): ignore cached result and run elliott. Defaults to False.
+
+    Returns:
+        dict: parsed elliott output, empty if elliott prints nothing
+
+    Raises:
+        ElliottException: error when invoke elliott cmd
+    """
+    args = args if args is not None else ["--output", "json"]
+    commit = get_build_data_commit(group)
+    key = f"find-bugs:{group}:{assembly}:{build_system}:{commit}:{' '.join(args)}"
+    cache = JsonFileCache.get_instance(os.environ.get(ENV_VAR_ELLIOTT_CACHE_FILE) or DEFAULT_ELLIOTT_CACHE_FILE)
+
+    if commit and not refresh:
+        result, fresh = cache.get(key)
+        if fresh:
+            logger.info(f"Using cached elliott find-bugs result of {group} {assembly} {build_system} at {commit[:12]}")
+            return result
+
+    with _inflight_lock:
+        future = _inflight.get(key)
+        running = future is not None
+        if not running:
+            future = _inflight[key] = Future()
+    if running:
+        logger.info(f"Waiting for running elliott find-bugs of {group} {assembly} {build_system}")
+        return future.result()
+
+    try:
+        result = _run_find_cve_bugs(group, assembly, build_system, args)
+        if commit:
+            cache.put(key, result, ELLIOTT_CACHE_TTL)
+            cache.save()
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+def _run_find_cve_bugs(group: str, assembly: str, build_system: str, args: list[str]) -> dict:
+    cmd = [
+        "elliott",
+        "--data-path",
+        OCP_BUILD_DATA_URL,
+        "--group",
+        group,
+        "--assembly",
+        assembly,
+        "--build-system",
+        build_system,
+        "find-bugs",
+        "--cve-only",
+        *args,
+    ]
+
+    logger.debug(f"elliott cmd {cmd}")
+
+    p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=get_elliott_env())
+    stdout, stderr = p.communicate()
+    if p.returncode != 0:
+        raise ElliottException(f"elliott cmd error:\n {stderr}")
+
+    result = stdout.decode("utf-8")
+    if not result:
+        return {}
+    logger.debug(result)
+    try:
+        return json.loads(result)
+    except ValueError as e:
+        raise ElliottException(f"Failed to parse elliott output: {e}") from e
@@ -51,3 +51,7 @@ class StateBoxException(Exception):
 
 class ReleaseDiscoveryException(Exception):
     """Exception class to raise error in ReleaseDiscovery"""
+
+
+class ElliottException(Exception):
+    """Exception class to raise error in elliott cmd"""
@@ -1,7 +1,10 @@
+import fcntl
+import hashlib
 import logging
 import os
 import shutil
 import tempfile
+import time
 from typing import Optional
 from urllib.parse import urlparse, urlunparse
 
@@ -14,6 +17,12 @@ from oar.core.exceptions import GitException
 
 logger = logging.getLogger(__name__)
 
+ENV_VAR_GIT_MIRROR_DIR = "OAR_GIT_MIRROR_DIR"
+# bare mirrors of checked out repositories are kept here and reused by later checkouts
+DEFAULT_GIT_MIRROR_DIR = os.path.join(tempfile.gettempdir(), "oar-git-mirrors")
+# only branches are mirrored, merge request refs are not needed for checkouts
+GIT_MIRROR_REFSPEC = "+refs/heads/*:refs/heads/*"
+
 
 class GitHelper:
     """
@@ -24,11 +33,15 @@ class GitHelper:
     - Merge request creation
     
     Used primarily for automated Git operations in the release process.
+    Repositories are fetched incrementally into a persistent bare mirror,
+    checkouts are throwaway local clones of the mirror with their own (hardlinked) objects,
+    so they stay valid when the mirror is cloned again or garbage collected.
     """
 
-    def __init__(self):
+    def __init__(self, mirror_dir: str = None):
         self._temp_dir = None
         self._repo = None
+        self._mirror_dir = mirror_dir or os.environ.get(ENV_VAR_GIT_MIRROR_DIR) or DEFAULT_GIT_MIRROR_DIR
         self._check_git_config()
 
     def _sanitize_url(self, url: str) -> str:
@@ -120,13 +133,17 @@ class GitHelper:
             GitException: If clone or checkout fails
         """
 
+        mirror_path = self._update_mirror(repo_url)
         try:
             # Create temp directory under specified parent
             self._temp_dir = tempfile.mkdtemp(prefix="oar-git-", dir=temp_parent_dir)
-            logger.info(f"Cloning {repo_url} to {self._temp_dir}")
-            
-            # Clone repo
-            self._repo = Repo.clone_from(repo_url, self._temp_dir)
+            logger.info(f"Cloning {self._sanitize_url(repo_url)} to {self._temp_dir} from mirror {mirror_path}")
+
+            # Clone from local mirror, objects are hardlinked instead of copied. Not --shared, the mirror
+            # can be deleted or garbage collected while the checkout is still in use
+            self._repo = Repo.clone_from(mirror_path, self._temp_dir, no_checkout=True)
+            # Changes are pushed to the repository, not the mirror
+            self._repo.remote("origin").set_url(repo_url)
             # Checkout branch
             self._repo.git.checkout(branch)
             logger.info(f"Checked out branch {branch}")
@@ -135,6 +152,66 @@ class GitHelper:
         except GitCommandError as gce:
             raise GitException(f"Failed to clone repository: {str(gce)}") from gce
 
+    def _get_mirror_path(self, repo_url: str) -> str:
+        """
+        Get path of the bare mirror of repository, credentials in URL are not part of the path
+
+        Args:
+            repo_url: Git repository URL
+
+        Returns:
+            str: Path to the bare mirror
+        """
+        url = self._sanitize_url(repo_url).rstrip("/")
+        name = os.path.basename(url).removesuffix(".git") or "repo"
+        digest = hashlib.sha256(url.encode()).hexdigest()[:12]
+        return os.path.join(self._mirror_dir, f"{name}-{digest}.git")
+
+    def _update_mirror(self, repo_url: str) -> str:
+        """
+        Create bare mirror of repository or fetch new commits into existing one.
+        Mirror updates are serialized across processes with a file lock,
+        a mirror failing to fetch is cloned again.
+
+        Args:
+            repo_url: Git repository URL
+
+        Returns:
+            str: Path to the bare mirror
+
+        Raises:
+            GitException: If clone or fetch fails
+        """
+        mirror_path = self._get_mirror_path(repo_url)
+        sanitized_url = self._sanitize_url(repo_url)
+        os.makedirs(self._mirror_dir, exist_ok=True)
+        with open(f"{mirror_path}.lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            if os.path.isdir(mirror_path):
+                start = time.monotonic()
+                try:
+                    # URL is passed on command line so credentials are not stored in the mirror
+                    Repo(mirror_path).git.fetch("--prune", repo_url, GIT_MIRROR_REFSPEC)
+                    logger.info(f"Fetched {sanitized_url} into mirror {mirror_path} in {time.monotonic() - start:.1f}s")
+                    return mirror_path
+                except (GitCommandError, git.exc.InvalidGitRepositoryError, git.exc.NoSuchPathError) as e:
+                    logger.warning(f"Failed to fetch mirror {mirror_path}, cloning it again: {str(e)}")
+                    shutil.rmtree(mirror_path, ignore_errors=True)
+
+            start = time.monotonic()
+            tmp_path = tempfile.mkdtemp(prefix=f"{os.path.basename(mirror_path)}.", dir=self._mirror_dir)
+            try:
+                mirror = Repo.clone_from(repo_url, tmp_path, bare=True)
+                mirror.remote("origin").set_url(sanitized_url)
+                mirror.git.config("remote.origin.fetch", GIT_MIRROR_REFSPEC)
+                os.rename(tmp_path, mirror_path)
+            except GitCommandError as gce:
+                raise GitException(f"Failed to clone repository: {str(gce)}") from gce
+            finally:
+                shutil.rmtree(tmp_path, ignore_errors=True)
+            logger.info(f"Cloned {sanitized_url} into mirror {mirror_path} in {time.monotonic() - start:.1f}s")
+            return mirror_path
+
     def create_branch(self, branch_name: str) -> None:
         """
         Create and checkout new branch from current branch
@@ -237,7 +314,7 @@ class GitHelper:
             raise GitException(f"Failed to get git status: {str(gce)}") from gce
 
     def cleanup(self) -> None:
-        """Clean up temporary directory if it exists"""
+        """Clean up temporary directory if it exists, the mirror is kept for later checkouts"""
         if self._temp_dir and os.path.exists(self._temp_dir):
             try:
                 shutil.rmtree(self._temp_dir)
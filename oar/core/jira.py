@@ -71,6 +71,69 @@ class JiraManager:
 
         return JiraIssue(issue)
 
+    def get_issues(self, keys, batch_size=100):
+        """
+        Query server get jira issue objects in bulk via JQL search
+
+        Jira rejects the whole search when any key in it is not accessible or does not exist,
+        such batch is fetched again key by key. Issues which cannot be accessed due to
+        permission issue or are not found are not returned
+
+        Args:
+            keys (list[str]): JIRA issue keys
+            batch_size (int): max number of keys in one search query
+
+        Raises:
+            JiraException: error when communicate with jira server
+
+        Returns:
+            dict[str, JiraIssue]: JiraIssue objects by issue key
+        """
+        keys = list(dict.fromkeys(keys))
+        issues = {}
+        for i in range(0, len(keys), batch_size):
+            batch = keys[i:i + batch_size]
+            try:
+                for issue in self._svc.enhanced_search_issues(f"key in ({', '.join(batch)})", maxResults=0):
+                    issues[issue.key] = JiraIssue(issue)
+            except JIRAError as je:
+                logger.warning(f"search jira issues failed with status {je.status_code}, getting {len(batch)} issues one by one")
+                issues.update(self._get_accessible_issues(batch))
+
+        missing_keys = [key for key in keys if key not in issues]
+        if missing_keys:
+            logger.warning(f"Cannot get jira issues {missing_keys}, they are not accessible with current token")
+
+        return issues
+
+    def _get_accessible_issues(self, keys):
+        """
+        Get jira issues one by one, skip the ones not accessible or not found
+
+        Args:
+            keys (list[str]): JIRA issue keys
+
+        Raises:
+            JiraException: error when communicate with jira server
+
+        Returns:
+            dict[str, JiraIssue]: JiraIssue objects by issue key
+        """
+        issues = {}
+        for key in keys:
+            try:
+                issues[key] = self.get_issue(key)
+            except JiraUnauthorizedException:
+                # jira token does not have permission to access security bugs, ignore it
+                continue
+            except JiraException as e:
+                if isinstance(e.__cause__, JIRAError) and e.__cause__.status_code == 404:
+                    logger.warning(f"jira issue {key} is not found")
+                    continue
+                raise
+
+        return issues
+
     def create_issue(self, **issue_dict):
         """
         Create jira issue
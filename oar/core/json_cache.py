@@ -0,0 +1,226 @@
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# entries are fresh for this period unless another TTL is given
+JSON_CACHE_TTL = 60 * 60
+# least recently used entries are evicted above this size
+JSON_CACHE_MAX_ENTRIES = 20000
+# max number of concurrent background refreshes
+JSON_CACHE_REFRESH_WORKERS = 2
+
+
+class JsonFileCache:
+    """
+    On-disk cache of JSON serializable values with stale-while-revalidate semantics, shared in the process
+
+    Expired entries are served until max_stale while they are refreshed in background.
+    The cache is bounded by number of entries with LRU eviction and saved to a JSON file atomically.
+
+    Attributes:
+        path (str): Path of the cache file.
+        ttl (int): Default seconds an entry is fresh.
+        max_entries (int): Max number of entries.
+        max_stale (int): Seconds an expired entry can be served.
+    """
+
+    # (class, path) -> cache
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: str, ttl: int = JSON_CACHE_TTL, max_entries: int = JSON_CACHE_MAX_ENTRIES,
+                 max_stale: int = 0):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_stale = max_stale
+        # key -> (value, expires at), least recently used first
+        self._entries = OrderedDict()
+        self._refreshing = set()
+        self._dirty = False
+        self._executor = None
+        self._lock = threading.RLock()
+        self._load_file()
+
+    @classmethod
+    def get_instance(cls, path: str) -> "JsonFileCache":
+        """
+        Get process-wide cache of the file path, it is saved at exit
+
+        Args:
+            path (str): Path of the cache file.
+
+        Returns:
+            JsonFileCache: shared cache
+        """
+        key = (cls, path)
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cache = cls(path)
+                atexit.register(cache.save)
+                cls._instances[key] = cache
+            return cls._instances[key]
+
+    def _load_file(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            now = time.time()
+            for key, value, expires_at in data.get("entries", []):
+                if expires_at + self.max_stale > now:
+                    self._entries[key] = (value, float(expires_at))
+            logger.debug(f"Loaded {len(self._entries)} cache entries from {self.path}")
+        except (OSError, ValueError, AttributeError, TypeError) as e:
+            logger.warning(f"Failed to load cache file {self.path}, it will be rebuilt: {e}")
+            self._entries = OrderedDict()
+
+    def save(self):
+        """
+        Write the cache to the cache file atomically if it is changed, failure is logged only
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"entries": [[key, value, expires_at] for key, (value, expires_at) in self._entries.items()]}
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, "w") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                logger.warning(f"Failed to save cache to {self.path}: {e}")
+
+    def get(self, key: str) -> tuple[Optional[Any], bool]:
+        """
+        Get cached value
+
+        Args:
+            key (str): cache key
+
+        Returns:
+            tuple[Any, bool]: cached value and whether it is fresh, (None, False) if it is not cached or too stale
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, False
+            value, expires_at = entry
+            if expires_at + self.max_stale <= now:
+                del self._entries[key]
+                self._dirty = True
+                return None, False
+            self._entries.move_to_end(key)
+            return value, expires_at > now
+
+    def put(self, key: str, value: Any, ttl: int = None):
+        """
+        Cache JSON serializable value
+
+        Args:
+            key (str): cache key
+            value (Any): value to cache
+            ttl (int, optional): seconds the value is fresh. Defaults to ttl of the cache.
+        """
+        with self._lock:
+            self._entries[key] = (value, time.time() + (self.ttl if ttl is None else ttl))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def get_many(self, keys: list[str], fetch: Callable[[list[str]], dict[str, tuple[Any, Optional[int]]]]) -> dict[str, Any]:
+        """
+        Get cached values of keys, keys not cached are fetched and cached, stale ones are refreshed in background
+
+        The cache is saved when the values are collected.
+
+        Args:
+            keys (list[str]): cache keys
+            fetch (Callable[[list[str]], dict[str, tuple[Any, Optional[int]]]]): function returning value and TTL by key,
+                values with None TTL are returned but not cached, keys not returned are failed to fetch
+
+        Returns:
+            dict[str, Any]: value by key, keys failed to fetch are excluded
+        """
+        values = {}
+        missing = []
+        stale = []
+        for key in dict.fromkeys(keys):
+            value, fresh = self.get(key)
+            if value is None:
+                missing.append(key)
+                continue
+            values[key] = value
+            if not fresh:
+                stale.append(key)
+
+        if missing:
+            for key, (value, ttl) in fetch(missing).items():
+                if ttl is not None:
+                    self.put(key, value, ttl)
+                values[key] = value
+        if stale:
+            self.revalidate(stale, fetch)
+        self.save()
+        logger.debug(f"Got {len(values)} of {len(keys)} cache keys, {len(missing)} fetched, {len(stale)} stale")
+
+        return values
+
+    def revalidate(self, keys: list[str], fetch: Callable[[list[str]], dict[str, tuple[Any, Optional[int]]]]):
+        """
+        Refresh stale entries in background, keys already being refreshed are skipped
+
+        Args:
+            keys (list[str]): keys of stale entries
+            fetch (Callable[[list[str]], dict[str, tuple[Any, Optional[int]]]]): function returning value and TTL by key,
+                keys not returned or returned with None TTL are kept as they are
+        """
+        with self._lock:
+            keys = [key for key in dict.fromkeys(keys) if key not in self._refreshing]
+            if not keys:
+                return
+            self._refreshing.update(keys)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=JSON_CACHE_REFRESH_WORKERS)
+            self._executor.submit(self._refresh, keys, fetch)
+
+    def _refresh(self, keys, fetch):
+        try:
+            for key, (value, ttl) in fetch(keys).items():
+                if ttl is not None:
+                    self.put(key, value, ttl)
+            logger.debug(f"Refreshed {len(keys)} stale cache entries")
+        except Exception as e:
+            logger.warning(f"Failed to refresh {len(keys)} stale cache entries: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.difference_update(keys)
+
+    def wait(self):
+        """
+        Wait for background refreshes to complete
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=True)
+
+    def clear(self):
+        """
+        Drop all entries
+        """
+        with self._lock:
+            self._entries.clear()
+            self._dirty = True
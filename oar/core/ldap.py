@@ -1,23 +1,129 @@
 import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
 
 from ldap3 import Server, Connection, ALL, SUBTREE
 from ldap3.core.exceptions import LDAPException
+from ldap3.utils.conv import escape_filter_chars
 from ldap3.utils.dn import parse_dn
 
 logger = logging.getLogger(__name__)
 
+LDAP_SERVER_URL = "ldaps://ldap.corp.redhat.com"
+LDAP_SEARCH_BASE = "dc=redhat,dc=com"
+# max number of bound connections kept by the pool
+LDAP_POOL_SIZE = 4
+# max number of values in one OR filter search
+LDAP_BATCH_SIZE = 50
+# manager lookup results are cached for this period
+LDAP_CACHE_TTL = 24 * 60 * 60
+
+
+class LdapConnectionPool:
+    """
+    Pool of bound LDAP connections shared by LdapHelper instances.
+
+    Connections are bound on first use and reused by later searches.
+    A connection failing with LDAPException is discarded, the search is retried once on a new connection.
+    """
+
+    def __init__(self, server: Server, size: int = LDAP_POOL_SIZE):
+        self.server = server
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    @contextmanager
+    def connection(self):
+        """
+        Acquire a bound connection, it is returned to the pool when it is not broken
+
+        Yields:
+            Connection: bound LDAP connection
+        """
+        with self._slots:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = Connection(self.server, auto_bind=True)
+            try:
+                yield conn
+            except Exception:
+                self._discard(conn)
+                raise
+            else:
+                self._idle.put(conn)
+
+    def _discard(self, conn):
+        try:
+            conn.unbind()
+        except LDAPException:
+            pass
+
+    def search(self, search_filter: str, attributes: list[str]) -> list:
+        """
+        Search entries under search base with a pooled connection, reconnect once on failure
+
+        Args:
+            search_filter (str): LDAP search filter
+            attributes (list[str]): attributes to return
+
+        Returns:
+            list: found entries
+
+        Raises:
+            LDAPException: If search failed on a new connection too
+        """
+        for attempt in range(2):
+            try:
+                with self.connection() as conn:
+                    conn.search(
+                        search_base=LDAP_SEARCH_BASE,
+                        search_filter=search_filter,
+                        search_scope=SUBTREE,
+                        attributes=attributes,
+                    )
+                    return list(conn.entries)
+            except LDAPException as e:
+                if attempt:
+                    raise
+                logger.debug(f"LDAP search failed, reconnecting: {e}")
+
+    def close(self):
+        """
+        Unbind all idle connections
+        """
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
 
 class LdapHelper:
     """
     Helper class is used to acquire data from LDAP server.
+
+    LDAP connections are pooled and manager lookups are cached in the process,
+    managers of many users are resolved with batched OR filter searches.
     """
 
     MANAGER = "manager"
     PRIMARY_MAIL = "rhatPrimaryMail"
     UID = "uid"
 
+    _pool = None
+    _pool_lock = threading.Lock()
+    # user email -> (manager email, expiry time)
+    _manager_cache = {}
+    _cache_lock = threading.Lock()
+
     def __init__(self):
-        self.server = Server("ldaps://ldap.corp.redhat.com", get_info=ALL)
+        with LdapHelper._pool_lock:
+            if LdapHelper._pool is None:
+                LdapHelper._pool = LdapConnectionPool(Server(LDAP_SERVER_URL, get_info=ALL))
+        self.server = LdapHelper._pool.server
 
     def get_manager_email(self, user_email: str) -> str:
         """
@@ -30,13 +136,56 @@ class LdapHelper:
             str: Found manager email for specified user email
         """
 
-        manager_id = self._get_manager_id(user_email)
-
-        if manager_id:
-            return self._get_user_email(manager_id) 
-        else:
+        if not user_email:
             return None
 
+        return self.get_manager_emails([user_email]).get(user_email)
+
+    def get_manager_emails(self, user_emails: list[str]) -> dict[str, str]:
+        """
+        Get manager emails for specified user emails.
+        Uncached users are resolved with one OR filter search for the users and one for their managers per batch.
+
+        Args:
+            user_emails (list[str]): User primary emails
+
+        Returns:
+            dict[str, str]: Manager email by user email, None if manager is not found
+        """
+
+        result = {}
+        missing = []
+        now = time.monotonic()
+        with LdapHelper._cache_lock:
+            for email in dict.fromkeys(e for e in user_emails if e):
+                cached = LdapHelper._manager_cache.get(email.lower())
+                if cached and cached[1] > now:
+                    result[email] = cached[0]
+                else:
+                    missing.append(email)
+
+        if missing:
+            logger.debug(f"looking up managers of {len(missing)} users in LDAP, {len(result)} found in cache")
+        for i in range(0, len(missing), LDAP_BATCH_SIZE):
+            batch = missing[i:i + LDAP_BATCH_SIZE]
+            try:
+                manager_ids = self._get_manager_ids(batch)
+                manager_emails = self._get_user_emails(list(set(manager_ids.values())))
+            except LDAPException as e:
+                # failed lookups are not cached
+                logger.error(f"LDAP connection failed: {e}")
+                result.update({email: None for email in batch})
+                continue
+
+            expiry = time.monotonic() + LDAP_CACHE_TTL
+            with LdapHelper._cache_lock:
+                for email in batch:
+                    manager_email = manager_emails.get(manager_ids.get(email.lower()))
+                    result[email] = manager_email
+                    LdapHelper._manager_cache[email.lower()] = (manager_email, expiry)
+
+        return result
+
     def get_group_members_emails(self, group_name: str) -> set[str]:
         """
         Get emails of all members in the specified group.
@@ -51,22 +200,15 @@ class LdapHelper:
         members = set()
 
         try:
-            conn = Connection(self.server, auto_bind=True)
-            conn.search(
-                search_base="dc=redhat,dc=com",
-                search_filter=f"(memberOf=cn={group_name},ou=adhoc,ou=managedGroups,dc=redhat,dc=com)",
-                search_scope=SUBTREE,
-                attributes=[LdapHelper.PRIMARY_MAIL],
+            entries = self._pool.search(
+                f"(memberOf=cn={group_name},ou=adhoc,ou=managedGroups,dc=redhat,dc=com)",
+                [LdapHelper.PRIMARY_MAIL],
             )
-
-            for entry in conn.entries:
+            for entry in entries:
                 if LdapHelper.PRIMARY_MAIL in entry:
                     members.add(entry[LdapHelper.PRIMARY_MAIL].value)
         except LDAPException as e:
             logger.error(f"LDAP connection failed: {e}")
-        finally:
-            if conn:
-                conn.unbind()
 
         return members
 
@@ -81,33 +223,20 @@ class LdapHelper:
             str: Found manager id for specified user email
 
         """
-        
-        manager_id = None
 
         try:
-            conn = Connection(self.server, auto_bind=True)
-            conn.search(
-                search_base="dc=redhat,dc=com",
-                search_filter=f"({LdapHelper.PRIMARY_MAIL}={user_email})",
-                search_scope=SUBTREE,
-                attributes=[LdapHelper.MANAGER],
+            entries = self._pool.search(
+                f"({LdapHelper.PRIMARY_MAIL}={user_email})",
+                [LdapHelper.MANAGER],
             )
-
-            if conn.entries:
-                entry = conn.entries[0]
-                if LdapHelper.MANAGER in entry:
-                    dn = parse_dn(entry[LdapHelper.MANAGER].value)
-                    for attr, value, _ in dn:
-                        if attr == LdapHelper.UID:
-                            manager_id = value
-                            break
         except LDAPException as e:
             logger.error(f"LDAP connection failed: {e}")
-        finally:
-            if conn:
-                conn.unbind()
+            return None
 
-        return manager_id
+        if entries:
+            return self._get_manager_id_from_entry(entries[0])
+
+        return None
 
     def _get_user_email(self, user_id: str) -> str:
         """
@@ -120,26 +249,81 @@ class LdapHelper:
             str: Found user email for specified user id
         """
 
-        user_email = None
-
         try:
-            conn = Connection(self.server, auto_bind=True)
-            conn.search(
-                search_base="dc=redhat,dc=com",
-                search_filter=f"({LdapHelper.UID}={user_id})",
-                search_scope=SUBTREE,
-                attributes=[LdapHelper.PRIMARY_MAIL],
+            entries = self._pool.search(
+                f"({LdapHelper.UID}={user_id})",
+                [LdapHelper.PRIMARY_MAIL],
             )
-
-            if conn.entries:
-                entry = conn.entries[0]
-                if LdapHelper.PRIMARY_MAIL in entry:
-                    user_email = entry[LdapHelper.PRIMARY_MAIL].value
-
         except LDAPException as e:
             logger.error(f"LDAP connection failed: {e}")
-        finally:
-            if conn:
-                conn.unbind()
+            return None
+
+        if entries and LdapHelper.PRIMARY_MAIL in entries[0]:
+            return entries[0][LdapHelper.PRIMARY_MAIL].value
+
+        return None
+
+    def _get_manager_ids(self, user_emails: list[str]) -> dict[str, str]:
+        """
+        Get manager ids for specified user emails in one search.
+
+        Args:
+            user_emails (list[str]): User primary emails
+
+        Returns:
+            dict[str, str]: Manager id by lower case user email
+
+        Raises:
+            LDAPException: If LDAP search failed
+        """
+
+        entries = self._pool.search(
+            self._to_or_filter(LdapHelper.PRIMARY_MAIL, user_emails),
+            [LdapHelper.PRIMARY_MAIL, LdapHelper.MANAGER],
+        )
+        manager_ids = {}
+        for entry in entries:
+            if LdapHelper.PRIMARY_MAIL in entry:
+                manager_id = self._get_manager_id_from_entry(entry)
+                if manager_id:
+                    manager_ids[entry[LdapHelper.PRIMARY_MAIL].value.lower()] = manager_id
+        return manager_ids
+
+    def _get_user_emails(self, user_ids: list[str]) -> dict[str, str]:
+        """
+        Get user emails for specified user ids in one search.
+
+        Args:
+            user_ids (list[str]): User ids
+
+        Returns:
+            dict[str, str]: User email by user id
+
+        Raises:
+            LDAPException: If LDAP search failed
+        """
 
-        return user_email
+        if not user_ids:
+            return {}
+
+        entries = self._pool.search(
+            self._to_or_filter(LdapHelper.UID, user_ids),
+            [LdapHelper.UID, LdapHelper.PRIMARY_MAIL],
+        )
+        return {
+            entry[LdapHelper.UID].value: entry[LdapHelper.PRIMARY_MAIL].value
+            for entry in entries
+            if LdapHelper.UID in entry and LdapHelper.PRIMARY_MAIL in entry
+        }
+
+    def _get_manager_id_from_entry(self, entry):
+        if LdapHelper.MANAGER in entry:
+            dn = parse_dn(entry[LdapHelper.MANAGER].value)
+            for attr, value, _ in dn:
+                if attr == LdapHelper.UID:
+                    return value
+        return None
+
+    @staticmethod
+    def _to_or_filter(attribute: str, values: list[str]) -> str:
+        return "(|" + "".join(f"({attribute}={escape_filter_chars(value)})" for value in values) + ")"
@@ -1,7 +1,15 @@
+import atexit
+import json
 import logging
+import queue
 import re
 import smtplib
 import os
+import tempfile
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
@@ -10,6 +18,7 @@ from slack_sdk.errors import SlackApiError
 
 import oar.core.util as util
 from oar.core.configstore import ConfigStore
+from oar.core.const import ENV_APP_PASSWD
 from oar.core.exceptions import NotificationException, JiraUnauthorizedException
 from oar.core.jira import JiraManager
 from oar.core.worksheet import TestReport
@@ -20,19 +29,58 @@ logger = logging.getLogger(__name__)
 class NotificationManager:
     """
     NotificationManager is used to send notification messages via email or slack.
+
+    With async_dispatch enabled, slack messages and emails are enqueued to the process-wide NotificationQueue
+    and share_* methods return without waiting for delivery, delivery failures are logged by the queue.
     """
 
-    def __init__(self, cs: ConfigStore):
+    def __init__(self, cs: ConfigStore, async_dispatch: bool = False):
         if cs:
             self.cs = cs
         else:
             raise NotificationException("argument config store is required")
 
-        # self.mc = MailClient(
-        #     self.cs.get_email_contact("trt"), self.cs.get_google_app_passwd()
-        # )
         self.sc = SlackClient(self.cs.get_slack_bot_token())
         self.mh = MessageHelper(self.cs)
+        self.queue = NotificationQueue.get_instance(self.sc.client) if async_dispatch else None
+
+    def _post_message(self, channel, msg, thread_ts=None, split=False, chunk_template="{}"):
+        """
+        Send slack message directly or enqueue it when async dispatch is enabled
+
+        Args:
+            channel (str): slack channel
+            msg (str): message text
+            thread_ts (str, optional): thread timestamp to reply in
+            split (bool): split large message into chunks with util.split_large_message
+            chunk_template (str): format template of each chunk, e.g. code block
+        """
+        if self.queue:
+            self.queue.enqueue_slack(channel, msg, thread_ts=thread_ts, split=split, chunk_template=chunk_template)
+            return
+        chunks = util.split_large_message(msg) if split else [msg]
+        for chunk in chunks:
+            if thread_ts:
+                self.sc.post_message(channel, chunk_template.format(chunk), thread_ts=thread_ts)
+            else:
+                self.sc.post_message(channel, chunk_template.format(chunk))
+
+    def _send_email(self, to_addrs, subject, content):
+        """
+        Send email from trt contact directly or enqueue it when async dispatch is enabled,
+        the queue reuses the SMTP session for later emails
+
+        Args:
+            to_addrs (str): comma separated recipient addresses
+            subject (str): email subject
+            content (str): email content
+        """
+        from_addr = self.cs.get_email_contact("trt")
+        google_app_passwd = self.cs.get_google_app_passwd()
+        if self.queue:
+            self.queue.enqueue_email(from_addr, google_app_passwd, to_addrs, subject, content)
+            return
+        MailClient(from_addr, google_app_passwd).send_email(to_addrs, subject, content)
 
     def share_new_report(self, report: TestReport):
         """
@@ -45,15 +93,16 @@ class NotificationManager:
             NotificationException: error when share this info
         """
         try:
-            # Send email
-            # mail_subject = self.cs.release + " z-stream errata test status"
-            # mail_content = self.mh.get_mail_content_for_new_report(report)
-            # self.mc.send_email(
-            #     self.cs.get_email_contact("qe"), mail_subject, mail_content
-            # )
+            # Send email, it is skipped when google app password is not configured
+            if os.environ.get(ENV_APP_PASSWD):
+                mail_subject = self.cs.release + " z-stream errata test status"
+                mail_content = self.mh.get_mail_content_for_new_report(report)
+                self._send_email(self.cs.get_email_contact("qe"), mail_subject, mail_content)
+            else:
+                logger.info(f"email of new report is not sent, env var {ENV_APP_PASSWD} is not set")
             # Send slack message
             slack_msg = self.mh.get_slack_message_for_new_report(report)
-            self.sc.post_message(
+            self._post_message(
                 self.cs.get_slack_channel_from_contact("qe-release"), slack_msg
             )
         except Exception as e:
@@ -72,7 +121,7 @@ class NotificationManager:
         """
         try:
             slack_msg = self.mh.get_slack_message_for_new_statebox(statebox_url, release)
-            self.sc.post_message(
+            self._post_message(
                 self.cs.get_slack_channel_from_contact("qe-release"), slack_msg
             )
         except Exception as e:
@@ -99,14 +148,14 @@ class NotificationManager:
             slack_msg = self.mh.get_slack_message_for_ownership_change(
                 updated_ads, abnormal_ads, updated_subtasks, new_owner
             )
-            self.sc.post_message(
+            self._post_message(
                 self.cs.get_slack_channel_from_contact("qe-release"), slack_msg
             )
             if len(abnormal_ads):
                 slack_msg = self.mh.get_slack_message_for_abnormal_advisory(
                     abnormal_ads
                 )
-                self.sc.post_message(
+                self._post_message(
                     self.cs.get_slack_channel_from_contact("art"), slack_msg
                 )
         except Exception as e:
@@ -127,7 +176,7 @@ class NotificationManager:
             slack_msg = self.mh.get_slack_message_for_bug_verification(
                 jira_issues)
             if len(slack_msg):
-                self.sc.post_message(
+                self._post_message(
                     self.cs.get_slack_channel_from_contact(
                         "qe-forum"), slack_msg
                 )
@@ -149,7 +198,7 @@ class NotificationManager:
             slack_msg = self.mh.get_slack_message_for_high_severity_bugs(
                 jira_issues)
             if len(slack_msg):
-                self.sc.post_message(
+                self._post_message(
                     self.cs.get_slack_channel_from_contact(
                         "qe-forum"), slack_msg
                 )
@@ -171,7 +220,7 @@ class NotificationManager:
             slack_msg = self.mh.get_slack_message_for_cve_tracker_bugs(
                 cve_tracker_bugs)
             if len(slack_msg):
-                self.sc.post_message(
+                self._post_message(
                     self.cs.get_slack_channel_from_contact("art"), slack_msg
                 )
         except Exception as e:
@@ -192,7 +241,7 @@ class NotificationManager:
             slack_msg = self.mh.get_slack_message_for_unhealthy_advisories(
                 unhealthy_advisories)
             if len(slack_msg):
-                self.sc.post_message(
+                self._post_message(
                     self.cs.get_slack_channel_from_contact("qe-release"), slack_msg
                 )
         except Exception as e:
@@ -213,7 +262,7 @@ class NotificationManager:
         try:
             slack_msg = self.mh.get_slack_message_for_dropped_bugs(dropped_bugs)
             if len(slack_msg):
-                self.sc.post_message(
+                self._post_message(
                     self.cs.get_slack_channel_from_contact(
                         "qe-release"), slack_msg
                 )
@@ -239,7 +288,7 @@ class NotificationManager:
                 dropped_bugs, high_severity_bugs
             )
             if len(slack_msg):
-                self.sc.post_message(
+                self._post_message(
                     self.cs.get_slack_channel_from_contact(
                         "qe-release"), slack_msg
                 )
@@ -257,7 +306,7 @@ class NotificationManager:
                 doc_appr, prodsec_appr
             )
             if len(slack_msg):
-                self.sc.post_message(
+                self._post_message(
                     self.cs.get_slack_channel_from_contact(
                         "approver"), slack_msg
                 )
@@ -273,7 +322,7 @@ class NotificationManager:
             slack_msg = self.mh.get_slack_message_for_jenkins_build(
                 job_name, build_url)
             if len(slack_msg):
-                self.sc.post_message(self.cs.get_slack_channel_from_contact(
+                self._post_message(self.cs.get_slack_channel_from_contact(
                     "qe-release"), slack_msg)
         except Exception as e:
             raise NotificationException(
@@ -287,7 +336,7 @@ class NotificationManager:
             slack_msg = self.mh.get_slack_message_for_prow_job(
                 job_name, job_url)
             if len(slack_msg):
-                self.sc.post_message(self.cs.get_slack_channel_from_contact(
+                self._post_message(self.cs.get_slack_channel_from_contact(
                     "qe-release"), slack_msg)
         except Exception as e:
             raise NotificationException(
@@ -302,7 +351,7 @@ class NotificationManager:
         """
         try:
             slack_msg = self.mh.get_slack_message_for_failed_cvp(jira_key)
-            self.sc.post_message(self.cs.get_slack_channel_from_contact(
+            self._post_message(self.cs.get_slack_channel_from_contact(
                 "qe-release"), slack_msg)
         except Exception as e:
             raise NotificationException(
@@ -321,7 +370,7 @@ class NotificationManager:
         """
         try:
             slack_msg = self.mh.get_slack_message_for_shipment_mr(mr, new_owner)
-            self.sc.post_message(
+            self._post_message(
                 self.cs.get_slack_channel_from_contact("qe-release"), slack_msg
             )
         except Exception as e:
@@ -345,14 +394,14 @@ class NotificationManager:
             slack_msg = self.mh.get_slack_message_for_shipment_mr_and_ad_info(
                 mr, updated_ads, abnormal_ads, updated_subtasks, new_owner
             )
-            self.sc.post_message(
+            self._post_message(
                 self.cs.get_slack_channel_from_contact("qe-release"), slack_msg
             )
             if len(abnormal_ads):
                 slack_msg = self.mh.get_slack_message_for_abnormal_advisory(
                     abnormal_ads
                 )
-                self.sc.post_message(
+                self._post_message(
                     self.cs.get_slack_channel_from_contact("art"), slack_msg
                 )
         except Exception as e:
@@ -372,7 +421,7 @@ class NotificationManager:
             slack_msg = self.mh.get_slack_message_for_unverified_cve_issues_to_managers(
                 unverified_cve_issues)
             if len(slack_msg):
-                self.sc.post_message(
+                self._post_message(
                     self.cs.get_slack_channel_from_contact(
                         "qe-forum"), slack_msg
                 )
@@ -417,7 +466,7 @@ class NotificationManager:
             
             # Always send to default channel
             default_channel = self.cs.get_slack_channel_from_contact("qe-release")
-            self.sc.post_message(default_channel, summary_message)
+            self._post_message(default_channel, summary_message)
             logger.info(f"Sent completion notification to default channel {default_channel}")
             
             # If Slack context is available, also send notification to specific thread
@@ -426,22 +475,18 @@ class NotificationManager:
                     # Send full log messages (which include the summary)
                     log_content = "\n".join(log_messages)
                     # Use utility function to split large messages
-                    message_chunks = util.split_large_message(log_content)
-                    for chunk in message_chunks:
-                        self.sc.client.chat_postMessage(
-                            channel=slack_channel,
-                            thread_ts=slack_thread,
-                            text=f"```{chunk}```"
-                        )
+                    self._post_message(
+                        slack_channel,
+                        log_content,
+                        thread_ts=slack_thread,
+                        split=True,
+                        chunk_template="```{}```"
+                    )
                     
                     logger.info(f"Also sent full logs to thread {slack_thread} in channel {slack_channel}")
                 else:
                     # Send summary message to thread when logs are not available
-                    self.sc.client.chat_postMessage(
-                        channel=slack_channel,
-                        thread_ts=slack_thread,
-                        text=summary_message
-                    )
+                    self._post_message(slack_channel, summary_message, thread_ts=slack_thread)
                     logger.info(f"Sent summary to thread {slack_thread} in channel {slack_channel} (no logs available)")
                 
         except Exception as e:
@@ -450,9 +495,11 @@ class NotificationManager:
 class MailClient:
     """
     Wrapper of email to send email easily
+
+    With keep_alive enabled, the SMTP session is reused by subsequent emails until close() is called
     """
 
-    def __init__(self, from_addr, google_app_passwd):
+    def __init__(self, from_addr, google_app_passwd, keep_alive=False):
         self.from_addr = from_addr
         if not self.from_addr:
             raise NotificationException("cannot find sender address")
@@ -461,7 +508,11 @@ class MailClient:
             raise NotificationException(
                 "cannot find google app password from env var GOOGLE_APP_PASSWD"
             )
+        self.keep_alive = keep_alive
+        self.session = None
+        self._connect()
 
+    def _connect(self):
         try:
             self.session = smtplib.SMTP_SSL("smtp.gmail.com:465")
             self.session.login(self.from_addr, self.google_app_passwd)
@@ -473,37 +524,610 @@ class MailClient:
         Send message to gmail
         """
         try:
+            if self.session is None:
+                self._connect()
             message = MIMEMultipart()
             message["Subject"] = subject
             message.attach(MIMEText(content, "plain"))
             # Send email
-            senderrs = self.session.sendmail(
-                self.from_addr, to_addrs.split(","), message.as_string()
-            )
+            try:
+                senderrs = self.session.sendmail(
+                    self.from_addr, to_addrs.split(","), message.as_string()
+                )
+            except smtplib.SMTPServerDisconnected:
+                # reused session is closed by server, reconnect once
+                self._connect()
+                senderrs = self.session.sendmail(
+                    self.from_addr, to_addrs.split(","), message.as_string()
+                )
             if len(senderrs):
                 logger.warning(
                     f"someone in the to_list is rejected: {senderrs}")
         except smtplib.SMTPException as se:  # catch all the exceptions here
             raise NotificationException("send email failed") from se
         finally:
-            self.session.quit()
+            if not self.keep_alive:
+                self.close()
 
         logger.info(f"sent email to {to_addrs} with subject: <{subject}>")
 
+    def close(self):
+        """
+        Close SMTP session
+        """
+        if self.session is not None:
+            try:
+                self.session.quit()
+            except smtplib.SMTPException:
+                pass
+            self.session = None
+
+
+# chat.postMessage allows about one message per second per channel
+SLACK_CHANNEL_MIN_INTERVAL = 1.0
+# identical messages enqueued within this period are sent once
+NOTIFICATION_DEDUP_WINDOW = 10 * 60
+NOTIFICATION_MAX_ATTEMPTS = 3
+# pending notifications are delivered within this period when the process exits
+NOTIFICATION_DRAIN_TIMEOUT = 120
+ENV_VAR_NOTIFICATION_SPOOL_DIR = "OAR_NOTIFICATION_SPOOL_DIR"
+
+
+@dataclass
+class NotificationQueueMetrics:
+    """
+    Tracks delivery metrics of notification queue.
+
+    Attributes:
+        enqueued: Number of enqueued messages, chunks of split messages are counted separately
+        sent: Number of delivered messages
+        failed: Number of messages failed after all attempts
+        deduplicated: Number of skipped duplicate notifications
+        rate_limited: Number of slack rate limited responses
+        retried: Number of retried deliveries
+        total_delivery_seconds: Sum of seconds between enqueue and delivery of sent messages
+    """
+    enqueued: int = field(default=0)
+    sent: int = field(default=0)
+    failed: int = field(default=0)
+    deduplicated: int = field(default=0)
+    rate_limited: int = field(default=0)
+    retried: int = field(default=0)
+    total_delivery_seconds: float = field(default=0.0)
+
+    def to_dict(self) -> dict:
+        """Convert metrics to dictionary for JSON serialization."""
+        return {
+            "enqueued": self.enqueued,
+            "sent": self.sent,
+            "failed": self.failed,
+            "deduplicated": self.deduplicated,
+            "rate_limited": self.rate_limited,
+            "retried": self.retried,
+            "avg_delivery_seconds": round(self.total_delivery_seconds / self.sent, 3) if self.sent else 0.0,
+        }
+
+
+class NotificationQueue:
+    """
+    In-process outbound notification queue delivering slack messages and emails on a background thread
+
+    - slack messages are rate limited per channel and retried after Retry-After on 429 responses
+    - SMTP sessions are reused per sender until the queue is closed
+    - identical notifications enqueued within the dedup window are sent once
+    - large slack messages are split once when enqueued
+    - with a spool dir, pending messages are persisted and resent by the next queue of the spool dir
+
+    The process-wide queue is drained when the process exits.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        slack_client: WebClient = None,
+        spool_dir: str = None,
+        channel_interval: float = SLACK_CHANNEL_MIN_INTERVAL,
+        dedup_window: float = NOTIFICATION_DEDUP_WINDOW,
+    ):
+        self._slack_client = slack_client
+        self._spool_dir = spool_dir
+        self._channel_interval = channel_interval
+        self._dedup_window = dedup_window
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        # channel -> earliest monotonic time of next message
+        self._next_send_at = {}
+        # dedup key -> monotonic time of enqueue
+        self._recent = {}
+        # sender -> password of enqueued emails and reused mail client
+        self._mail_passwords = {}
+        self._mail_clients = {}
+        self.metrics = NotificationQueueMetrics()
+        self._worker = threading.Thread(target=self._run, name="oar-notification-queue", daemon=True)
+        self._worker.start()
+        if self._spool_dir:
+            os.makedirs(self._spool_dir, exist_ok=True)
+            self._load_spool()
+
+    @classmethod
+    def get_instance(cls, slack_client: WebClient) -> "NotificationQueue":
+        """
+        Get process-wide notification queue, it is drained and closed when the process exits
+
+        Args:
+            slack_client (WebClient): slack web client used by the queue when it is created
+
+        Returns:
+            NotificationQueue: shared queue
+        """
+        with cls._instance_lock:
+            if cls._instance is None or cls._instance._closed:
+                cls._instance = cls(slack_client, spool_dir=os.environ.get(ENV_VAR_NOTIFICATION_SPOOL_DIR))
+                atexit.register(cls._instance.close)
+            return cls._instance
+
+    def enqueue_slack(self, channel, text, thread_ts=None, split=False, chunk_template="{}"):
+        """
+        Enqueue slack message
+
+        Args:
+            channel (str): slack channel
+            text (str): message text
+            thread_ts (str, optional): thread timestamp to reply in
+            split (bool): split large message into chunks with util.split_large_message
+            chunk_template (str): format template of each chunk
+
+        Returns:
+            bool: True if message is enqueued, False if it is a duplicate
+
+        Raises:
+            NotificationException: If queue is closed
+        """
+        chunks = util.split_large_message(text) if split else [text]
+        payloads = [
+            {"kind": "slack", "channel": channel, "thread_ts": thread_ts, "text": chunk_template.format(chunk)}
+            for chunk in chunks
+        ]
+        return self._enqueue(("slack", channel, thread_ts, chunk_template, text), payloads)
+
+    def enqueue_email(self, from_addr, google_app_passwd, to_addrs, subject, content):
+        """
+        Enqueue email, the password is kept in memory only
+
+        Spooled emails reloaded by a later queue are sent with the password from env var GOOGLE_APP_PASSWD
+
+        Args:
+            from_addr (str): sender address
+            google_app_passwd (str): google app password of sender
+            to_addrs (str): comma separated recipient addresses
+            subject (str): email subject
+            content (str): email content
+
+        Returns:
+            bool: True if email is enqueued, False if it is a duplicate
+
+        Raises:
+            NotificationException: If queue is closed
+        """
+        with self._lock:
+            self._mail_passwords[from_addr] = google_app_passwd
+        payload = {"kind": "email", "from_addr": from_addr, "to_addrs": to_addrs, "subject": subject, "content": content}
+        return self._enqueue(("email", from_addr, to_addrs, subject, content), [payload])
+
+    def _enqueue(self, dedup_key, payloads):
+        now = time.monotonic()
+        with self._lock:
+            if self._closed:
+                raise NotificationException("notification queue is closed")
+            self._recent = {k: t for k, t in self._recent.items() if now - t < self._dedup_window}
+            if dedup_key in self._recent:
+                self.metrics.deduplicated += 1
+                logger.info(f"duplicate {dedup_key[0]} notification to <{dedup_key[1]}> is skipped")
+                return False
+            self._recent[dedup_key] = now
+            self.metrics.enqueued += len(payloads)
+        for payload in payloads:
+            self._queue.put({"payload": payload, "enqueued_at": now, "spool_path": self._spool(payload)})
+        logger.debug(f"{len(payloads)} {dedup_key[0]} messages to <{dedup_key[1]}> are enqueued")
+        return True
+
+    def _spool(self, payload):
+        if not self._spool_dir:
+            return None
+        path = os.path.join(self._spool_dir, f"{time.time_ns()}-{uuid.uuid4().hex}.json")
+        try:
+            with open(path, "w") as f:
+                json.dump(payload, f)
+        except OSError as e:
+            logger.warning(f"Failed to spool notification to {path}: {e}")
+            return None
+        return path
+
+    def _load_spool(self):
+        paths = sorted(p for p in os.listdir(self._spool_dir) if p.endswith(".json"))
+        for name in paths:
+            path = os.path.join(self._spool_dir, name)
+            try:
+                with open(path, "r") as f:
+                    payload = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Failed to load spooled notification {path}: {e}")
+                continue
+            with self._lock:
+                self.metrics.enqueued += 1
+            self._queue.put({"payload": payload, "enqueued_at": time.monotonic(), "spool_path": path})
+        if paths:
+            logger.info(f"{len(paths)} spooled notifications are enqueued from {self._spool_dir}")
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._deliver(item)
+            except Exception as e:  # worker thread must not die
+                logger.error(f"unexpected error in notification queue: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _wait_for_channel(self, channel):
+        wait = self._next_send_at.get(channel, 0) - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self._next_send_at[channel] = time.monotonic() + self._channel_interval
+
+    def _send(self, payload):
+        if payload["kind"] == "slack":
+            self._wait_for_channel(payload["channel"])
+            if payload.get("thread_ts"):
+                self._slack_client.chat_postMessage(
+                    channel=payload["channel"], text=payload["text"], thread_ts=payload["thread_ts"]
+                )
+            else:
+                self._slack_client.chat_postMessage(channel=payload["channel"], text=payload["text"])
+        else:
+            from_addr = payload["from_addr"]
+            mail_client = self._mail_clients.get(from_addr)
+            if mail_client is None:
+                # password of spooled email enqueued by another queue is not persisted
+                google_app_passwd = self._mail_passwords.get(from_addr) or os.environ.get(ENV_APP_PASSWD)
+                mail_client = MailClient(from_addr, google_app_passwd, keep_alive=True)
+                self._mail_clients[from_addr] = mail_client
+            mail_client.send_email(payload["to_addrs"], payload["subject"], payload["content"])
+
+    def _deliver(self, item):
+        payload = item["payload"]
+        target = payload.get("channel") or payload.get("to_addrs")
+        error = None
+        for attempt in range(1, NOTIFICATION_MAX_ATTEMPTS + 1):
+            try:
+                self._send(payload)
+            except SlackApiError as e:
+                error = e
+                if e.response is not None and e.response.status_code == 429:
+                    retry_after = int(e.response.headers.get("Retry-After", 1))
+                    self.metrics.rate_limited += 1
+                    self._next_send_at[payload["channel"]] = time.monotonic() + retry_after
+                    logger.warning(f"slack rate limited message to <{target}>, retry after {retry_after}s")
+                else:
+                    break
+            except (NotificationException, OSError) as e:
+                error = e
+                time.sleep(2 ** (attempt - 1))
+            except Exception as e:
+                # e.g. malformed spooled payload, it fails the same way when retried
+                error = e
+                break
+            else:
+                with self._lock:
+                    self.metrics.sent += 1
+                    self.metrics.total_delivery_seconds += time.monotonic() - item["enqueued_at"]
+                if item["spool_path"]:
+                    try:
+                        os.remove(item["spool_path"])
+                    except OSError:
+                        pass
+                logger.info(f"sent {payload['kind']} message to <{target}>")
+                return
+            if attempt < NOTIFICATION_MAX_ATTEMPTS:
+                self.metrics.retried += 1
+
+        with self._lock:
+            self.metrics.failed += 1
+        logger.error(f"send {payload['kind']} message to <{target}> failed: {error}")
+        if item["spool_path"]:
+            try:
+                os.replace(item["spool_path"], f"{item['spool_path']}.failed")
+            except OSError:
+                pass
+
+    def join(self, timeout: float = None) -> bool:
+        """
+        Wait until all enqueued messages are processed
+
+        Args:
+            timeout (float, optional): max seconds to wait, wait forever if None
+
+        Returns:
+            bool: True if all messages are processed, False if timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def get_metrics(self) -> dict:
+        """
+        Get delivery metrics of the queue
+
+        Returns:
+            dict: delivery metrics and number of pending messages
+        """
+        with self._lock:
+            metrics = self.metrics.to_dict()
+        metrics["pending"] = self._queue.unfinished_tasks
+        return metrics
+
+    def close(self, timeout: float = NOTIFICATION_DRAIN_TIMEOUT):
+        """
+        Deliver pending messages and stop the queue
+
+        Args:
+            timeout (float): max seconds to wait for pending messages
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        if not self.join(timeout):
+            logger.warning(f"{self._queue.unfinished_tasks} notifications are not delivered in {timeout}s")
+        self._queue.put(None)
+        self._worker.join(timeout=1)
+        for mail_client in self._mail_clients.values():
+            mail_client.close()
+        logger.info(f"notification queue is closed, metrics: {self.get_metrics()}")
+
+
+DEFAULT_SLACK_DIRECTORY_FILE = os.path.join(tempfile.gettempdir(), "oar_slack_directory.json")
+# slack directory is bulk reloaded after this period, unknown entries are looked up incrementally in between
+SLACK_DIRECTORY_TTL = 7 * 24 * 60 * 60
+# minimal interval between reloads of user groups triggered by unknown group names
+SLACK_GROUPS_RELOAD_INTERVAL = 5 * 60
+SLACK_USERS_PAGE_SIZE = 1000
+
+
+class SlackDirectory:
+    """
+    Directory of slack user ids by email and group ids by handle, shared in the process and persisted on disk
+
+    Users are bulk loaded from users.list with paging and user groups from usergroups.list,
+    the directory is saved to a local JSON file and reloaded after the TTL expires.
+    Users not in the directory are looked up by email and added incrementally.
+
+    Attributes:
+        path (str): Path of the directory file.
+        ttl (int): Seconds after which the directory is bulk reloaded.
+        users (dict[str, str]): Slack user id by lower case email.
+        groups (dict[str, str]): Slack group id by group handle.
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: str = DEFAULT_SLACK_DIRECTORY_FILE, ttl: int = SLACK_DIRECTORY_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.users = {}
+        self.groups = {}
+        self.users_loaded_at = 0
+        self.groups_loaded_at = 0
+        self._missing_emails = set()
+        self._users_load_failed = False
+        self._lock = threading.RLock()
+        self._load_file()
+
+    @classmethod
+    def get_instance(cls, path: str = DEFAULT_SLACK_DIRECTORY_FILE) -> "SlackDirectory":
+        """
+        Get process-wide directory of the file path
+
+        Args:
+            path (str): Path of the directory file
+
+        Returns:
+            SlackDirectory: shared directory
+        """
+        with cls._instances_lock:
+            if path not in cls._instances:
+                cls._instances[path] = cls(path)
+            return cls._instances[path]
+
+    def _load_file(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            self.users = dict(data.get("users", {}))
+            self.groups = dict(data.get("groups", {}))
+            self.users_loaded_at = float(data.get("users_loaded_at", 0))
+            self.groups_loaded_at = float(data.get("groups_loaded_at", 0))
+            logger.debug(f"Loaded slack directory from {self.path}: {len(self.users)} users, {len(self.groups)} groups")
+        except (OSError, ValueError, AttributeError, TypeError) as e:
+            logger.warning(f"Failed to load slack directory file {self.path}, it will be reloaded from slack: {e}")
+            self.users = {}
+            self.groups = {}
+            self.users_loaded_at = 0
+            self.groups_loaded_at = 0
+
+    def save(self):
+        """
+        Write the directory to the directory file atomically, failure is logged only
+        """
+        with self._lock:
+            data = {
+                "users_loaded_at": self.users_loaded_at,
+                "groups_loaded_at": self.groups_loaded_at,
+                "users": self.users,
+                "groups": self.groups,
+            }
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, "w") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logger.warning(f"Failed to save slack directory to {self.path}: {e}")
+
+    def _is_expired(self, loaded_at):
+        return time.time() - loaded_at > self.ttl
+
+    def load_users(self, client: WebClient):
+        """
+        Bulk load users with email from users.list
+
+        Args:
+            client (WebClient): slack web client
+
+        Raises:
+            SlackApiError: If users.list request failed
+        """
+        users = {}
+        cursor = None
+        pages = 0
+        while True:
+            resp = client.users_list(limit=SLACK_USERS_PAGE_SIZE, cursor=cursor)
+            pages += 1
+            for member in resp.get("members", []):
+                email = member.get("profile", {}).get("email")
+                if email and not member.get("deleted") and not member.get("is_bot"):
+                    users[email.lower()] = member["id"]
+            cursor = resp.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                break
+        with self._lock:
+            self.users = users
+            self.users_loaded_at = time.time()
+            self._missing_emails.clear()
+        logger.info(f"Loaded {len(users)} slack users in {pages} requests")
+        self.save()
+
+    def load_groups(self, client: WebClient):
+        """
+        Bulk load user groups from usergroups.list
+
+        Args:
+            client (WebClient): slack web client
+
+        Raises:
+            SlackApiError: If usergroups.list request failed
+        """
+        resp = client.api_call("usergroups.list")
+        groups = {group["handle"]: group["id"] for group in (resp.data or {}).get("usergroups", [])}
+        with self._lock:
+            self.groups = groups
+            self.groups_loaded_at = time.time()
+        logger.info(f"Loaded {len(groups)} slack user groups")
+        self.save()
+
+    def get_user_id(self, client: WebClient, email: str):
+        """
+        Get slack user id by email, the directory is bulk loaded when it is expired
+        and unknown email is looked up by users.lookupByEmail
+
+        Args:
+            client (WebClient): slack web client
+            email (str): email address
+
+        Returns:
+            str: slack user id, None if user cannot be found
+        """
+        email = email.lower()
+        with self._lock:
+            if self._is_expired(self.users_loaded_at) and not self._users_load_failed:
+                try:
+                    self.load_users(client)
+                except SlackApiError as e:
+                    # keep the stale directory, unknown users are looked up one by one in this process
+                    logger.warning(f"cannot bulk load slack users: {e}")
+                    self._users_load_failed = True
+            userid = self.users.get(email)
+            if userid:
+                logger.debug(f"Slack user id of {email} is retrieved from directory")
+                return userid
+            if email in self._missing_emails:
+                return None
+
+        try:
+            resp = client.api_call(
+                api_method="users.lookupByEmail", params={"email": email}
+            )
+        except SlackApiError as e:
+            logger.warning(f"cannot get slack user id for <{email}>: {e}")
+            with self._lock:
+                self._missing_emails.add(email)
+            return None
+
+        userid = resp["user"]["id"]
+        with self._lock:
+            self.users[email] = userid
+        logger.debug(f"Slack user id of {email} is added to directory")
+        self.save()
+        return userid
+
+    def get_group_id(self, client: WebClient, name: str):
+        """
+        Get slack group id by group handle, user groups are reloaded when the directory is expired
+        or the group is unknown and the groups were not reloaded recently
+
+        Args:
+            client (WebClient): slack web client
+            name (str): slack group handle
+
+        Returns:
+            str: slack group id, None if group cannot be found
+
+        Raises:
+            SlackApiError: If usergroups.list request failed
+        """
+        with self._lock:
+            recently_loaded = time.time() - self.groups_loaded_at <= SLACK_GROUPS_RELOAD_INTERVAL
+            if self._is_expired(self.groups_loaded_at) or (name not in self.groups and not recently_loaded):
+                self.load_groups(client)
+            else:
+                logger.debug(f"Slack group id of {name} is retrieved from directory")
+            return self.groups.get(name)
+
 
 class SlackClient:
-    def __init__(self, bot_token):
+    def __init__(self, bot_token, directory: SlackDirectory = None):
         if not bot_token:
             raise NotificationException("slack bot token is not available")
         self.client = WebClient(token=bot_token)
-        self.cache_dict = dict()
+        self.directory = directory or SlackDirectory.get_instance()
 
-    def post_message(self, channel, msg):
+    def post_message(self, channel, msg, thread_ts=None):
         """
         Send slack message
+
+        Args:
+            channel (str): slack channel
+            msg (str): message text
+            thread_ts (str, optional): thread timestamp to reply in
         """
         try:
-            self.client.chat_postMessage(channel=channel, text=msg)
+            if thread_ts:
+                self.client.chat_postMessage(channel=channel, text=msg, thread_ts=thread_ts)
+            else:
+                self.client.chat_postMessage(channel=channel, text=msg)
         except SlackApiError as e:
             raise NotificationException("send slack message failed") from e
 
@@ -511,36 +1135,24 @@ class SlackClient:
 
     def get_user_id_by_email(self, email):
         """
-        Query slack user id by email address
+        Query slack user id by email address from slack directory
 
         Args:
             email (str): valid email address
 
         Returns:
-            str: slack user id
+            str: slack user id, or the email if user id cannot be found
         """
         email = self.transform_email(email)
-        userid = None
-        if email in self.cache_dict:
-            userid = self.cache_dict.get(email)
-            logger.debug(f"Slack user id of {email} is retrieved from runtime cache")
-        else:
-            try:
-                resp = self.client.api_call(
-                    api_method="users.lookupByEmail", params={"email": email}
-                )
-                userid = resp["user"]["id"]
-                self.cache_dict[email] = userid
-                logger.debug(f"Slack user id of {email} is added to runtime cache")
-            except SlackApiError as e:
-                logger.warning(f"cannot get slack user id for <{email}>: {e}")
-                return email
+        userid = self.directory.get_user_id(self.client, email)
+        if not userid:
+            return email
 
         return "<@%s>" % userid
 
     def get_group_id_by_name(self, name):
         """
-        Query slack group id by group name
+        Query slack group id by group name from slack directory
 
         Args:
             group_name (str): slack group name
@@ -548,25 +1160,11 @@ class SlackClient:
         Returns:
             group id: slack group id
         """
-        ret_id = ""
-        if name in self.cache_dict:
-            ret_id = self.cache_dict.get(name)
-            logger.debug(f"Slack group id of {name} is retrieved from runtime cache")
-        else:
-            try:
-                resp = self.client.api_call("usergroups.list")
-                if resp.data:
-                    for group in resp.data["usergroups"]:
-                        gname = group["handle"]
-                        gid = group["id"]
-                        if gname == name:
-                            ret_id = gid
-                            self.cache_dict[name] = ret_id
-                            logger.debug(f"Slack group id of {name} is added to runtime cache")
-                            break
-            except SlackApiError as e:
-                raise NotificationException(
-                    f"query group id by name {name} error") from e
+        try:
+            ret_id = self.directory.get_group_id(self.client, name)
+        except SlackApiError as e:
+            raise NotificationException(
+                f"query group id by name {name} error") from e
 
         if not ret_id:
             raise NotificationException(
@@ -718,9 +1316,11 @@ class MessageHelper:
         
         if len(unverified_cve_issues):
             slack_message = f"[{self.cs.release}] {message}\n"
+            # resolve managers of all QA contacts in batched LDAP searches
+            manager_emails = self.ldap.get_manager_emails([issue.get_qa_contact() for issue in unverified_cve_issues])
             for issue in unverified_cve_issues:
                 qa_contact_email = issue.get_qa_contact()
-                manager_email = self.ldap.get_manager_email(qa_contact_email)
+                manager_email = manager_emails.get(qa_contact_email)
                 key = issue.get_key()
                 if manager_email:
                     user_id = self.sc.get_user_id_by_email(manager_email)
@@ -565,10 +565,13 @@ class CVETrackerOperator:
         self._nm = NotificationManager(cs)
         self._cs = cs
 
-    def check_cve_tracker_bugs(self) -> tuple[list, list]:
+    def check_cve_tracker_bugs(self, refresh: bool = False) -> tuple[list, list]:
         """
         Check for missed CVE tracker bugs across both advisory and shipment sources
         
+        Args:
+            refresh (bool): Run elliott even if cached find-bugs results are valid
+        
         Returns:
             tuple[list, list]: (list of missed CVE tracker bugs from advisories, 
                               list of missed CVE tracker bugs from shipments)
@@ -581,11 +584,11 @@ class CVETrackerOperator:
             shipment_cve_bugs = []
             
             # Check for missed CVE tracker bugs in advisories
-            advisory_cve_bugs = self._am.check_cve_tracker_bug()
+            advisory_cve_bugs = self._am.check_cve_tracker_bug(refresh=refresh)
             
             # Check for missed CVE tracker bugs in shipments if konflux flow
             if self._sd._cs.is_konflux_flow():
-                shipment_cve_bugs = self._sd.check_cve_tracker_bug()
+                shipment_cve_bugs = self._sd.check_cve_tracker_bug(refresh=refresh)
             
             return advisory_cve_bugs, shipment_cve_bugs
         except Exception as e:
@@ -0,0 +1,64 @@
+import os
+import tempfile
+from datetime import datetime, timezone
+
+from dateutil import parser
+
+from oar.core.json_cache import JsonFileCache
+
+ENV_VAR_PYXIS_CACHE_FILE = "OAR_PYXIS_CACHE_FILE"
+DEFAULT_PYXIS_CACHE_FILE = os.path.join(tempfile.gettempdir(), "oar_pyxis_cache.json")
+# entries are fresh for this period unless a shorter TTL is given
+PYXIS_CACHE_TTL = 6 * 60 * 60
+# expired entries are still served for this period while they are refreshed in background
+PYXIS_CACHE_MAX_STALE = 3 * 24 * 60 * 60
+# least recently used entries are evicted above this size
+PYXIS_CACHE_MAX_ENTRIES = 20000
+
+
+def get_freshness_grades_ttl(freshness_grades: list[dict], now: datetime = None, max_ttl: int = PYXIS_CACHE_TTL) -> int:
+    """
+    Get TTL of cached freshness grades aligned to their end dates
+
+    Grade intervals are cached as they are and the effective grade is evaluated when read,
+    so they are valid until the last interval ends. Open ended intervals are valid for max_ttl.
+
+    Args:
+        freshness_grades (list[dict]): freshness grades with start_date and optional end_date
+        now (datetime, optional): current time. Defaults to now.
+        max_ttl (int, optional): max TTL in seconds. Defaults to PYXIS_CACHE_TTL.
+
+    Returns:
+        int: TTL in seconds
+    """
+    if not freshness_grades or any(not fg.get("end_date") for fg in freshness_grades):
+        return max_ttl
+    now = now or datetime.now(timezone.utc)
+    last_end = max(parser.parse(fg["end_date"]) for fg in freshness_grades)
+    return int(max(0, min(max_ttl, (last_end - now).total_seconds())))
+
+
+class PyxisCache(JsonFileCache):
+    """
+    On-disk cache of Pyxis and catalog responses, shared in the process
+
+    Image metadata is keyed by digest, e.g. "image:<digest>", build grades by NVR, e.g. "build:<nvr>".
+    Expired entries are served until PYXIS_CACHE_MAX_STALE while they are refreshed in background.
+    """
+
+    def __init__(self, path: str = DEFAULT_PYXIS_CACHE_FILE, max_entries: int = PYXIS_CACHE_MAX_ENTRIES,
+                 max_stale: int = PYXIS_CACHE_MAX_STALE):
+        super().__init__(path, ttl=PYXIS_CACHE_TTL, max_entries=max_entries, max_stale=max_stale)
+
+    @classmethod
+    def get_instance(cls, path: str = None) -> "PyxisCache":
+        """
+        Get process-wide Pyxis cache of the file path, it is saved at exit
+
+        Args:
+            path (str, optional): Path of the cache file. Defaults to env var OAR_PYXIS_CACHE_FILE or file in temp dir.
+
+        Returns:
+            PyxisCache: shared cache
+        """
+        return super().get_instance(path or os.environ.get(ENV_VAR_PYXIS_CACHE_FILE) or DEFAULT_PYXIS_CACHE_FILE)
@@ -1,8 +1,9 @@
 import logging
 import os
 import re
+import threading
 import time
-from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
 
 import gspread
 from google.oauth2.service_account import Credentials
@@ -12,16 +13,199 @@ from gspread.exceptions import *
 import oar.core.util as util
 from oar.core.configstore import ConfigStore
 from oar.core.const import *
-from oar.core.exceptions import WorksheetException, WorksheetExistsException, JiraUnauthorizedException
+from oar.core.exceptions import WorksheetException, WorksheetExistsException
 from oar.core.jira import JiraManager
 from oar.core.shipment import ShipmentData
 
 logger = logging.getLogger(__name__)
 
 
+# worksheet metadata of report doc is refreshed after this period, to see sheets changed by other processes
+SPREADSHEET_METADATA_TTL = 600
+
+_gspread_cache_lock = threading.RLock()
+# (sa file path, sa file mtime) -> authorized gspread client
+_gspread_clients = {}
+# (sa file path, spreadsheet key) -> CachedSpreadsheet
+_cached_spreadsheets = {}
+
+
+def get_gspread_client(sa_file_path: str) -> gspread.Client:
+    """
+    Get process-wide authorized gspread client of the service account
+
+    The client is authorized once per service account file, access token of the credentials
+    is refreshed automatically by the authorized session when it expires.
+    A new client is authorized when the service account file is changed.
+
+    Args:
+        sa_file_path (str): path of google service account file
+
+    Returns:
+        gspread.Client: authorized gspread client
+
+    Raises:
+        WorksheetException: If SA file is invalid or gspread auth failed
+    """
+    if not sa_file_path or not os.path.isfile(sa_file_path):
+        raise WorksheetException(
+            f"SA file path is invalid: {sa_file_path}")
+
+    cache_key = (os.path.abspath(sa_file_path), os.path.getmtime(sa_file_path))
+    with _gspread_cache_lock:
+        client = _gspread_clients.get(cache_key)
+        if client:
+            return client
+
+        try:
+            cred = Credentials.from_service_account_file(
+                sa_file_path,
+                scopes=[
+                    "https://spreadsheets.google.com/feeds",
+                    "https://www.googleapis.com/auth/drive",
+                ],
+            )
+        except Exception as ce:
+            raise WorksheetException(
+                "init cred with SA file failed") from ce
+
+        try:
+            client = gspread.authorize(
+                cred, client_factory=gspread.client.BackoffClient)
+        except Exception as ge:
+            raise WorksheetException("gspread auth failed") from ge
+
+        # drop clients of outdated SA file
+        for key in [k for k in _gspread_clients if k[0] == cache_key[0]]:
+            del _gspread_clients[key]
+        _gspread_clients[cache_key] = client
+        logger.debug(f"gspread client is authorized with SA file {sa_file_path}")
+        return client
+
+
+def get_cached_spreadsheet(client: gspread.Client, sa_file_path: str, key: str) -> "CachedSpreadsheet":
+    """
+    Get process-wide spreadsheet handle with cached worksheet metadata
+
+    Args:
+        client (gspread.Client): authorized gspread client
+        sa_file_path (str): path of google service account file, the client is authorized with
+        key (str): spreadsheet key
+
+    Returns:
+        CachedSpreadsheet: spreadsheet handle
+    """
+    cache_key = (os.path.abspath(sa_file_path), key)
+    with _gspread_cache_lock:
+        spreadsheet = _cached_spreadsheets.get(cache_key)
+        if spreadsheet is None or spreadsheet.doc.client is not client:
+            spreadsheet = CachedSpreadsheet(client.open_by_key(key))
+            _cached_spreadsheets[cache_key] = spreadsheet
+        return spreadsheet
+
+
+def clear_gspread_cache():
+    """
+    Clear cached gspread clients and spreadsheet handles
+    """
+    with _gspread_cache_lock:
+        _gspread_clients.clear()
+        _cached_spreadsheets.clear()
+
+
+class CachedSpreadsheet:
+    """
+    Spreadsheet handle with worksheet metadata cached by title
+
+    Worksheet metadata is loaded in one request, lookups are local until the metadata expires.
+    When a worksheet is not found, the metadata is reloaded once to see sheets created by other processes.
+    Worksheets created or deleted via this handle update the cache directly.
+    """
+
+    def __init__(self, doc: gspread.Spreadsheet, ttl: int = SPREADSHEET_METADATA_TTL):
+        self.doc = doc
+        self._ttl = ttl
+        self._lock = threading.RLock()
+        self._worksheets = None
+        self._loaded_at = 0
+
+    def refresh(self):
+        """
+        Reload worksheet metadata of spreadsheet
+        """
+        metadata = self.doc.fetch_sheet_metadata()
+        with self._lock:
+            self._worksheets = {
+                sheet["properties"]["title"]: Worksheet(self.doc, sheet["properties"])
+                for sheet in metadata.get("sheets", [])
+            }
+            self._loaded_at = time.monotonic()
+        logger.debug(f"worksheet metadata of {self.doc.id} is loaded, {len(self._worksheets)} sheets")
+
+    def invalidate(self):
+        """
+        Drop cached worksheet metadata, it is reloaded on next lookup
+        """
+        with self._lock:
+            self._worksheets = None
+
+    def _is_expired(self):
+        return self._worksheets is None or time.monotonic() - self._loaded_at > self._ttl
+
+    def worksheet(self, title: str) -> Worksheet:
+        """
+        Get worksheet by title
+
+        Args:
+            title (str): worksheet title
+
+        Returns:
+            Worksheet: worksheet with the title
+
+        Raises:
+            WorksheetNotFound: If worksheet cannot be found after metadata is reloaded
+        """
+        with self._lock:
+            reloaded = self._is_expired()
+            if reloaded:
+                self.refresh()
+            ws = self._worksheets.get(title)
+            if ws is None and not reloaded:
+                self.refresh()
+                ws = self._worksheets.get(title)
+        if ws is None:
+            raise WorksheetNotFound(title)
+        return ws
+
+    def add(self, ws: Worksheet):
+        """
+        Add worksheet created via this handle into cache
+
+        Args:
+            ws (Worksheet): created worksheet
+        """
+        with self._lock:
+            if self._worksheets is not None:
+                self._worksheets[ws.title] = ws
+
+    def remove(self, ws: Worksheet):
+        """
+        Remove worksheet deleted via this handle from cache
+
+        Args:
+            ws (Worksheet): deleted worksheet
+        """
+        with self._lock:
+            if self._worksheets is not None:
+                self._worksheets = {title: w for title, w in self._worksheets.items() if w.id != ws.id}
+
+
 class WorksheetManager:
     """
     WorksheetManager is used to update test report with info provided by ConfigStore
+
+    The authorized gspread client and worksheet metadata of report doc are shared in the process,
+    so creating WorksheetManager per call does not send requests once they are loaded
     """
 
     def __init__(self, cs: ConfigStore):
@@ -32,32 +216,13 @@ class WorksheetManager:
 
         # init gspread instance with scopes an sa file
         sa_file_path = self._cs.get_google_sa_file()
-        if sa_file_path and os.path.isfile(sa_file_path):
-            try:
-                cred = Credentials.from_service_account_file(
-                    sa_file_path,
-                    scopes=[
-                        "https://spreadsheets.google.com/feeds",
-                        "https://www.googleapis.com/auth/drive",
-                    ],
-                )
-            except Exception as ce:
-                raise WorksheetException(
-                    "init cred with SA file failed") from ce
-        else:
-            raise WorksheetException(
-                f"SA file path is invalid: {sa_file_path}")
-
-        try:
-            self._gs = gspread.authorize(
-                cred, client_factory=gspread.client.BackoffClient)
-        except Exception as ge:
-            raise WorksheetException("gspread auth failed") from ge
+        self._gs = get_gspread_client(sa_file_path)
 
         # check template worksheet exists or not
         try:
-            self._doc = self._gs.open_by_key(self._cs.get_report_template())
-            self._template = self._doc.worksheet("template")
+            self._spreadsheet = get_cached_spreadsheet(self._gs, sa_file_path, self._cs.get_report_template())
+            self._doc = self._spreadsheet.doc
+            self._template = self._spreadsheet.worksheet("template")
         except Exception as we:
             raise WorksheetException("cannot find template worksheet") from we
 
@@ -65,66 +230,106 @@ class WorksheetManager:
         """
         Create new report sheet from template
         Update test report with info in ConfigStore
+
+        Jira issues of the bug list are fetched while the template is duplicated,
+        all the cell values, hyperlinks and formats are written in one spreadsheet batchUpdate request
         """
         try:
             # check report worksheet exists or not, if yes, skip duplicating
             try:
-                existing_sheet = self._doc.worksheet(self._cs.release)
+                existing_sheet = self._spreadsheet.worksheet(self._cs.release)
                 if existing_sheet:
                     logger.info(
                         f"test report of {self._cs.release} already exists, url: {existing_sheet.url}")
                     raise WorksheetExistsException()
             except WorksheetNotFound:
-                new_sheet = self._doc.duplicate_sheet(self._template.id)
-                new_sheet.update_title(self._cs.release)
-                self._report = TestReport(new_sheet, self._cs)
-
-            # get required info from config store and populate cell data
-            # update build info
-            build_cell_value = ""
-            candidate_builds = self._cs.get_candidate_builds()
-            if candidate_builds:
-                for k, v in candidate_builds.items():
-                    build_cell_value += f"{k}: {v}\n"
-            # if attr reference_releases! does not have anything, update the cell with empty
-            self._report.update_build_info(build_cell_value.strip())
-            logger.info("build info is updated")
-            logger.debug(f"build info:\n{build_cell_value}")
-
-            # handle cell update for (B2) separately
-            if self._cs.is_konflux_flow():
-                # update shipment MR and RPM advisory link
-                self._report.update_shipment_info()
-                logger.info("shipment info is updated")
-            else:
-                # update advisory info
-                self._report.update_advisory_info()
-                logger.info("advisory info is updated")
-            logger.debug(f"Shipment or advisory info: {self._report.get_advisory_or_shipment_info()}")
+                pass
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # fetch on_qa bugs from jira while the template is being duplicated
+                jira_issues_future = executor.submit(self._get_jira_issues)
+                new_sheet = self._doc.duplicate_sheet(self._template.id, new_sheet_name=self._cs.release)
+                self._spreadsheet.add(new_sheet)
+
+            try:
+                self._report = TestReport(new_sheet, self._cs, auto_flush=False)
+                jira_issue_keys, jira_issues = jira_issues_future.result()
+
+                # get required info from config store and populate cell data
+                # update build info
+                build_cell_value = ""
+                candidate_builds = self._cs.get_candidate_builds()
+                if candidate_builds:
+                    for k, v in candidate_builds.items():
+                        build_cell_value += f"{k}: {v}\n"
+                # if attr reference_releases! does not have anything, update the cell with empty
+                self._report.update_build_info(build_cell_value.strip())
+                logger.debug(f"build info:\n{build_cell_value}")
+
+                # handle cell update for (B2) separately
+                if self._cs.is_konflux_flow():
+                    # update shipment MR and RPM advisory link
+                    self._report.update_shipment_info()
+                else:
+                    # update advisory info
+                    self._report.update_advisory_info()
+
+                # update jira info
+                self._report.update_jira_info(self._cs.get_jira_ticket())
+                logger.debug(f"jira info:\n{self._cs.get_jira_ticket()}")
 
-            # update jira info
-            self._report.update_jira_info(self._cs.get_jira_ticket())
-            logger.info("jira info is updated")
-            logger.debug(f"jira info:\n{self._cs.get_jira_ticket()}")
+                # update on_qa bugs list
+                self._report.generate_bug_list(jira_issue_keys, jira_issues)
 
-            # update on_qa bugs list
-            shipment = ShipmentData(self._cs)
-            self._report.generate_bug_list(shipment.get_jira_issues())
+                # add test results links
+                self._report.create_test_results_links()
 
-            # add test results links
-            self._report.create_test_results_links()
+                # write all the cells in one request, later updates are flushed immediately
+                self._report.flush()
+                self._report._auto_flush = True
+                logger.info("build info, shipment or advisory info, jira info, bug list and test results links are updated")
+            except Exception:
+                # remove the incomplete sheet, otherwise the next run finds it and skips creating the report
+                self._delete_sheet(new_sheet)
+                raise
 
         except Exception as ge:  # catch all the exceptions here
             raise WorksheetException("create test report failed") from ge
 
         return self._report
 
+    def _delete_sheet(self, ws: Worksheet):
+        """
+        Delete worksheet from report doc and cached metadata, failure is logged only
+
+        Args:
+            ws (Worksheet): worksheet to delete
+        """
+        try:
+            self._doc.del_worksheet(ws)
+            logger.info(f"deleted incomplete test report sheet {ws.title}")
+        except Exception as e:
+            logger.warning(f"failed to delete incomplete test report sheet {ws.title}: {e}")
+        finally:
+            self._spreadsheet.remove(ws)
+
+    def _get_jira_issues(self):
+        """
+        Get jira issue keys from shipment and fetch the issues in bulk
+
+        Returns:
+            tuple[list[str], dict]: jira issue keys and accessible jira issues by key
+        """
+        jira_issue_keys = ShipmentData(self._cs).get_jira_issues()
+        return jira_issue_keys, JiraManager(self._cs).get_issues(jira_issue_keys)
+
     def get_test_report(self):
         """
-        Get test report impl with release version in config store
+        Get test report impl with release version in config store,
+        the worksheet is looked up in cached metadata of report doc
         """
         try:
-            ws = self._doc.worksheet(self._cs.release)
+            ws = self._spreadsheet.worksheet(self._cs.release)
         except Exception as e:
             raise WorksheetException(
                 f"cannot find worksheet {self._cs.release} in report doc"
@@ -138,6 +343,7 @@ class WorksheetManager:
         """
         try:
             self._doc.del_worksheet(self._report._ws)
+            self._spreadsheet.remove(self._report._ws)
         except Exception as e:
             raise WorksheetException(
                 f"delete worksheet {self._report._ws.title} failed"
@@ -147,11 +353,200 @@ class WorksheetManager:
 class TestReport:
     """
     Wrapper of worksheet to update test report easily
+
+    Cell values of the report are read from a local snapshot loaded in one batch_get request,
+    updated cells are tracked as dirty and written in one batch_update request by flush().
+    Cells with hyperlink text format runs are written together with the dirty cells
+    in one spreadsheet batchUpdate request.
+    With auto_flush enabled, every update method flushes the dirty cells before returning.
     """
 
-    def __init__(self, ws: Worksheet, cs: ConfigStore):
+    def __init__(self, ws: Worksheet, cs: ConfigStore, auto_flush: bool = True):
         self._ws = ws
         self._cs = cs
+        self._auto_flush = auto_flush
+        self._snapshot = None
+        self._snapshot_max_row = 0
+        self._dirty = {}
+        self._dirty_rich = {}
+
+    def refresh(self):
+        """
+        Load snapshot of report regions from worksheet in one request, pending changes are kept
+        """
+        snapshot = {}
+        max_row = 0
+        try:
+            value_ranges = self._ws.batch_get([LABEL_REPORT_FIXED_RANGE, LABEL_REPORT_TABLE_RANGE])
+        except Exception as e:
+            raise WorksheetException("load test report snapshot failed") from e
+        for range_name, values in zip([LABEL_REPORT_FIXED_RANGE, LABEL_REPORT_TABLE_RANGE], value_ranges):
+            first_row, first_col = gspread.utils.a1_to_rowcol(range_name.split(":")[0])
+            for i, row in enumerate(values):
+                for j, value in enumerate(row):
+                    snapshot[gspread.utils.rowcol_to_a1(first_row + i, first_col + j)] = value
+                max_row = max(max_row, first_row + i)
+
+        # keep pending changes visible in the snapshot
+        for label, value in self._dirty.items():
+            snapshot[label] = self._display_value(value)
+            max_row = max(max_row, gspread.utils.a1_to_rowcol(label)[0])
+        for label, (text, _, _) in self._dirty_rich.items():
+            snapshot[label] = text
+            max_row = max(max_row, gspread.utils.a1_to_rowcol(label)[0])
+
+        self._snapshot = snapshot
+        self._snapshot_max_row = max_row
+        logger.debug(f"test report snapshot is loaded, {len(snapshot)} cells")
+
+    def flush(self):
+        """
+        Write all dirty cells to worksheet in one request
+
+        If there are cells with hyperlink text format runs, all the dirty cells are written
+        in one spreadsheet batchUpdate request, when it fails the hyperlink cells fall back
+        to plain text with URLs.
+
+        Raises:
+            WorksheetException: If dirty cells cannot be written
+        """
+        if not self._dirty and not self._dirty_rich:
+            return
+        if self._dirty_rich:
+            try:
+                self._ws.spreadsheet.batch_update({"requests": self._get_update_cells_requests()})
+            except Exception as e:
+                logger.warning(f"Advanced hyperlink formatting failed, falling back to plain text with URLs: {e}")
+                for label, (_, _, plain_text) in self._dirty_rich.items():
+                    self._dirty[label] = plain_text
+                    if self._snapshot is not None:
+                        self._snapshot[label] = plain_text
+                self._dirty_rich = {}
+            else:
+                logger.debug(f"{len(self._dirty) + len(self._dirty_rich)} dirty cells are flushed to test report")
+                self._dirty = {}
+                self._dirty_rich = {}
+                return
+
+        data = [{"range": label, "values": [[value]]} for label, value in self._dirty.items()]
+        try:
+            self._ws.batch_update(
+                data,
+                value_input_option=gspread.utils.ValueInputOption.user_entered,
+            )
+        except Exception as e:
+            raise WorksheetException(f"update cells {list(self._dirty.keys())} failed") from e
+        logger.debug(f"{len(data)} dirty cells are flushed to test report")
+        self._dirty = {}
+
+    def _get_update_cells_requests(self):
+        """
+        Build updateCells requests of all dirty cells for spreadsheet batchUpdate
+
+        Returns:
+            list[dict]: updateCells requests
+        """
+        requests = []
+        for label, value in self._dirty.items():
+            if isinstance(value, str) and value.startswith("="):
+                user_entered_value = {"formulaValue": value}
+            elif isinstance(value, bool):
+                user_entered_value = {"boolValue": value}
+            elif isinstance(value, (int, float)):
+                user_entered_value = {"numberValue": value}
+            else:
+                user_entered_value = {"stringValue": "" if value is None else str(value)}
+            requests.append(self._to_update_cells_request(label, {"userEnteredValue": user_entered_value}, "userEnteredValue"))
+        for label, (text, text_format_runs, _) in self._dirty_rich.items():
+            requests.append(self._to_update_cells_request(
+                label,
+                {
+                    "userEnteredValue": {"stringValue": text},
+                    "textFormatRuns": text_format_runs
+                },
+                "*",
+            ))
+        return requests
+
+    def _to_update_cells_request(self, label, cell_data, fields):
+        row, col = gspread.utils.a1_to_rowcol(label)
+        return {
+            "updateCells": {
+                "rows": [{"values": [cell_data]}],
+                "range": {
+                    "sheetId": self._ws.id,
+                    "startRowIndex": row - 1,
+                    "endRowIndex": row,
+                    "startColumnIndex": col - 1,
+                    "endColumnIndex": col
+                },
+                "fields": fields
+            }
+        }
+
+    def _get_cell(self, label):
+        """
+        Get cell value from snapshot, load snapshot if it is not loaded yet
+        """
+        if self._snapshot is None:
+            self.refresh()
+        return self._snapshot.get(label)
+
+    def _set_cell(self, label, value):
+        """
+        Update cell value in snapshot and mark the cell dirty,
+        the snapshot is not loaded for writes, pending changes are merged when it is loaded
+        """
+        self._dirty[label] = value
+        self._dirty_rich.pop(label, None)
+        self._update_snapshot(label, self._display_value(value))
+
+    def _set_rich_cell(self, label, text, text_format_runs, plain_text):
+        """
+        Update cell text with format runs in snapshot and mark the cell dirty
+
+        Args:
+            label (str): cell label
+            text (str): cell text
+            text_format_runs (list[dict]): text format runs of the cell
+            plain_text (str): fallback text used when format runs cannot be applied
+        """
+        self._dirty_rich[label] = (text, text_format_runs, plain_text)
+        self._dirty.pop(label, None)
+        self._update_snapshot(label, text)
+
+    def _update_snapshot(self, label, value):
+        if self._snapshot is not None:
+            self._snapshot[label] = value
+            self._snapshot_max_row = max(self._snapshot_max_row, gspread.utils.a1_to_rowcol(label)[0])
+
+    def _auto_flush_cells(self):
+        if self._auto_flush:
+            self.flush()
+
+    def _get_column_values(self, column, first_row):
+        """
+        Get cell values of column from snapshot, from first row to the last loaded row
+
+        Returns:
+            list[str]: cell values, empty string for empty cell
+        """
+        if self._snapshot is None:
+            self.refresh()
+        values = [self._snapshot.get(f"{column}{row}") or "" for row in range(first_row, self._snapshot_max_row + 1)]
+        while values and not values[-1]:
+            values.pop()
+        return values
+
+    def _display_value(self, value):
+        """
+        Get displayed value of cell, i.e. label of hyperlink formula
+        """
+        if isinstance(value, str):
+            match = re.match(r'^=HYPERLINK\("[^"]*",\s*"([^"]*)"\)$', value)
+            if match:
+                return match.group(1)
+        return value
 
     def get_url(self):
         """
@@ -213,7 +608,7 @@ class TestReport:
         """
         Get shipment info from test report
         """
-        return self._ws.acell(LABEL_AD_OR_SHIPMENT).value
+        return self._get_cell(LABEL_AD_OR_SHIPMENT)
 
     def update_build_info(self, build):
         """
@@ -222,13 +617,14 @@ class TestReport:
         Args:
             build (str): nightly build info
         """
-        self._ws.update_acell(LABEL_BUILD, build)
+        self._set_cell(LABEL_BUILD, build)
+        self._auto_flush_cells()
 
     def get_build_info(self):
         """
         Get candidate nightly build info from test report
         """
-        return self._ws.acell(LABEL_BUILD).value
+        return self._get_cell(LABEL_BUILD)
 
     def update_jira_info(self, jira):
         """
@@ -237,53 +633,61 @@ class TestReport:
         Args:
             jira (str): jira ticket key
         """
-        self._ws.update_acell(
+        self._set_cell(
             LABEL_JIRA,
             self._to_hyperlink(util.get_jira_link(jira), jira),
         )
+        self._auto_flush_cells()
 
     def get_jira_info(self):
         """
         Get jira ticket created by ART team
         """
-        return self._ws.acell(LABEL_JIRA).value
+        return self._get_cell(LABEL_JIRA)
 
     def update_overall_status_to_red(self):
         """
         Update overall status to Red
         """
-        self._ws.update_acell(LABEL_OVERALL_STATUS, OVERALL_STATUS_RED)
+        self._set_cell(LABEL_OVERALL_STATUS, OVERALL_STATUS_RED)
+        self._auto_flush_cells()
         logger.info("Overall status is updated to Red")
 
     def update_overall_status_to_green(self):
         """
         Update overall status to Green
         """
-        self._ws.update_acell(LABEL_OVERALL_STATUS, OVERALL_STATUS_GREEN)
+        self._set_cell(LABEL_OVERALL_STATUS, OVERALL_STATUS_GREEN)
+        self._auto_flush_cells()
         logger.info("Overall status is updated to Green")
 
     def get_overall_status(self):
         """
         Get overall status value
         """
-        return self._ws.acell(LABEL_OVERALL_STATUS).value
+        return self._get_cell(LABEL_OVERALL_STATUS)
 
     def update_task_status(self, label, status):
         """
         Update task status in check list
         e.g. Pass/Fail/In Progress
 
+        The snapshot is refreshed first, because overall status depends on status
+        of all tasks which can be updated by other processes
+
         Args:
             label (str): cell label, A1/B2
             status (str): Pass/Fail/In Progress
         """
         label = self.transform_cell_labels(label)
-        self._ws.update_acell(label, status)
-        task_name = self._ws.acell("A" + label[1:]).value
+        self.refresh()
+        self._set_cell(label, status)
+        task_name = self._get_cell("A" + label[1:])
         logger.info(f"task [{task_name}] status is changed to [{status}]")
         # if any task is failed, update overall status to Red
         if self.is_task_fail(label):
-            self.update_overall_status_to_red()
+            self._set_cell(LABEL_OVERALL_STATUS, OVERALL_STATUS_RED)
+            logger.info("Overall status is updated to Red")
         else:
             # if no failed cases, update overall status to Green
             if status != TASK_STATUS_INPROGRESS:
@@ -296,7 +700,9 @@ class TestReport:
                     logger.debug(
                         "there is no failed task and overall status is Red, will update overall status to Green"
                     )
-                    self.update_overall_status_to_green()
+                    self._set_cell(LABEL_OVERALL_STATUS, OVERALL_STATUS_GREEN)
+                    logger.info("Overall status is updated to Green")
+        self._auto_flush_cells()
 
     def transform_cell_labels(self, label) -> str:
         """
@@ -332,7 +738,7 @@ class TestReport:
             label (str): cell label of different tasks
         """
         label = self.transform_cell_labels(label)
-        return self._ws.acell(label).value
+        return self._get_cell(label)
 
     def is_task_in_progress(self, label):
         """
@@ -388,45 +794,35 @@ class TestReport:
         """
         return OVERALL_STATUS_RED == self.get_overall_status()
 
-    def generate_bug_list(self, jira_issues: list[str]):
+    def generate_bug_list(self, jira_issues: list[str], issues: dict = None):
         """
         Generate bug list of on_qa bugs
 
         Args:
             jira_issues (list[str]): jira issue keys from advisories
+            issues (dict, optional): jira issues already fetched by key, fetched in bulk if not provided
         """
         logger.info("waiting for the bugs to be verified to update in sheet")
-        jm = JiraManager(self._cs)
-        row_idx = 8
-        batch_vals = []
+        if issues is None:
+            issues = JiraManager(self._cs).get_issues(jira_issues)
+        first_row, _ = gspread.utils.a1_to_rowcol(LABEL_BUG_FIRST_CELL)
+        row_idx = first_row
         for key in jira_issues:
-            try:
-                issue = jm.get_issue(key)
-            except JiraUnauthorizedException:  # jira token does not have permission to access security bugs, ignore it
+            issue = issues.get(key)
+            if issue is None:  # jira token does not have permission to access security bugs, ignore it
                 continue
             logger.debug(f"updating jira issue {key} ...")
             if issue.is_on_qa():
                 logger.debug(f"jira issue {key} is ON_QA, updating")
-                row_vals = []
-                row_vals.append(self._to_hyperlink(
-                    util.get_jira_link(key), key))
-                row_vals.append(issue.get_qa_contact())
-                row_vals.append(issue.get_status())
-                batch_vals.append(row_vals)
+                self._set_cell(f"C{row_idx}", self._to_hyperlink(util.get_jira_link(key), key))
+                self._set_cell(f"D{row_idx}", issue.get_qa_contact())
+                self._set_cell(f"E{row_idx}", issue.get_status())
                 row_idx += 1
             else:
                 logger.debug(
                     f"jira issue {key} status is {issue.get_status()}, skipping"
                 )
-        self._ws.batch_update(
-            [
-                {
-                    "range": LABEL_BUG_FIRST_CELL + ":E" + str(row_idx),
-                    "values": batch_vals,
-                }
-            ],
-            value_input_option=gspread.utils.ValueInputOption.user_entered,
-        )
+        self._auto_flush_cells()
         # TODO: highlight the cell if the issue is critical
 
         logger.info("bugs to be verified are updated")
@@ -436,6 +832,9 @@ class TestReport:
         Update existing bug status in report
         Append new ON_QA bugs
 
+        The bug table is read in one request, compared with jira issues fetched in bulk
+        and all the changes are written in one batch update
+
         Args:
             jira_issues (list): updated jira issues
             dropped_issues (list): list of dropped issue keys (optional)
@@ -443,36 +842,35 @@ class TestReport:
         if dropped_issues is None:
             dropped_issues = []
         jm = JiraManager(self._cs)
-        # iterate cell value from C8 in colum C, update existing bug status
-        existing_bugs = []
+        try:
+            bug_rows = self._get_bug_table()
+            existing_bugs = [row[0] for row in bug_rows]
+            new_bugs = [key for key in jira_issues if key not in existing_bugs]
+            issues = jm.get_issues(existing_bugs + new_bugs)
+        except Exception as e:
+            raise WorksheetException("get bug list failed") from e
+
+        # iterate rows from C8, update existing bug status
         row_idx = 8
-        while True:
-            bug_key = self._ws.acell("C" + str(row_idx)).value
-            bug_qa_contact = self._ws.acell("D" + str(row_idx)).value
-            bug_status = self._ws.acell("E" + str(row_idx)).value
-            # if bug_key is empty exit the loop. i.e. at the end of bug list
-            if not bug_key:
-                break
+        for bug_key, bug_qa_contact, bug_status in bug_rows:
             logger.info(f"found existing bug {bug_key} in report, checking...")
-            try:
-                issue = jm.get_issue(bug_key)
+            issue = issues.get(bug_key)
+            # issue is not accessible due to permission issue, ignore it
+            if issue:
                 # check QA contact of bug and update if needed
                 if bug_qa_contact != issue.get_qa_contact():
-                    self._ws.update_acell(
-                        "D" + str(row_idx), issue.get_qa_contact())
+                    self._set_cell(f"D{row_idx}", issue.get_qa_contact())
                     logger.info(
                         f"QA contact of bug {issue.get_key()} is updated to {issue.get_qa_contact()}"
                     )
                 # check bug status is updated or not. if yes, update it accordingly
                 if bug_status != issue.get_status():
-                    self._ws.update_acell(
-                        "E" + str(row_idx), issue.get_status())
+                    self._set_cell(f"E{row_idx}", issue.get_status())
                     logger.info(
                         f"status of bug {issue.get_key()} is updated to {issue.get_status()}"
                     )
                 elif bug_key not in jira_issues or bug_key in dropped_issues:
-                    self._ws.update_acell(
-                        "E" + str(row_idx), JIRA_STATUS_DROPPED)
+                    self._set_cell(f"E{row_idx}", JIRA_STATUS_DROPPED)
                     logger.info(f"bug {bug_key} is dropped")
                 else:
                     logger.info(f"bug status of {bug_key} is not changed")
@@ -480,59 +878,37 @@ class TestReport:
                     logger.warning(
                         f"jira issue {issue.get_key()} is cve tracker: {issue.is_cve_tracker()}, it must be verified"
                     )
-            except JiraUnauthorizedException:
-                pass
-            except Exception as e:
-                raise WorksheetException(
-                    f"update bug {bug_key} status failed") from e
-
-            existing_bugs.append(bug_key)
             row_idx += 1
 
-        try:
-            start_idx = row_idx
-            batch_vals = []
-            for key in jira_issues:
-                if key not in existing_bugs:
-                    try:
-                        issue = jm.get_issue(key)
-                    except JiraUnauthorizedException:  # ignore the bug that cannot be accessed due to permission issue
-                        continue
-                    if issue.is_on_qa():
-                        logger.info(f"found new ON_QA bug {key}")
-                        row_vals = []
-                        row_vals.append(
-                            self._to_hyperlink(util.get_jira_link(key), key)
-                        )
-                        row_vals.append(issue.get_qa_contact())
-                        row_vals.append(issue.get_status())
-                        batch_vals.append(row_vals)
-                        row_idx += 1
+        # append new ON_QA bugs
+        new_bug_count = 0
+        for key in new_bugs:
+            issue = issues.get(key)
+            # ignore the bug that cannot be accessed due to permission issue
+            if issue and issue.is_on_qa():
+                logger.info(f"found new ON_QA bug {key}")
+                self._set_cell(f"C{row_idx}", self._to_hyperlink(util.get_jira_link(key), key))
+                self._set_cell(f"D{row_idx}", issue.get_qa_contact())
+                self._set_cell(f"E{row_idx}", issue.get_status())
+                new_bug_count += 1
+                row_idx += 1
 
-            if len(batch_vals) > 0:
-                self._ws.batch_update(
-                    [
-                        {
-                            "range": "C{}:E{}".format(str(start_idx), str(row_idx)),
-                            "values": batch_vals,
-                        }
-                    ],
-                    value_input_option=gspread.utils.ValueInputOption.user_entered,
-                )
-                logger.info("all new ON_QA bugs are appended to the report")
+        try:
+            self._auto_flush_cells()
         except Exception as e:
-            raise WorksheetException("update new ON_QA bugs failed") from e
+            raise WorksheetException("update bug list failed") from e
+
+        if new_bug_count > 0:
+            logger.info("all new ON_QA bugs are appended to the report")
 
     def are_all_bugs_verified(self):
         """
         Check all bugs are verified
         """
         logger.info("checking all bugs are verified")
-        row_idx = 8
         verified = True
         try:
-            while True:
-                status = self._ws.acell("E" + str(row_idx)).value
+            for bug_key, _, status in self._get_bug_table():
                 if not status:
                     break
                 if status not in [
@@ -541,10 +917,8 @@ class TestReport:
                     JIRA_STATUS_DROPPED,
                 ]:
                     verified = False
-                    bug_key = self._ws.acell("C" + str(row_idx)).value
                     logger.debug(f"found not verified bug {bug_key}:{status}")
                     break
-                row_idx += 1
         except Exception as e:
             raise WorksheetException("iterate bug status failed") from e
 
@@ -552,6 +926,22 @@ class TestReport:
 
         return verified
 
+    def _get_bug_table(self):
+        """
+        Get rows of bug table (C8:E) from snapshot, stops at the first row without bug key
+
+        Returns:
+            list[list[str]]: rows of [bug key, QA contact, status]
+        """
+        rows = []
+        first_row, _ = gspread.utils.a1_to_rowcol(LABEL_BUG_FIRST_CELL)
+        for row_idx, bug_key in enumerate(self._get_column_values("C", first_row), start=first_row):
+            # if bug key is empty, it is the end of bug list
+            if not bug_key:
+                break
+            rows.append([bug_key, self._get_cell(f"D{row_idx}") or "", self._get_cell(f"E{row_idx}") or ""])
+        return rows
+
     def append_missed_cve_tracker_bugs(self, cve_tracker_bugs):
         """
         Append missed CVE tracker bugs
@@ -562,7 +952,7 @@ class TestReport:
 
         row_idx = 8
         while True:
-            cell_value = self._ws.acell("F" + str(row_idx)).value
+            cell_value = self._get_cell("F" + str(row_idx))
             if not cell_value:
                 break
             else:
@@ -576,11 +966,12 @@ class TestReport:
             row_idx += 1
 
         for bug in cve_tracker_bugs:
-            self._ws.update_acell(
+            self._set_cell(
                 "F" + str(row_idx), self._to_hyperlink(util.get_jira_link(bug), bug)
             )
             row_idx += 1
             logger.info(f"append missed CVE tracker bug {bug} to test report")
+        self._auto_flush_cells()
 
         # if cve_tracker_bugs list is not empty, it means a new tracker bug is found
         # we need to send out notification
@@ -609,9 +1000,10 @@ class TestReport:
         jira_hyperlink = self._to_hyperlink(
             util.get_jira_link(jira_key), jira_key)
 
+        self._set_cell(f"{LABEL_ISSUES_OTHERS_COLUMN}{row_idx}", jira_hyperlink)
         for attempt in range(1, max_retries + 1):
             try:
-                self._ws.update_acell(f"{LABEL_ISSUES_OTHERS_COLUMN}{row_idx}", jira_hyperlink)
+                self.flush()
                 logger.info(f"Jira {jira_key} was added to test report")
                 break
             except Exception as e:
@@ -622,8 +1014,8 @@ class TestReport:
                     logger.error(f"Adding jira {jira_key} to test report failed after all retries: {e}")
 
     def create_test_results_links(self):
-        self._ws.update_acell(LABEL_BLOCKING_TESTS, "Blocking jobs")
-        self._ws.update_acell(
+        self._set_cell(LABEL_BLOCKING_TESTS, "Blocking jobs")
+        self._set_cell(
             LABEL_BLOCKING_TESTS_RELEASE,
             self._to_hyperlink(
                 util.get_ocp_test_result_url(self._cs.release),
@@ -639,26 +1031,27 @@ class TestReport:
                 util.get_ocp_test_result_url(cb),
                 f"ocp-test-result-{cb}"
             )
-        self._ws.update_acell(
+        self._set_cell(
             LABEL_BLOCKING_TESTS_CANDIDATE,
             candidate_build_cell_value
         )
 
-        self._ws.update_acell(LABEL_SIPPY, "Sippy")
-        self._ws.update_acell(
+        self._set_cell(LABEL_SIPPY, "Sippy")
+        self._set_cell(
             LABEL_SIPPY_MAIN,
             self._to_hyperlink(
                 util.get_qe_sippy_main_view_url(self._cs.release),
                 f"{util.get_y_release(self._cs.release)}-qe-main"
             )
         )
-        self._ws.update_acell(
+        self._set_cell(
             LABEL_SIPPY_AUTO_RELEASE,
             self._to_hyperlink(
                 util.get_qe_sippy_auto_release_view_url(self._cs.release),
                 f"{util.get_y_release(self._cs.release)}-qe-auto-release"
             )
         )
+        self._auto_flush_cells()
 
     def _get_issues_from_others_section(self):
         """
@@ -667,8 +1060,7 @@ class TestReport:
         Returns:
             list[str]: list of issue keys
         """
-        range_values = self._ws.get_values(f"{LABEL_ISSUES_OTHERS_COLUMN}{LABEL_ISSUES_OTHERS_ROW}:{LABEL_ISSUES_OTHERS_COLUMN}")
-        return list(chain.from_iterable(range_values))
+        return self._get_column_values(LABEL_ISSUES_OTHERS_COLUMN, LABEL_ISSUES_OTHERS_ROW)
 
     def _to_hyperlink(self, link, label):
         return f'=HYPERLINK("{link}","{label}")'
@@ -723,6 +1115,9 @@ class TestReport:
             raise WorksheetException("links_data must be a list")
         if len(links_data) == 0:
             raise WorksheetException("links_data cannot be empty")
+
+        # Plain text with URLs is used when advanced formatting cannot be applied
+        plain_text = "\n".join([f"{item[0]} ({item[1]})" for item in links_data])
         try:
             # Try advanced formatting first
             text = "\n".join([item[0] for item in links_data])  # Extract just the display text
@@ -770,35 +1165,9 @@ class TestReport:
                             "startIndex": remaining_text_start,
                             "format": {}
                         })
-
-            # Convert cell label to row and column indices
-            row, col = gspread.utils.a1_to_rowcol(cell_label)
-            
-            requests = [{
-                "updateCells": {
-                    "rows": [{
-                        "values": [{
-                            "userEnteredValue": {"stringValue": text},
-                            "textFormatRuns": text_format_runs
-                        }]
-                    }],
-                    "range": {
-                        "sheetId": self._ws.id,
-                        "startRowIndex": row - 1,
-                        "endRowIndex": row,
-                        "startColumnIndex": col - 1,
-                        "endColumnIndex": col
-                    },
-                    "fields": "*"
-                }
-            }]
-            self._ws.spreadsheet.batch_update({"requests": requests})
         except Exception as e:
             logger.warning(f"Advanced hyperlink formatting failed, falling back to plain text with URLs: {e}")
-            # Fall back to plain text with URLs
-            plain_text = []
-            for item in links_data:
-                display_text = item[0]
-                link = item[1]
-                plain_text.append(f"{display_text} ({link})")
-            self._ws.update_acell(cell_label, "\n".join(plain_text))
+            self._set_cell(cell_label, plain_text)
+        else:
+            self._set_rich_cell(cell_label, text, text_format_runs, plain_text)
+        self._auto_flush_cells()
@@ -3,6 +3,7 @@ import sys
 import click
 import requests
 
+from oar.core.pyxis_cache import PyxisCache
 from oar.image_consistency_check.image import ImageMetadata
 from oar.image_consistency_check.payload import Payload, PayloadImage
 from oar.image_consistency_check.shipment import ShipmentComponent, Shipment
@@ -10,6 +11,9 @@ from oar.image_consistency_check.shipment import ShipmentComponent, Shipment
 
 logger = logging.getLogger(__name__)
 
+# released images are immutable, found catalog repositories are cached for this period
+CATALOG_RELEASED_IMAGE_TTL = 7 * 24 * 60 * 60
+
 
 class ImageConsistencyChecker:
 
@@ -89,34 +93,85 @@ class ImageConsistencyChecker:
             logger.info(f"Payload image {payload_image.name} with pullspec {payload_image.pullspec} is not in the shipment")
             return False
 
-    def _is_payload_image_released(self, payload_image: PayloadImage) -> bool:
+    def _get_catalog_repositories(self, payload_images: list[PayloadImage]) -> dict[str, list[str]]:
+        """
+        Get repositories of the payload images in Red Hat catalog, the cache is updated once for all images.
+
+        Args:
+            payload_images (list[PayloadImage]): The payload images
+
+        Returns:
+            dict[str, list[str]]: Repositories by image digest, images not released yet are excluded
+        """
+        images = {f"catalog:{self.all_image_metadata[image.pullspec].digest}": image for image in payload_images}
+        if not images:
+            return {}
+
+        def fetch(keys):
+            found = {}
+            for key in keys:
+                repositories = self._query_catalog_repositories(images[key], key.split(":", 1)[1])
+                # images not released yet are not cached
+                found[key] = (repositories, CATALOG_RELEASED_IMAGE_TTL if repositories else None)
+            return found
+
+        return {
+            key.split(":", 1)[1]: repositories
+            for key, repositories in PyxisCache.get_instance().get_many(list(images), fetch).items()
+            if repositories
+        }
+
+    def _is_payload_image_released(self, payload_image: PayloadImage, catalog_repositories: dict[str, list[str]] = None) -> bool:
         """
         Check if the payload image is released in Red Hat catalog.
 
         Args:
             payload_image (PayloadImage): The payload image
+            catalog_repositories (dict[str, list[str]], optional): Repositories by image digest from
+                _get_catalog_repositories, the image is looked up in Red Hat catalog if not given
 
         Returns:
             bool: True if only one image is found in Red Hat catalog, False otherwise
         """
-        payload_image_digest = self.all_image_metadata[payload_image.pullspec].digest
-        url = f"https://catalog.redhat.com/api/containers/v1/images?filter=image_id=={payload_image_digest}"
+        if catalog_repositories is None:
+            catalog_repositories = self._get_catalog_repositories([payload_image])
+        repositories = catalog_repositories.get(self.all_image_metadata[payload_image.pullspec].digest)
+
+        if repositories:
+            logger.info(f"Image {payload_image.name} with pullspec {payload_image.pullspec} found in Red Hat catalog.")
+            for repo in repositories:
+                logger.info(f"Repository: {repo}")
+            return True
+        return False
+
+    def _query_catalog_repositories(self, payload_image: PayloadImage, digest: str) -> list[str]:
+        """
+        Query repositories of the image in Red Hat catalog.
+
+        Args:
+            payload_image (PayloadImage): The payload image
+            digest (str): The image digest
+
+        Returns:
+            list[str]: Repositories of the image, empty if the image is not found or the query failed
+        """
+        url = f"https://catalog.redhat.com/api/containers/v1/images?filter=image_id=={digest}"
         logger.debug(f"Checking payload pullspec: {payload_image.name} with pullspec {payload_image.pullspec} in Red Hat catalog. URL: {url}")
         resp = requests.get(url)
         if resp.ok:
             resp_data = resp.json()
             if resp_data["total"] > 0:
-                logger.info(f"Image {payload_image.name} with pullspec {payload_image.pullspec} found in Red Hat catalog.")
-                for data in resp_data["data"]:
-                    for repo in data["repositories"]:
-                        logger.info(f"Repository: {repo["registry"]}/{repo["repository"]}")
-                return True
+                return [
+                    f"{repo['registry']}/{repo['repository']}"
+                    for data in resp_data["data"]
+                    for repo in data["repositories"]
+                ]
             else:
                 logger.error(f"No image found in Red Hat catalog.")
-                return False
+                return []
         else:
             logger.error(f"Access to catalog.redhat.com failed. Status code: {resp.status_code}, Reason: {resp.reason}")
-            return False
+            return []
 
     def _find_images_with_same_name(self, payload_image: PayloadImage) -> None:
         """
@@ -145,15 +200,22 @@ class ImageConsistencyChecker:
             bool: True if the images in payload are found in the shipment or Red Hat catalog, False otherwise
         """
         all_payload_images_ok = True
+        not_in_shipment = []
         for image in self.payload_images:
             logger.info(f"Checking payload image {image.name} with pullspec {image.pullspec}")
             self.all_image_metadata[image.pullspec].log_details()
             if self._is_payload_image_in_shipment(image):
                 logger.info(f"Passed. Found in the Shipment")
-            elif self._is_payload_image_released(image):
+            else:
+                not_in_shipment.append(image)
+
+        # images not in the shipment are looked up in Red Hat catalog together
+        catalog_repositories = self._get_catalog_repositories(not_in_shipment)
+        for image in not_in_shipment:
+            if self._is_payload_image_released(image, catalog_repositories):
                 logger.info(f"Passed. Found in Red Hat catalog")
             else:
-                logger.error(f"Failed. Not found in the Shipment and Red Hat catalog")
+                logger.error(f"Failed. Payload image {image.name} with pullspec {image.pullspec} not found in the Shipment and Red Hat catalog")
                 self._find_images_with_same_name(image)
                 all_payload_images_ok = False
         logger.info(f"Checked {len(self.payload_images)} payload images")
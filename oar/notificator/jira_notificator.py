@@ -1,8 +1,12 @@
 import click
+import json
 import logging
 import os
 import re
+import tempfile
+import threading
 
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import List, Optional, Dict
 from jira import JIRA, Issue
@@ -10,6 +14,7 @@ from jira.resources import User
 from datetime import datetime, timedelta, timezone
 from dateutil import parser
 from github import Auth, Github
+from oar.core.business_hours import BusinessCalendar
 from oar.core.jira import JiraIssue
 from oar.core.ldap import LdapHelper
 
@@ -17,6 +22,21 @@ logger = logging.getLogger(__name__)
 
 ERT_NOTIFICATION_PREFIX = "Errata Reliability Team Notification"
 ERT_ALL_NOTIFIED_ONQA_PENDING_LABEL = "ert:pending-onqa-over-96hrs"
+DEFAULT_STATE_FILE = os.path.join(tempfile.gettempdir(), "oar_jira_notificator_state.json")
+# JQL interprets dates in the timezone of the Jira user, so the watermark is moved back
+# by a full day to never miss an update regardless of the configured timezone.
+WATERMARK_OVERLAP = timedelta(days=1)
+DEFAULT_MAX_WORKERS = 8
+# Maximum number of concurrent requests per backend shared by all workers
+JIRA_MAX_CONCURRENT_REQUESTS = 4
+GITHUB_MAX_CONCURRENT_REQUESTS = 4
+LDAP_MAX_CONCURRENT_REQUESTS = 2
+# Number of pull requests fetched in a single GitHub GraphQL query
+PR_LABELS_BATCH_SIZE = 50
+# Fields needed to process ON_QA issues, the changelog is fetched separately only when needed
+ON_QA_ISSUE_FIELDS = ["status", "labels", "updated", "comment", "assignee", "reporter", "customfield_10470", "customfield_10482"]
+CHANGELOG_PAGE_SIZE = 100
+OPENSHIFT_PR_URL_PATTERN = re.compile(r"https://github\.com/(openshift)/([^/]+)/pull/(\d+)")
 
 class NotificationType(Enum):
     """
@@ -61,6 +81,145 @@ class Notification:
         self.type = type
         self.text = text
 
+class PullRequestLabels:
+    """
+    Labels of a GitHub pull request at the time of its last update.
+
+    Attributes:
+        updated_at (str): The updatedAt timestamp of the pull request.
+        labels (set[str]): Names of the pull request labels.
+    """
+
+    updated_at: str
+    labels: set[str]
+
+    def __init__(self, updated_at, labels):
+        self.updated_at = updated_at
+        self.labels = labels
+
+class ChangelogSummary:
+    """
+    Summary of the already processed part of an issue changelog. Past histories are immutable,
+    so only histories added after history_count need to be fetched.
+
+    Attributes:
+        history_count (int): Number of processed changelog histories.
+        latest_on_qa (Optional[datetime]): The latest ON_QA transition in the processed histories.
+    """
+
+    history_count: int
+    latest_on_qa: Optional[datetime]
+
+    def __init__(self, history_count, latest_on_qa):
+        self.history_count = history_count
+        self.latest_on_qa = latest_on_qa
+
+class NotificatorState:
+    """
+    Persists the state of incremental jira notificator runs in a local JSON file.
+
+    Attributes:
+        path (str): Path of the state file.
+        watermark (Optional[datetime]): Start time of the last successful run.
+        deadlines (Dict[str, Optional[datetime]]): Next notification deadline per issue key.
+            None means nothing is due until the issue is updated.
+        changelogs (Dict[str, ChangelogSummary]): Processed changelog summary per issue key.
+        pr_labels (Dict[tuple[str, str, int], PullRequestLabels]): Labels per (org, repo, PR number)
+            of the PRs linked to the processed issues.
+    """
+
+    def __init__(self, path: str = DEFAULT_STATE_FILE):
+        self.path = path
+        self.watermark: Optional[datetime] = None
+        self.deadlines: Dict[str, Optional[datetime]] = {}
+        self.changelogs: Dict[str, ChangelogSummary] = {}
+        self.pr_labels: Dict[tuple[str, str, int], PullRequestLabels] = {}
+
+    def load(self) -> "NotificatorState":
+        """
+        Loads the state from the state file. Missing or corrupted file results in an empty state.
+
+        Returns:
+            NotificatorState: This state object.
+        """
+
+        if not os.path.exists(self.path):
+            logger.info(f"State file {self.path} does not exist, all ON_QA issues will be fetched.")
+            return self
+
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            watermark = data.get("watermark")
+            self.watermark = datetime.fromisoformat(watermark) if watermark else None
+            self.deadlines = {
+                key: datetime.fromisoformat(deadline) if deadline else None
+                for key, deadline in data.get("deadlines", {}).items()
+            }
+            self.changelogs = {
+                key: ChangelogSummary(
+                    summary["history_count"],
+                    datetime.fromisoformat(summary["latest_on_qa"]) if summary.get("latest_on_qa") else None,
+                )
+                for key, summary in data.get("changelogs", {}).items()
+            }
+            self.pr_labels = {
+                (pr["org"], pr["repo"], pr["number"]): PullRequestLabels(pr["updated_at"], set(pr["labels"]))
+                for pr in data.get("pr_labels", [])
+            }
+            logger.info(f"Loaded state from {self.path}: watermark {self.watermark}, {len(self.deadlines)} indexed issues.")
+        except (OSError, ValueError, AttributeError, KeyError, TypeError) as e:
+            logger.warning(f"Failed to load state file {self.path}, all ON_QA issues will be fetched: {e}")
+            self.watermark = None
+            self.deadlines = {}
+            self.changelogs = {}
+            self.pr_labels = {}
+
+        return self
+
+    def save(self) -> None:
+        """
+        Writes the state to the state file atomically.
+        """
+
+        data = {
+            "watermark": self.watermark.isoformat() if self.watermark else None,
+            "deadlines": {
+                key: deadline.isoformat() if deadline else None
+                for key, deadline in sorted(self.deadlines.items())
+            },
+            "changelogs": {
+                key: {
+                    "history_count": summary.history_count,
+                    "latest_on_qa": summary.latest_on_qa.isoformat() if summary.latest_on_qa else None,
+                }
+                for key, summary in sorted(self.changelogs.items())
+                if key in self.deadlines
+            },
+            "pr_labels": [
+                {"org": org, "repo": repo, "number": number, "updated_at": pr_labels.updated_at, "labels": sorted(pr_labels.labels)}
+                for (org, repo, number), pr_labels in sorted(self.pr_labels.items())
+            ],
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.path)
+        logger.info(f"Saved state to {self.path}: watermark {self.watermark}, {len(self.deadlines)} indexed issues.")
+
+    def get_due_issue_keys(self, now: datetime) -> List[str]:
+        """
+        Returns keys of indexed issues whose next notification deadline has arrived.
+
+        Args:
+            now (datetime): Current datetime.
+
+        Returns:
+            List[str]: Sorted list of due issue keys.
+        """
+
+        return sorted(key for key, deadline in self.deadlines.items() if deadline and deadline <= now)
+
 class NotificationService:
     """
     Represents a service for sending notifications via the Jira API.
@@ -68,14 +227,32 @@ class NotificationService:
     Attributes:
         jira (JIRA): JIRA API client instance.
         dry_run (bool): If True, logs the action without sending comments to Jira.
+        max_workers (int): Maximum number of issues processed concurrently.
+        calendar (BusinessCalendar): Calendar used to compute notification deadlines.
     """
     
-    def __init__(self, jira, dry_run=False):
+    def __init__(self, jira, dry_run=False, max_workers=DEFAULT_MAX_WORKERS, calendar=None):
         self.jira = jira
         self.dry_run = dry_run
+        self.max_workers = max(1, max_workers)
+        self.calendar = calendar or BusinessCalendar()
         self.ldap = LdapHelper()
         github_token = os.environ.get("GITHUB_TOKEN", "")
         self.github = Github(auth=Auth.Token(github_token)) if github_token else None
+        self.jira_limiter = threading.BoundedSemaphore(JIRA_MAX_CONCURRENT_REQUESTS)
+        self.github_limiter = threading.BoundedSemaphore(GITHUB_MAX_CONCURRENT_REQUESTS)
+        self.ldap_limiter = threading.BoundedSemaphore(LDAP_MAX_CONCURRENT_REQUESTS)
+        self._processed_notifications: set[tuple[str, NotificationType]] = set()
+        self._processed_notifications_lock = threading.Lock()
+        self._linked_prs_cache: Dict[str, List[tuple[str, str, str, int]]] = {}
+        # Labels of PRs checked in this run, and labels known from previous runs which are reused if the PR is not updated
+        self._pr_labels_cache: Dict[tuple[str, str, int], PullRequestLabels] = {}
+        self.pr_labels_state: Dict[tuple[str, str, int], PullRequestLabels] = {}
+        self.changelog_cache: Dict[str, ChangelogSummary] = {}
+        # Keys of issues whose changelog was fetched in the current run, their cached summary is up to date
+        self._fetched_changelogs: set[str] = set()
+        self._payload_stats = {"search_bytes": 0, "changelog_bytes": 0, "changelog_histories": 0, "changelog_fetches": 0, "reused_histories": 0}
+        self._payload_stats_lock = threading.Lock()
 
     def get_user_email(self, user: User) -> Optional[str]:
         """
@@ -147,9 +324,17 @@ class NotificationService:
         """
 
         log_message = f"- {notification.type.label} - notification to Issue - {notification.issue.key}: {notification.text}"
+        with self._processed_notifications_lock:
+            notification_key = (notification.issue.key, notification.type)
+            if notification_key in self._processed_notifications:
+                logger.warning(f"Skipping duplicate {log_message}")
+                return
+            self._processed_notifications.add(notification_key)
+
         if not self.dry_run:
             logger.info(f"Sending {log_message}")
-            self.jira.add_comment(notification.issue, notification.text)
+            with self.jira_limiter:
+                self.jira.add_comment(notification.issue, notification.text)
         else:
             logger.info(f"Skipping sending {log_message}")
             
@@ -164,7 +349,8 @@ class NotificationService:
         current_labels = issue.fields.labels
         if ERT_ALL_NOTIFIED_ONQA_PENDING_LABEL not in current_labels:
             current_labels.append(ERT_ALL_NOTIFIED_ONQA_PENDING_LABEL)
-            issue.update(fields={"labels": current_labels})
+            with self.jira_limiter:
+                issue.update(fields={"labels": current_labels})
             logger.info(f"ON_QA pending label added to the issue {issue.key}.")
         else:
             logger.info(f"ON_QA pending label already exists on the issue {issue.key}.")
@@ -180,7 +366,8 @@ class NotificationService:
         current_labels = issue.fields.labels
         if ERT_ALL_NOTIFIED_ONQA_PENDING_LABEL in current_labels:
             current_labels.remove(ERT_ALL_NOTIFIED_ONQA_PENDING_LABEL)
-            issue.update(fields={"labels": current_labels})
+            with self.jira_limiter:
+                issue.update(fields={"labels": current_labels})
             logger.info(f"ON_QA pending label removed from the issue {issue.key}.")
         else:
             logger.info(f"ON_QA pending label does not exist on the issue {issue.key}.")
@@ -196,7 +383,9 @@ class NotificationService:
             Optional[User]: The matched user if found, otherwise None.
         """
 
-        for user in self.jira.search_users(query=email):
+        with self.jira_limiter:
+            users = self.jira.search_users(query=email)
+        for user in users:
             if self.get_user_email(user) == email:
                 return user
         logger.warning(f"User was not found for email {email}.")
@@ -231,7 +420,8 @@ class NotificationService:
             Optional[User]: The manager user if found, otherwise None.
         """
 
-        manager_email = self.ldap.get_manager_email(self.get_user_email(user))
+        with self.ldap_limiter:
+            manager_email = self.ldap.get_manager_email(self.get_user_email(user))
         if manager_email:
             manager = self.find_user_by_email(manager_email)
             if manager:
@@ -276,7 +466,8 @@ class NotificationService:
             need_info_from = jira_issue.get_need_info_from() or []
             updated_users = [u.raw for u in need_info_from]
             updated_users.append(user.raw)
-            jira_issue.set_need_info_from(updated_users)
+            with self.jira_limiter:
+                jira_issue.set_need_info_from(updated_users)
 
     def create_assignee_notification_text(self, missing_contact: Contact, notified_assignees: list[User]) -> str:
         """
@@ -542,9 +733,13 @@ class NotificationService:
             Optional[datetime]: The latest ON_QA transition timestamp, or None if not found.
         """
 
+        changelog = getattr(issue, "changelog", None)
+        if changelog is None:
+            return self.fetch_latest_on_qa_transition_datetime(issue)
+
         latest_on_qa: datetime = None
 
-        for history in issue.changelog.histories:
+        for history in changelog.histories:
             for item in history.items:
                 if item.field == "status" and item.toString == "ON_QA":
                     transition_time = parser.parse(history.created)
@@ -553,6 +748,55 @@ class NotificationService:
 
         return latest_on_qa
 
+    def fetch_latest_on_qa_transition_datetime(self, issue: Issue) -> Optional[datetime]:
+        """
+        Returns the most recent ON_QA transition datetime of an issue fetched without changelog.
+        Only changelog histories not yet processed are fetched, the summary is cached per issue
+        and the changelog is fetched at most once per run.
+
+        Args:
+            issue (Issue): The JIRA issue to inspect.
+
+        Returns:
+            Optional[datetime]: The latest ON_QA transition timestamp, or None if not found.
+        """
+
+        summary = self.changelog_cache.get(issue.key) or ChangelogSummary(0, None)
+        if issue.key in self._fetched_changelogs:
+            return summary.latest_on_qa
+        reused_histories = summary.history_count
+        latest_on_qa = summary.latest_on_qa
+        start_at = summary.history_count
+        fetched_bytes = 0
+
+        while True:
+            with self.jira_limiter:
+                page = self.jira.find(
+                    f"issue/{{0}}/changelog?startAt={start_at}&maxResults={CHANGELOG_PAGE_SIZE}",
+                    issue.key,
+                ).raw
+            fetched_bytes += len(json.dumps(page))
+            histories = page.get("values", [])
+            for history in histories:
+                for item in history.get("items", []):
+                    if item.get("field") == "status" and item.get("toString") == "ON_QA":
+                        transition_time = parser.parse(history["created"])
+                        if not latest_on_qa or transition_time > latest_on_qa:
+                            latest_on_qa = transition_time
+            start_at += len(histories)
+            if page.get("isLast", True) or not histories:
+                break
+
+        self.changelog_cache[issue.key] = ChangelogSummary(start_at, latest_on_qa)
+        self._fetched_changelogs.add(issue.key)
+        with self._payload_stats_lock:
+            self._payload_stats["changelog_bytes"] += fetched_bytes
+            self._payload_stats["changelog_histories"] += start_at - reused_histories
+            self._payload_stats["changelog_fetches"] += 1
+            self._payload_stats["reused_histories"] += reused_histories
+
+        return latest_on_qa
+
     def get_latest_notification_dates_after_on_qa_transition(self, issue: Issue, on_qa_transition: datetime) -> Dict[NotificationType, Optional[datetime]]:
         """
         Returns the latest notification dates for each type after the ON_QA transition.
@@ -586,35 +830,61 @@ class NotificationService:
 
     def is_more_than_24_weekday_hours(self, from_date: datetime, now: Optional[datetime] = None) -> bool:
         """
-        Checks if more than 24 weekday hours have passed since the given datetime.
+        Checks if more than 24 business hours have passed since the given datetime.
 
         Args:
             from_date (datetime): The starting datetime.
             now (Optional[datetime]): Current datetime used for comparison (for testing; defaults to current UTC time).
 
         Returns:
-            bool: True if more than 24 weekday hours have passed, otherwise False.
+            bool: True if more than 24 business hours have passed, otherwise False.
         """
 
         if now is None:
             now = datetime.now(timezone.utc)
 
-        if from_date >= now:
-            return False
+        return self.calendar.business_hours_between(from_date, now) > 24
+
+    def get_24_weekday_hours_deadline(self, from_date: datetime) -> datetime:
+        """
+        Returns the datetime after which is_more_than_24_weekday_hours returns True.
 
-        total_diff = now - from_date
+        Args:
+            from_date (datetime): The starting datetime.
 
-        if total_diff > timedelta(days=3):
-            return True
+        Returns:
+            datetime: The deadline datetime.
+        """
 
-        current = from_date
-        valid_hours = 0
-        while current < now:
-            if current.weekday() < 5:  # Monday to Friday
-                valid_hours += 1
-            current += timedelta(hours=1)
+        return self.calendar.add_business_hours(from_date, 24)
 
-        return valid_hours > 24
+    def get_next_notification_deadline(self, issue: Issue) -> Optional[datetime]:
+        """
+        Returns the datetime when the issue is due for the next notification step.
+
+        Args:
+            issue (Issue): The JIRA issue to inspect.
+
+        Returns:
+            Optional[datetime]: The next deadline, or None if nothing is due until the issue is updated.
+        """
+
+        on_qa_datetime = self.get_latest_on_qa_transition_datetime(issue)
+        if not on_qa_datetime:
+            return datetime.now(timezone.utc)
+
+        notification_dates = self.get_latest_notification_dates_after_on_qa_transition(issue, on_qa_datetime)
+
+        if not notification_dates.get(NotificationType.QA_CONTACT):
+            return self.get_24_weekday_hours_deadline(on_qa_datetime)
+        elif not notification_dates.get(NotificationType.TEAM_LEAD):
+            return self.get_24_weekday_hours_deadline(notification_dates.get(NotificationType.QA_CONTACT))
+        elif not notification_dates.get(NotificationType.MANAGER):
+            return self.get_24_weekday_hours_deadline(notification_dates.get(NotificationType.TEAM_LEAD))
+        elif ERT_ALL_NOTIFIED_ONQA_PENDING_LABEL not in issue.fields.labels:
+            return self.get_24_weekday_hours_deadline(notification_dates.get(NotificationType.MANAGER))
+
+        return None
 
     def check_issue_and_notify_responsible_people(self, issue: Issue) -> Optional[Notification]:
         """
@@ -673,6 +943,158 @@ class NotificationService:
 
         return None
 
+    def get_linked_openshift_prs(self, issue: Issue) -> List[tuple[str, str, str, int]]:
+        """
+        Returns GitHub PRs from the openshift org linked to the issue. Results are cached per issue.
+
+        Args:
+            issue (Issue): The JIRA issue to inspect.
+
+        Returns:
+            List[tuple[str, str, str, int]]: List of (url, org, repo, PR number) tuples.
+
+        Raises:
+            Exception: If fetching the remote links fails.
+        """
+
+        if issue.key in self._linked_prs_cache:
+            return self._linked_prs_cache[issue.key]
+
+        with self.jira_limiter:
+            remote_links = self.jira.remote_links(issue)
+
+        linked_prs = []
+        for link in remote_links:
+            url = getattr(link.object, "url", "")
+            match = OPENSHIFT_PR_URL_PATTERN.match(url)
+            if match:
+                linked_prs.append((url, match.group(1), match.group(2), int(match.group(3))))
+
+        self._linked_prs_cache[issue.key] = linked_prs
+        return linked_prs
+
+    def get_pr_labels(self, org: str, repo: str, pr_number: int) -> set[str]:
+        """
+        Returns label names of a GitHub PR. Uses labels prefetched by prefetch_pr_labels,
+        falls back to the GitHub REST API for PRs which were not prefetched.
+
+        Args:
+            org (str): GitHub organization.
+            repo (str): GitHub repository name.
+            pr_number (int): Pull request number.
+
+        Returns:
+            set[str]: Label names of the PR.
+        """
+
+        pr_labels = self._pr_labels_cache.get((org, repo, pr_number))
+        if pr_labels:
+            return pr_labels.labels
+
+        with self.github_limiter:
+            pr = self.github.get_repo(f"{org}/{repo}").get_pull(pr_number)
+            labels = {label.name for label in pr.get_labels()}
+        self._pr_labels_cache[(org, repo, pr_number)] = PullRequestLabels(pr.updated_at.strftime("%Y-%m-%dT%H:%M:%SZ"), labels)
+        return labels
+
+    def prefetch_pr_labels(self, issues: List[Issue]) -> None:
+        """
+        Fetches labels of all openshift PRs linked to the issues via batched GitHub GraphQL queries.
+        PRs which could not be fetched are left to the REST API fallback in get_pr_labels.
+
+        Args:
+            issues (List[Issue]): The JIRA issues whose linked PRs are prefetched.
+        """
+
+        if not self.github:
+            return
+
+        def get_linked_prs(issue: Issue) -> List[tuple[str, str, str, int]]:
+            try:
+                return self.get_linked_openshift_prs(issue)
+            except Exception as e:
+                logger.warning(f"Failed to fetch remote links for {issue.key}: {e}")
+                return []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="jira-notificator") as executor:
+            pr_refs = sorted({
+                (org, repo, pr_number)
+                for linked_prs in executor.map(get_linked_prs, issues)
+                for _, org, repo, pr_number in linked_prs
+            })
+
+        logger.info(f"Prefetching labels of {len(pr_refs)} PRs via GitHub GraphQL.")
+        for i in range(0, len(pr_refs), PR_LABELS_BATCH_SIZE):
+            batch = pr_refs[i:i + PR_LABELS_BATCH_SIZE]
+            try:
+                self._fetch_pr_labels_graphql(batch)
+            except Exception as e:
+                logger.warning(f"Failed to prefetch labels of {len(batch)} PRs via GraphQL, falling back to REST API: {e}")
+
+    def _fetch_pr_labels_graphql(self, pr_refs: List[tuple[str, str, int]]) -> None:
+        """
+        Fetches labels of the PRs via GitHub GraphQL and stores them in the cache.
+        For PRs known from previous runs only updatedAt is queried, their labels are reused
+        if the PR is not updated and fetched in a second query otherwise.
+
+        Args:
+            pr_refs (List[tuple[str, str, int]]): List of (org, repo, PR number) tuples.
+        """
+
+        known_pr_refs = {pr_ref for pr_ref in pr_refs if pr_ref in self.pr_labels_state}
+        updated_pr_refs = []
+        for pr_ref, pull_request in self._query_pull_requests(pr_refs, known_pr_refs).items():
+            if pr_ref not in known_pr_refs:
+                self._pr_labels_cache[pr_ref] = self._to_pr_labels(pull_request)
+            elif self.pr_labels_state[pr_ref].updated_at == pull_request["updatedAt"]:
+                self._pr_labels_cache[pr_ref] = self.pr_labels_state[pr_ref]
+            else:
+                updated_pr_refs.append(pr_ref)
+
+        if updated_pr_refs:
+            for pr_ref, pull_request in self._query_pull_requests(updated_pr_refs).items():
+                self._pr_labels_cache[pr_ref] = self._to_pr_labels(pull_request)
+        logger.debug(f"Reused labels of {len(known_pr_refs) - len(updated_pr_refs)} not updated PRs.")
+
+    def _query_pull_requests(self, pr_refs: List[tuple[str, str, int]], without_labels: set = frozenset()) -> Dict[tuple[str, str, int], dict]:
+        """
+        Queries the PRs in a single GitHub GraphQL query.
+
+        Args:
+            pr_refs (List[tuple[str, str, int]]): List of (org, repo, PR number) tuples.
+            without_labels (set): PRs for which only updatedAt is queried.
+
+        Returns:
+            Dict[tuple[str, str, int], dict]: The pullRequest objects of the returned PRs.
+        """
+
+        query = "query {\n"
+        for i, (org, repo, pr_number) in enumerate(pr_refs):
+            fields = "updatedAt" if (org, repo, pr_number) in without_labels else "updatedAt labels(first: 100) { nodes { name } }"
+            query += (
+                f"  pr{i}: repository(owner: {json.dumps(org)}, name: {json.dumps(repo)}) {{\n"
+                f"    pullRequest(number: {pr_number}) {{ {fields} }}\n"
+                f"  }}\n"
+            )
+        query += "}"
+
+        with self.github_limiter:
+            _, data = self.github.requester.graphql_query(query, {})
+
+        result = data.get("data") or {}
+        pull_requests = {}
+        for i, pr_ref in enumerate(pr_refs):
+            pull_request = (result.get(f"pr{i}") or {}).get("pullRequest")
+            if pull_request:
+                pull_requests[pr_ref] = pull_request
+            else:
+                logger.warning(f"PR {pr_ref} was not returned by GraphQL query.")
+        return pull_requests
+
+    @staticmethod
+    def _to_pr_labels(pull_request: dict) -> PullRequestLabels:
+        return PullRequestLabels(pull_request["updatedAt"], {label["name"] for label in pull_request["labels"]["nodes"]})
+
     def is_pre_merge_verified(self, issue: Issue) -> bool:
         """
         Check if all linked GitHub PRs from the openshift org are pre-merge verified.
@@ -693,25 +1115,17 @@ class NotificationService:
             return False
 
         try:
-            remote_links = self.jira.remote_links(issue)
+            valid_prs = self.get_linked_openshift_prs(issue)
         except Exception as e:
             logger.warning(f"Failed to fetch remote links for {issue.key}: {e}")
             return False
 
-        valid_prs = []
-        for link in remote_links:
-            url = getattr(link.object, "url", "")
-            match = re.match(r"https://github\.com/(openshift)/([^/]+)/pull/(\d+)", url)
-            if match:
-                valid_prs.append((url, match.group(1), match.group(2), int(match.group(3))))
-
         if not valid_prs:
             return False
 
         for url, org, repo, pr_number in valid_prs:
             try:
-                pr = self.github.get_repo(f"{org}/{repo}").get_pull(pr_number)
-                labels = {label.name for label in pr.get_labels()}
+                labels = self.get_pr_labels(org, repo, pr_number)
                 if "verified-later" in labels:
                     logger.info(f"Issue {issue.key} PR {url} has 'verified-later' label, post-merge verification needed.")
                     return False
@@ -725,12 +1139,20 @@ class NotificationService:
         logger.info(f"Issue {issue.key} is pre-merge verified across all {len(valid_prs)} linked PR(s).")
         return True
 
-    def get_on_qa_filter(self, from_date: Optional[datetime] = None) -> str:
+    def get_on_qa_filter(
+        self,
+        from_date: Optional[datetime] = None,
+        updated_after: Optional[datetime] = None,
+        due_issue_keys: Optional[List[str]] = None,
+    ) -> str:
         """
         Constructs a JIRA JQL filter string for ON_QA issues optionally filtered by a date.
 
         Args:
             from_date (Optional[datetime]): If provided, filters issues that transitioned to ON_QA after this date.
+            updated_after (Optional[datetime]): If provided, filters issues updated after this datetime
+                or listed in due_issue_keys.
+            due_issue_keys (Optional[List[str]]): Issue keys which are fetched regardless of updated_after.
 
         Returns:
             str: The JQL filter string.
@@ -743,14 +1165,30 @@ class NotificationService:
 
         date_suffix = f" AND status changed to ON_QA after {from_date.strftime('%Y-%m-%d')}" if from_date else ""
 
-        return base_filter + date_suffix
+        updated_suffix = ""
+        if updated_after:
+            updated_clause = f"updated >= '{updated_after.strftime('%Y-%m-%d %H:%M')}'"
+            if due_issue_keys:
+                updated_suffix = f" AND ({updated_clause} OR key in ({', '.join(due_issue_keys)}))"
+            else:
+                updated_suffix = f" AND {updated_clause}"
+
+        return base_filter + date_suffix + updated_suffix
 
-    def get_on_qa_issues(self, from_date: Optional[datetime]) -> List[Issue]:
+    def get_on_qa_issues(
+        self,
+        from_date: Optional[datetime],
+        updated_after: Optional[datetime] = None,
+        due_issue_keys: Optional[List[str]] = None,
+    ) -> List[Issue]:
         """
         Retrieves all ON_QA issues from JIRA, optionally filtered by a date.
 
         Args:
             from_date (Optional[datetime]): If provided, fetches issues transitioned to ON_QA after this date.
+            updated_after (Optional[datetime]): If provided, fetches only issues updated after this datetime
+                or listed in due_issue_keys.
+            due_issue_keys (Optional[List[str]]): Issue keys which are fetched regardless of updated_after.
 
         Returns:
             List[Issue]: A list of JIRA issues matching the ON_QA criteria.
@@ -759,57 +1197,166 @@ class NotificationService:
         # FIXME: OCPERT-135 Find a solution to access Jira tickets with limited permissions
         # Use enhanced_search_issues for Jira Cloud compatibility (search_issues deprecated for Cloud)
         # maxResults=0 fetches all pages automatically via nextPageToken pagination (100 per page)
-        on_qa_issues = self.jira.enhanced_search_issues(
-            self.get_on_qa_filter(from_date),
+        # The changelog is not expanded, it is fetched per issue only when the ON_QA transition is needed
+        on_qa_issues = list(self.jira.enhanced_search_issues(
+            self.get_on_qa_filter(from_date, updated_after, due_issue_keys),
             maxResults=0,
-            expand="changelog",
+            # jira modifies the list of fields it is given
+            fields=list(ON_QA_ISSUE_FIELDS),
+        ))
+        with self._payload_stats_lock:
+            self._payload_stats["search_bytes"] += sum(len(json.dumps(issue.raw)) for issue in on_qa_issues)
+
+        return on_qa_issues
+
+    def log_payload_stats(self, issue_count: int) -> None:
+        """
+        Logs the size of the fetched Jira payloads and an estimate of the changelog payload saved
+        by fetching changelogs only when needed and reusing the cached changelog summaries.
+
+        Args:
+            issue_count (int): Number of processed issues.
+        """
+
+        with self._payload_stats_lock:
+            stats = dict(self._payload_stats)
+
+        skipped_issues = issue_count - stats["changelog_fetches"]
+        saved_bytes = 0
+        if stats["changelog_histories"]:
+            bytes_per_history = stats["changelog_bytes"] / stats["changelog_histories"]
+            histories_per_issue = (stats["changelog_histories"] + stats["reused_histories"]) / stats["changelog_fetches"]
+            saved_bytes = int(bytes_per_history * (stats["reused_histories"] + skipped_issues * histories_per_issue))
+
+        logger.info(
+            f"Jira payload: search {stats['search_bytes']} bytes, changelog {stats['changelog_bytes']} bytes "
+            f"({stats['changelog_histories']} histories fetched for {stats['changelog_fetches']} issues, "
+            f"{stats['reused_histories']} cached histories reused, changelog not needed for {skipped_issues} issues). "
+            f"Estimated changelog payload saved: {saved_bytes} bytes."
         )
 
-        return list(on_qa_issues)
+    def process_on_qa_issue(self, issue: Issue, with_deadline: bool = False) -> tuple[Optional[Notification], Optional[datetime]]:
+        """
+        Checks a single ON_QA issue and notifies responsible people. Called concurrently by process_on_qa_issues.
+
+        Args:
+            issue (Issue): The issue to process.
+            with_deadline (bool): If True, the next notification deadline of the issue is computed.
+
+        Returns:
+            tuple[Optional[Notification], Optional[datetime]]: The sent notification and the next notification deadline.
+        """
+
+        logger.info(f"Processing issue: {issue.key}")
+        notification = self.check_issue_and_notify_responsible_people(issue)
+        deadline = None
+        if with_deadline:
+            # Pre-merge verified issues are checked again in the next run without fetching the changelog
+            if self.github and self.is_pre_merge_verified(issue):
+                deadline = datetime.now(timezone.utc)
+            else:
+                deadline = self.get_next_notification_deadline(issue)
+        return notification, deadline
 
-    def process_on_qa_issues(self, from_date: Optional[datetime]) -> List[Notification]:
+    def process_on_qa_issues(self, from_date: Optional[datetime], state: Optional[NotificatorState] = None) -> List[Notification]:
         """
         Processes ON_QA issues by checking and notifying responsible people.
 
+        When a state with a watermark is provided, only issues updated since the last successful run
+        and issues whose next notification deadline has arrived are fetched and processed.
+        The state is saved after a successful run unless running in dry-run mode.
+
         Args:
             from_date (Optional[datetime]): If provided, process issues transitioned to ON_QA after this date.
+            state (Optional[NotificatorState]): Incremental run state, if None all ON_QA issues are processed.
 
         Returns:
             List[Notification]: List of successfully sent notifications.
         """
         sent_notifications: list[Notification] = []
         error_occurred = False
-
-        for issue in self.get_on_qa_issues(from_date):
-            logger.info(f"Processing issue: {issue.key}")
-            try:
-                notification = self.check_issue_and_notify_responsible_people(issue)
-            except Exception as e:
-                logger.error(f"An error occured while processing the Issue {issue.key}: {e}")
-                error_occurred = True
-            if notification:
-                sent_notifications.append(notification)
+        run_started = datetime.now(timezone.utc)
+        self._fetched_changelogs.clear()
+        if state:
+            self.changelog_cache.update(state.changelogs)
+            self.pr_labels_state.update(state.pr_labels)
+
+        updated_after = None
+        due_issue_keys = None
+        # Issues expected in the result, the ones missing from it are removed from the state.
+        expected_issue_keys = list(state.deadlines.keys()) if state else []
+        if state and state.watermark:
+            updated_after = state.watermark - WATERMARK_OVERLAP
+            due_issue_keys = state.get_due_issue_keys(run_started)
+            expected_issue_keys = due_issue_keys
+            logger.info(f"Incremental run: fetching issues updated after {updated_after} and {len(due_issue_keys)} due issues.")
+
+        # Paginated search results can contain the same issue more than once
+        issues = list({issue.key: issue for issue in self.get_on_qa_issues(from_date, updated_after, due_issue_keys)}.values())
+        self.prefetch_pr_labels(issues)
+        logger.info(f"Processing {len(issues)} issues with {self.max_workers} workers.")
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="jira-notificator") as executor:
+            futures = [(issue, executor.submit(self.process_on_qa_issue, issue, state is not None)) for issue in issues]
+            for issue, future in futures:
+                try:
+                    notification, deadline = future.result()
+                except Exception as e:
+                    logger.error(f"An error occured while processing the Issue {issue.key}: {e}")
+                    error_occurred = True
+                    continue
+                if state:
+                    state.deadlines[issue.key] = deadline
+                if notification:
+                    sent_notifications.append(notification)
+
+        self.log_payload_stats(len(issues))
 
         if error_occurred:
             raise RuntimeError("An error occured while processing the issues. See the logs for details.")
 
+        if state:
+            state.changelogs = dict(self.changelog_cache)
+            state.pr_labels = dict(self._pr_labels_cache)
+            fetched_issue_keys = {issue.key for issue in issues}
+            for key in expected_issue_keys:
+                if key not in fetched_issue_keys:
+                    state.deadlines.pop(key, None)
+            state.watermark = run_started
+            if self.dry_run:
+                logger.info(f"Skipping saving state to {state.path} in dry-run mode.")
+            else:
+                state.save()
+
         return sent_notifications
 
 @click.command()
 @click.option("--dry-run", is_flag=True, default=False, help="Run without sending Jira notifications.")
 @click.option("--from-date", default=None, type=click.DateTime(formats=["%Y-%m-%d"]), required=False, help="Filters issues that changed to ON_QA state after this date.")
-def jira_notificator(dry_run: bool, from_date: Optional[datetime]) -> None:
+@click.option("--incremental", is_flag=True, default=False, help="Process only issues updated since the last successful run or due for notification.")
+@click.option("--state-file", default=DEFAULT_STATE_FILE, show_default=True, help="State file used by the incremental mode.")
+@click.option("--max-workers", default=DEFAULT_MAX_WORKERS, show_default=True, type=click.IntRange(min=1), help="Maximum number of issues processed concurrently.")
+@click.option("--timezone", "tz", default="UTC", show_default=True, help="Time zone in which weekdays and holidays are evaluated.")
+@click.option("--holiday", "holidays", multiple=True, type=click.DateTime(formats=["%Y-%m-%d"]), help="Holiday date excluded from business hours, can be repeated.")
+def jira_notificator(dry_run: bool, from_date: Optional[datetime], incremental: bool, state_file: str, max_workers: int, tz: str, holidays: tuple[datetime, ...]) -> None:
     """
     CLI entry point to process ON_QA issues and notify responsible people.
 
     Args:
         dry_run (bool): If True, simulate notifications without sending.
         from_date (Optional[datetime]): Filter issues transitioned to ON_QA after this date.
+        incremental (bool): If True, process only issues changed since the last run or due for notification.
+        state_file (str): Path of the state file used by the incremental mode.
+        max_workers (int): Maximum number of issues processed concurrently.
+        tz (str): Time zone in which weekdays and holidays are evaluated.
+        holidays (tuple[datetime, ...]): Holiday dates excluded from business hours.
 
     Returns:
         None
     """
 
+    if incremental and from_date:
+        raise click.UsageError("--from-date cannot be combined with --incremental.")
+
     jira_token = os.environ.get("JIRA_TOKEN")
     jira_username = os.environ.get("JIRA_USERNAME")
 
@@ -821,8 +1368,11 @@ def jira_notificator(dry_run: bool, from_date: Optional[datetime]) -> None:
 
     jira = JIRA(server="https://redhat.atlassian.net", basic_auth=(jira_username, jira_token))
 
-    ns = NotificationService(jira, dry_run)
-    ns.process_on_qa_issues(from_date)
+    state = NotificatorState(state_file).load() if incremental else None
+
+    calendar = BusinessCalendar(tz, [holiday.date() for holiday in holidays])
+    ns = NotificationService(jira, dry_run, max_workers, calendar)
+    ns.process_on_qa_issues(from_date, state)
 
 if __name__ == "__main__":
     jira_notificator()
@@ -1,9 +1,12 @@
 import unittest
+from unittest.mock import MagicMock, patch
 
 from oar.core.advisory import Advisory
 from oar.core.advisory import AdvisoryManager
+from oar.core.advisory import CdnPushOrchestrator
 from oar.core.configstore import ConfigStore
 from oar.core.const import *
+from oar.core.exceptions import AdvisoryException
 
 
 class TestAdvisoryManager(unittest.TestCase):
@@ -79,3 +82,131 @@ class TestAdvisoryManager(unittest.TestCase):
     def test_finished_jiras(self):
         self.assertTrue(self.am.has_finished_all_advisories_jiras())
 
+
+
+class TestAdvisoryManagerLoading(unittest.TestCase):
+    """Unit tests of concurrent advisory loading with mocked errata tool"""
+
+    def setUp(self):
+        self.cs = MagicMock()
+        self.cs.get_advisories.return_value = {
+            AD_IMPETUS_EXTRAS: 1,
+            AD_IMPETUS_IMAGE: 2,
+            AD_IMPETUS_MICROSHIFT: 3,
+            AD_IMPETUS_RPM: 4,
+        }
+
+    def _advisory(self, errata_id, impetus):
+        ad = MagicMock()
+        ad.errata_id = errata_id
+        ad.impetus = impetus
+        ad.errata_state = AD_STATUS_DROPPED_NO_SHIP if errata_id == 4 else AD_STATUS_QE
+        return ad
+
+    @patch("oar.core.advisory.Advisory")
+    def test_get_advisories_memoized(self, mock_advisory):
+        mock_advisory.side_effect = self._advisory
+        am = AdvisoryManager(self.cs)
+        ads = am.get_advisories()
+        self.assertEqual([ad.errata_id for ad in ads], [1, 2])
+        self.assertEqual(mock_advisory.call_count, 3)
+
+        self.assertEqual([id(ad) for ad in am.get_advisories()], [id(ad) for ad in ads])
+        self.assertEqual(mock_advisory.call_count, 3)
+
+        refreshed = am.get_advisories(refresh=True)
+        self.assertEqual([ad.errata_id for ad in refreshed], [1, 2])
+        self.assertEqual(mock_advisory.call_count, 6)
+        self.assertIsNot(refreshed[0], ads[0])
+
+    @patch("oar.core.advisory.Advisory")
+    def test_map_advisories(self, mock_advisory):
+        mock_advisory.side_effect = self._advisory
+        am = AdvisoryManager(self.cs)
+        self.assertEqual(am.map_advisories(lambda ad: ad.errata_id * 10), [10, 20])
+
+        def check(ad):
+            if ad.errata_id == 2:
+                raise AdvisoryException("errata tool is not available")
+            return ad.errata_id
+
+        with self.assertRaises(AdvisoryException) as cm:
+            am.map_advisories(check)
+        self.assertIn("[2]", str(cm.exception))
+        self.assertIsInstance(cm.exception.__cause__, AdvisoryException)
+
+    @patch("oar.core.advisory.Advisory")
+    def test_check_greenwave_cvp_tests(self, mock_advisory):
+        mock_advisory.side_effect = self._advisory
+        am = AdvisoryManager(self.cs)
+        failed_test = {"id": 2, "attributes": {"status": "FAILED"}}
+        tests = {
+            1: [{"id": 1, "attributes": {"status": CVP_TEST_STATUS_PASSED}}],
+            2: [failed_test],
+        }
+        for ad in am.get_advisories():
+            ad.get_greenwave_cvp_tests.return_value = tests[ad.errata_id]
+        self.assertEqual(am.check_greenwave_cvp_tests(), [failed_test])
+
+
+class TestCdnPushOrchestrator(unittest.TestCase):
+    """Unit tests of CDN push orchestration with mocked errata tool"""
+
+    def _advisory(self, errata_id, blocking_ids, jobs):
+        ad = Advisory.__new__(Advisory)
+        ad.errata_id = errata_id
+        ad.push_job_status = {}
+        ad.no_push_job = False
+        ad.get_erratum_data = MagicMock(return_value={"blocking_advisories": blocking_ids})
+        ad._get = MagicMock(side_effect=lambda url: [
+            {"id": job_id, "status": status, "target": {"name": "cdn_stage"}}
+            for job_id, status in enumerate(jobs[errata_id], 1)
+        ])
+
+        def push(target):
+            # job is running when it is triggered and completed on next poll
+            jobs[errata_id].append(PUSH_JOB_STATUS_RUNNING)
+            ad._get.side_effect = lambda url: [
+                {"id": len(jobs[errata_id]), "status": PUSH_JOB_STATUS_COMPLETE, "target": {"name": "cdn_stage"}}
+            ]
+
+        ad.push = MagicMock(side_effect=push)
+        return ad
+
+    def test_resolve_topological_order(self):
+        jobs = {1: [], 2: [], 3: []}
+        ads = [self._advisory(1, [2], jobs), self._advisory(2, [3], jobs), self._advisory(3, [], jobs)]
+        self.assertEqual(CdnPushOrchestrator(ads).resolve(), [3, 2, 1])
+
+        ads[2].get_erratum_data.return_value = {"blocking_advisories": [1]}
+        with self.assertRaises(AdvisoryException):
+            CdnPushOrchestrator(ads).resolve()
+
+    def test_run_once(self):
+        jobs = {1: [], 2: [PUSH_JOB_STATUS_COMPLETE]}
+        ads = [self._advisory(1, [], jobs), self._advisory(2, [], jobs)]
+        self.assertFalse(CdnPushOrchestrator(ads).run())
+        ads[0].push.assert_called_once_with(target="stage")
+        ads[1].push.assert_not_called()
+
+    @patch("oar.core.advisory.time.sleep")
+    def test_run_watch(self, mock_sleep):
+        jobs = {1: [], 2: [PUSH_JOB_STATUS_FAILED]}
+        ads = [self._advisory(1, [2], jobs), self._advisory(2, [], jobs)]
+        orchestrator = CdnPushOrchestrator(ads, poll_interval=10)
+        self.assertTrue(orchestrator.run(watch=True))
+        # blocking advisory is pushed first, the blocked one after it is completed
+        ads[1].push.assert_called_once_with(target="stage")
+        ads[0].push.assert_called_once_with(target="stage")
+        self.assertEqual(mock_sleep.call_count, 2)
+        # completed advisory is not polled again
+        self.assertEqual(ads[1]._get.call_count, 2)
+
+    @patch("oar.core.advisory.time.sleep")
+    def test_run_watch_failed_retries(self, mock_sleep):
+        jobs = {1: [PUSH_JOB_STATUS_FAILED]}
+        ad = self._advisory(1, [], jobs)
+        ad.push.side_effect = lambda target: jobs[1].append(PUSH_JOB_STATUS_FAILED)
+        with self.assertRaises(AdvisoryException):
+            CdnPushOrchestrator([ad], max_retries=2).run(watch=True)
+        self.assertEqual(ad.push.call_count, 2)
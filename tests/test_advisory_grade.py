@@ -1,8 +1,14 @@
+import os
+import tempfile
 import unittest
+from unittest.mock import MagicMock, patch
+
+from dateutil import parser
 
 from oar.core.advisory import Advisory, AdvisoryManager
 from oar.core.configstore import ConfigStore
 from oar.core.exceptions import AdvisoryException
+from oar.core.pyxis_cache import PyxisCache
 
 
 class TestAdvisoryGrade(unittest.TestCase):
@@ -70,3 +76,69 @@ class TestAdvisoryGrade(unittest.TestCase):
         self.assertEqual("ose-ovn-kubernetes-container-v4.14.0-202410300909.p0.geb3869e.assembly.stream.el9", builds[3]["nvr"])
         self.assertEqual("F", builds[3]["grade"])
         self.assertEqual("amd64", builds[3]["arch"])
+
+
+class TestBuildGradesLookup(unittest.TestCase):
+    """Unit tests of batched and cached build grade lookups with mocked pyxis responses"""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.cache = PyxisCache(os.path.join(tmp_dir.name, "pyxis_cache.json"))
+        patcher = patch("oar.core.advisory.PyxisCache.get_instance", return_value=self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.ad = Advisory.__new__(Advisory)
+        self.ad.errata_builds = {"OSE-4.14-RHEL-9": ["a-1", "b-1"], "OSE-4.14-RHEL-8": ["c-1", "a-1"]}
+        self.session = MagicMock()
+        self.session.get.side_effect = self._get
+        patcher = patch("oar.core.advisory.get_pyxis_session", return_value=self.session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.grades = [
+            {"grade": "A", "start_date": "2024-01-01T00:00:00+00:00", "end_date": "2024-02-01T00:00:00+00:00"},
+            {"grade": "C", "start_date": "2024-02-01T00:00:00+00:00"},
+            {"grade": "B", "start_date": "2024-01-15T00:00:00+00:00"},
+            {"grade": "F", "start_date": "2999-01-01T00:00:00+00:00"},
+        ]
+
+    def _response(self, data, ok=True):
+        resp = MagicMock()
+        resp.ok = ok
+        resp.json.return_value = {"data": data, "total": len(data)}
+        return resp
+
+    def _get(self, url, verify=True):
+        if "/images?filter=" in url:
+            return self._response([
+                {"brew": {"build": "a-1"}, "architecture": "amd64", "freshness_grades": self.grades},
+                {"brew": {"build": "a-1"}, "architecture": "arm64", "freshness_grades": self.grades[2:3]},
+                {"brew": {"build": "b-1"}, "architecture": "amd64", "freshness_grades": self.grades[2:3]},
+            ])
+        return self._response([{"architecture": "amd64", "freshness_grades": self.grades[2:3]}])
+
+    def test_effective_grade(self):
+        now = parser.parse("2024-03-01T00:00:00+00:00")
+        self.assertEqual("C", Advisory._get_effective_grade(self.grades, now))
+        self.assertIsNone(Advisory._get_effective_grade(self.grades[3:], now))
+
+    def test_get_unhealthy_builds(self):
+        unhealthy_builds = self.ad.get_unhealthy_builds()
+        self.assertEqual(unhealthy_builds, [{"nvr": "a-1", "arch": "amd64", "grade": "C"}])
+        urls = [c.args[0] for c in self.session.get.call_args_list]
+        self.assertEqual(2, len(urls))
+        self.assertIn("filter=brew.build=in=(a-1,b-1,c-1)", urls[0])
+        self.assertIn("/images/nvr/c-1?", urls[1])
+
+        # grades are cached
+        self.assertEqual([{"nvr": "b-1", "arch": "amd64", "grade": "B"}], self.ad.get_build_grades("b-1"))
+        self.ad.get_unhealthy_builds()
+        self.assertEqual(2, self.session.get.call_count)
+
+    def test_stale_grades_revalidated(self):
+        self.cache.put("build:b-1", [{"arch": "amd64", "freshness_grades": self.grades[:1]}], ttl=-1)
+        # stale grades are returned and refreshed in background
+        self.assertEqual([{"nvr": "b-1", "arch": "amd64", "grade": None}], self.ad.get_build_grades("b-1"))
+        self.cache.wait()
+        self.assertEqual([{"nvr": "b-1", "arch": "amd64", "grade": "B"}], self.ad.get_build_grades("b-1"))
+        self.assertEqual(1, self.session.get.call_count)
@@ -0,0 +1,68 @@
+import unittest
+
+from datetime import date, datetime, timedelta, timezone
+
+from oar.core.business_hours import BusinessCalendar
+
+
+class TestBusinessCalendar(unittest.TestCase):
+
+    def setUp(self):
+        self.calendar = BusinessCalendar()
+        # 2025-07-18 is Friday
+        self.friday = datetime(2025, 7, 18, 10, tzinfo=timezone.utc)
+
+    def brute_force_hours(self, calendar, start, end):
+        hours = 0.0
+        current = start
+        step = timedelta(minutes=30)
+        while current < end:
+            if calendar.is_business_day(current.astimezone(calendar.tz).date()):
+                hours += min(step, end - current).total_seconds() / 3600
+            current += step
+        return hours
+
+    def test_business_hours_between(self):
+        tuesday = datetime(2025, 7, 22, 10, tzinfo=timezone.utc)
+        self.assertEqual(self.calendar.business_hours_between(tuesday, tuesday + timedelta(hours=24)), 24)
+        self.assertEqual(self.calendar.business_hours_between(self.friday, datetime(2025, 7, 21, 10, tzinfo=timezone.utc)), 24)
+        self.assertEqual(self.calendar.business_hours_between(self.friday, datetime(2025, 7, 19, 10, tzinfo=timezone.utc)), 14)
+        self.assertEqual(self.calendar.business_hours_between(self.friday, self.friday - timedelta(hours=1)), 0)
+        self.assertEqual(self.calendar.business_hours_between(self.friday, self.friday + timedelta(weeks=52)), 52 * 5 * 24)
+
+    def test_business_hours_between_matches_brute_force(self):
+        calendar = BusinessCalendar(holidays=["2025-07-21", "2025-07-24"])
+        start = datetime(2025, 7, 16, 7, 30, tzinfo=timezone.utc)
+        for offset in range(0, 24 * 14, 5):
+            end = start + timedelta(hours=offset)
+            self.assertEqual(calendar.business_hours_between(start, end), self.brute_force_hours(calendar, start, end))
+
+    def test_holidays(self):
+        calendar = BusinessCalendar(holidays=[date(2025, 7, 21), "2025-07-19"])
+        self.assertEqual(calendar.holidays, [date(2025, 7, 21).toordinal()])
+        self.assertEqual(calendar.business_hours_between(self.friday, datetime(2025, 7, 22, 10, tzinfo=timezone.utc)), 24)
+        self.assertEqual(calendar.add_business_hours(self.friday, 24), datetime(2025, 7, 22, 10, tzinfo=timezone.utc))
+
+    def test_add_business_hours(self):
+        self.assertEqual(self.calendar.add_business_hours(self.friday, 24), datetime(2025, 7, 21, 10, tzinfo=timezone.utc))
+        self.assertEqual(self.calendar.add_business_hours(self.friday, 14), datetime(2025, 7, 19, tzinfo=timezone.utc))
+        saturday = datetime(2025, 7, 19, 12, tzinfo=timezone.utc)
+        self.assertEqual(self.calendar.add_business_hours(saturday, 1), datetime(2025, 7, 21, 1, tzinfo=timezone.utc))
+
+        calendar = BusinessCalendar(holidays=["2025-07-21", "2025-07-22", "2025-12-25"])
+        for hours in range(0, 24 * 30, 7):
+            deadline = calendar.add_business_hours(self.friday, hours)
+            self.assertEqual(calendar.business_hours_between(self.friday, deadline), hours)
+
+    def test_timezone(self):
+        calendar = BusinessCalendar("Asia/Tokyo")
+        # Friday 20:00 UTC is Saturday 05:00 in Tokyo
+        friday_evening = datetime(2025, 7, 18, 20, tzinfo=timezone.utc)
+        self.assertEqual(calendar.business_hours_between(friday_evening, friday_evening + timedelta(hours=24)), 0)
+        self.assertEqual(calendar.add_business_hours(friday_evening, 1), datetime(2025, 7, 20, 16, tzinfo=timezone.utc))
+
+    def test_invalid_workdays(self):
+        with self.assertRaises(ValueError):
+            BusinessCalendar(workdays=[])
+        with self.assertRaises(ValueError):
+            BusinessCalendar(workdays=[7])
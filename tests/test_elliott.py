@@ -0,0 +1,142 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from concurrent.futures import Future
+from unittest.mock import MagicMock, patch
+
+from oar.core import elliott
+from oar.core.elliott import find_cve_bugs
+from oar.core.exceptions import ElliottException
+from oar.core.json_cache import JsonFileCache
+
+
+class TestFindCveBugs(unittest.TestCase):
+    """Tests for cached elliott find-bugs results with mocked elliott cmd"""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.cache = JsonFileCache(os.path.join(tmp_dir.name, "elliott_cache.json"))
+        patcher = patch('oar.core.elliott.JsonFileCache.get_instance', return_value=self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch('oar.core.elliott.get_build_data_commit', return_value="abc123")
+        self.mock_commit = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch('oar.core.elliott.get_elliott_env', return_value={})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch('oar.core.elliott.subprocess.Popen')
+        self.mock_popen = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.output = {"rpm": ["OCPBUGS-1"], "rhcos": []}
+        self._set_output(self.output)
+
+    def _set_output(self, output, returncode=0, stderr=b""):
+        process = MagicMock()
+        process.communicate.return_value = (json.dumps(output).encode() if output is not None else b"", stderr)
+        process.returncode = returncode
+        self.mock_popen.return_value = process
+
+    def test_cached_by_build_data_commit(self):
+        self.assertEqual(find_cve_bugs("openshift-4.19", "4.19.9", "brew"), self.output)
+        self.assertEqual(find_cve_bugs("openshift-4.19", "4.19.9", "brew"), self.output)
+        self.assertEqual(self.mock_popen.call_count, 1)
+        cmd = self.mock_popen.call_args.args[0]
+        self.assertEqual(cmd[cmd.index("--group") + 1], "openshift-4.19")
+        self.assertEqual(cmd[cmd.index("--build-system") + 1], "brew")
+
+        # new commit of ocp-build-data
+        self.mock_commit.return_value = "def456"
+        find_cve_bugs("openshift-4.19", "4.19.9", "brew")
+        self.assertEqual(self.mock_popen.call_count, 2)
+
+        # other build system is cached separately
+        find_cve_bugs("openshift-4.19", "4.19.9", "konflux")
+        self.assertEqual(self.mock_popen.call_count, 3)
+
+    def test_refresh(self):
+        find_cve_bugs("openshift-4.19", "4.19.9", "brew")
+        self._set_output({"rpm": ["OCPBUGS-2"]})
+        self.assertEqual(find_cve_bugs("openshift-4.19", "4.19.9", "brew", refresh=True), {"rpm": ["OCPBUGS-2"]})
+        self.assertEqual(find_cve_bugs("openshift-4.19", "4.19.9", "brew"), {"rpm": ["OCPBUGS-2"]})
+        self.assertEqual(self.mock_popen.call_count, 2)
+
+    def test_expired_result(self):
+        with patch('oar.core.elliott.ELLIOTT_CACHE_TTL', -1):
+            find_cve_bugs("openshift-4.19", "4.19.9", "brew")
+        find_cve_bugs("openshift-4.19", "4.19.9", "brew")
+        self.assertEqual(self.mock_popen.call_count, 2)
+
+    def test_not_cached_without_commit(self):
+        self.mock_commit.return_value = None
+        find_cve_bugs("openshift-4.19", "4.19.9", "brew")
+        find_cve_bugs("openshift-4.19", "4.19.9", "brew")
+        self.assertEqual(self.mock_popen.call_count, 2)
+
+    def test_empty_output(self):
+        self._set_output(None)
+        self.assertEqual(find_cve_bugs("openshift-4.19", "4.19.9", "brew"), {})
+
+    def test_error_not_cached(self):
+        self._set_output(None, returncode=1, stderr=b"failed")
+        with self.assertRaises(ElliottException):
+            find_cve_bugs("openshift-4.19", "4.19.9", "brew")
+        self._set_output(self.output)
+        self.assertEqual(find_cve_bugs("openshift-4.19", "4.19.9", "brew"), self.output)
+        self.assertEqual(self.mock_popen.call_count, 2)
+        self.assertEqual(elliott._inflight, {})
+
+    def test_concurrent_invocations_coalesced(self):
+        started = threading.Event()
+        release = threading.Event()
+        process = self.mock_popen.return_value
+
+        def communicate():
+            started.set()
+            release.wait(5)
+            return json.dumps(self.output).encode(), b""
+        process.communicate.side_effect = communicate
+
+        waiting = threading.Event()
+
+        class WaitingFuture(Future):
+            def result(self, timeout=None):
+                waiting.set()
+                return super().result(timeout)
+
+        results = []
+        with patch('oar.core.elliott.Future', WaitingFuture):
+            first = threading.Thread(target=lambda: results.append(find_cve_bugs("openshift-4.19", "4.19.9", "brew")))
+            first.start()
+            self.assertTrue(started.wait(5))
+            # result is not cached yet, second invocation waits for the running one
+            second = threading.Thread(target=lambda: results.append(find_cve_bugs("openshift-4.19", "4.19.9", "brew", refresh=True)))
+            second.start()
+            self.assertTrue(waiting.wait(5))
+            release.set()
+        first.join(5)
+        second.join(5)
+
+        self.assertEqual(results, [self.output, self.output])
+        self.assertEqual(self.mock_popen.call_count, 1)
+
+
+class TestGetBuildDataCommit(unittest.TestCase):
+
+    @patch('oar.core.elliott.subprocess.run')
+    def test_get_build_data_commit(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout="abc123\trefs/heads/openshift-4.19\n")
+        self.assertEqual(elliott.get_build_data_commit("openshift-4.19"), "abc123")
+        self.assertIn("refs/heads/openshift-4.19", mock_run.call_args.args[0])
+
+    @patch('oar.core.elliott.subprocess.run')
+    def test_get_build_data_commit_failure(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=2, stdout="", stderr="not found")
+        self.assertIsNone(elliott.get_build_data_commit("openshift-4.19"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,22 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
 
+from oar.core.pyxis_cache import PyxisCache
 from oar.image_consistency_check.checker import ImageConsistencyChecker
 
 
 class TestImageConsistencyChecker(unittest.TestCase):
 
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.cache = PyxisCache(os.path.join(tmp_dir.name, "pyxis_cache.json"))
+        patcher = patch('oar.image_consistency_check.checker.PyxisCache.get_instance', return_value=self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def _create_mock_image_metadata(self, digest='', listdigest='', vcs_ref='', name=''):
         """Helper to create a mock ImageMetadata object."""
         mock = MagicMock()
@@ -126,6 +137,10 @@ class TestImageConsistencyChecker(unittest.TestCase):
         self.assertTrue(result)
         mock_requests_get.assert_called_once()
 
+        # released image is served from cache
+        self.assertTrue(checker._is_payload_image_released(payload_image))
+        mock_requests_get.assert_called_once()
+
     @patch('oar.image_consistency_check.checker.requests.get')
     @patch('oar.image_consistency_check.checker.ImageMetadata')
     def test_is_payload_image_released_not_found(self, mock_image_metadata_class, mock_requests_get):
@@ -246,6 +261,38 @@ class TestImageConsistencyChecker(unittest.TestCase):
 
         self.assertTrue(result)
 
+    @patch('oar.image_consistency_check.checker.requests.get')
+    @patch('oar.image_consistency_check.checker.ImageMetadata')
+    def test_is_consistent_saves_catalog_cache_once(self, mock_image_metadata_class, mock_requests_get):
+        """Test that images not in the shipment are looked up in Red Hat catalog with one cache save."""
+        mock_payload = MagicMock()
+        mock_payload.get_images.return_value = [
+            self._create_mock_payload_image(name=f'image{i}', pullspec=f'payload{i}') for i in range(3)
+        ]
+        mock_shipment = MagicMock()
+        mock_shipment.get_components.return_value = []
+        mock_image_metadata_class.side_effect = lambda ps: self._create_mock_image_metadata(digest=f'sha256:{ps}')
+
+        def get(url):
+            response = MagicMock(ok=True)
+            released = url.endswith('payload0')
+            response.json.return_value = {
+                'total': 1 if released else 0,
+                'data': [{'repositories': [{'registry': 'registry.redhat.io', 'repository': 'openshift4/ose-cli'}]}] if released else [],
+            }
+            return response
+        mock_requests_get.side_effect = get
+
+        checker = ImageConsistencyChecker(mock_payload, mock_shipment, check_version_consistency=False)
+        with patch.object(self.cache, 'save', wraps=self.cache.save) as mock_save:
+            self.assertFalse(checker.is_consistent())
+
+        mock_save.assert_called_once()
+        self.assertEqual(mock_requests_get.call_count, 3)
+        # only the released image is cached
+        self.assertEqual(self.cache.get('catalog:sha256:payload0'), (['registry.redhat.io/openshift4/ose-cli'], True))
+        self.assertEqual(self.cache.get('catalog:sha256:payload1'), (None, False))
+
     @patch('oar.image_consistency_check.checker.requests.get')
     @patch('oar.image_consistency_check.checker.ImageMetadata')
     def test_is_consistent_not_found(self, mock_image_metadata_class, mock_requests_get):
@@ -3,6 +3,8 @@ import unittest
 from collections import ChainMap
 from unittest.mock import Mock
 
+from jira.exceptions import JIRAError
+
 from jira.client import ResultList
 
 from oar.core.configstore import ConfigStore
@@ -308,3 +310,48 @@ Failed Nvrs in advisory [{test_data[3]["errata_id"]}|{get_advisory_link(test_dat
             result_list.append(Mock(spec=Issue))
         mock_jira.search_issues.return_value = result_list
         self.jm._svc = mock_jira
+
+
+class TestJiraManagerGetIssues(unittest.TestCase):
+    """Unit tests of bulk issue lookups with mocked jira client"""
+
+    def setUp(self):
+        self.jm = JiraManager.__new__(JiraManager)
+        self.jm._svc = Mock(spec=JIRA)
+        self.jm._req_count = 0
+        self.jm._req_limit = 100
+
+    def _issue(self, key):
+        issue = Mock(spec=Issue)
+        issue.key = key
+        return issue
+
+    def test_get_issues(self):
+        self.jm._svc.enhanced_search_issues.return_value = [self._issue("OCPBUGS-1"), self._issue("OCPBUGS-2")]
+        issues = self.jm.get_issues(["OCPBUGS-1", "OCPBUGS-2", "OCPBUGS-1"])
+        self.assertEqual(list(issues), ["OCPBUGS-1", "OCPBUGS-2"])
+        self.jm._svc.enhanced_search_issues.assert_called_once_with("key in (OCPBUGS-1, OCPBUGS-2)", maxResults=0)
+        self.jm._svc.issue.assert_not_called()
+
+    def test_get_issues_batch_fallback(self):
+        # one key in the batch is a security bug and one is deleted, jira rejects the whole search
+        self.jm._svc.enhanced_search_issues.side_effect = JIRAError(status_code=400, text="bad request")
+
+        def get_issue(key):
+            if key == "OCPBUGS-2":
+                raise JIRAError(status_code=403, text="forbidden")
+            if key == "OCPBUGS-3":
+                raise JIRAError(status_code=404, text="not found")
+            return self._issue(key)
+        self.jm._svc.issue.side_effect = get_issue
+
+        issues = self.jm.get_issues(["OCPBUGS-1", "OCPBUGS-2", "OCPBUGS-3", "OCPBUGS-4"])
+
+        self.assertEqual(list(issues), ["OCPBUGS-1", "OCPBUGS-4"])
+        self.assertEqual(self.jm._svc.issue.call_count, 4)
+
+    def test_get_issues_batch_fallback_error(self):
+        self.jm._svc.enhanced_search_issues.side_effect = JIRAError(status_code=400, text="bad request")
+        self.jm._svc.issue.side_effect = JIRAError(status_code=500, text="server error")
+        with self.assertRaises(JiraException):
+            self.jm.get_issues(["OCPBUGS-1"])
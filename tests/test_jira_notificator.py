@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta, timezone
 import os
+import shutil
+import tempfile
 import unittest
 
 from unittest.mock import Mock
@@ -7,7 +9,7 @@ from unittest.mock import Mock
 from jira import JIRA
 
 from oar.core.jira import JiraIssue
-from oar.notificator.jira_notificator import ERT_NOTIFICATION_PREFIX, Contact, Notification, NotificationService, NotificationType, ERT_ALL_NOTIFIED_ONQA_PENDING_LABEL
+from oar.notificator.jira_notificator import ERT_NOTIFICATION_PREFIX, Contact, Notification, NotificationService, NotificationType, ERT_ALL_NOTIFIED_ONQA_PENDING_LABEL, NotificatorState, PullRequestLabels
 
 class TestJiraNotificator(unittest.TestCase):
 
@@ -499,3 +501,309 @@ class TestJiraNotificator(unittest.TestCase):
             len(self.ns.process_on_qa_issues(week_ago)),
             len(self.ns.process_on_qa_issues(None))
         )
+
+
+class TestJiraNotificatorIncremental(unittest.TestCase):
+
+    def setUp(self):
+        self.jira = Mock()
+        self.ns = NotificationService(self.jira, False)
+        self.ns.github = None
+        self.tmp_dir = tempfile.mkdtemp()
+        self.state_file = os.path.join(self.tmp_dir, "state.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _create_issue(self, key, on_qa_date, comments=None, labels=None):
+        item = Mock(field="status", toString="ON_QA")
+        history = Mock(created=on_qa_date, items=[item])
+        issue = Mock()
+        issue.key = key
+        issue.raw = {"key": key}
+        issue.changelog.histories = [history]
+        issue.fields.comment.comments = comments or []
+        issue.fields.labels = labels or []
+        return issue
+
+    def test_get_24_weekday_hours_deadline(self):
+        start = datetime(2025, 7, 22, 10, tzinfo=timezone.utc)
+        deadline = self.ns.get_24_weekday_hours_deadline(start)
+        self.assertEqual(deadline, start + timedelta(hours=24))
+        self.assertFalse(self.ns.is_more_than_24_weekday_hours(start, deadline))
+        self.assertTrue(self.ns.is_more_than_24_weekday_hours(start, deadline + timedelta(minutes=1)))
+
+        friday_start = datetime(2025, 7, 18, 10, tzinfo=timezone.utc)
+        self.assertEqual(self.ns.get_24_weekday_hours_deadline(friday_start), datetime(2025, 7, 21, 10, tzinfo=timezone.utc))
+
+    def test_get_next_notification_deadline(self):
+        issue = self._create_issue("OCPBUGS-1", "2025-07-22T10:00:00.000+0000")
+        self.assertEqual(self.ns.get_next_notification_deadline(issue), datetime(2025, 7, 23, 10, tzinfo=timezone.utc))
+
+        qa_comment = Mock(
+            body=self.ns.create_notification_title(NotificationType.QA_CONTACT),
+            created="2025-07-23T11:00:00.000+0000",
+        )
+        issue.fields.comment.comments = [qa_comment]
+        self.assertEqual(self.ns.get_next_notification_deadline(issue), datetime(2025, 7, 24, 11, tzinfo=timezone.utc))
+
+        notified_comments = [
+            qa_comment,
+            Mock(body=self.ns.create_notification_title(NotificationType.TEAM_LEAD), created="2025-07-24T12:00:00.000+0000"),
+            Mock(body=self.ns.create_notification_title(NotificationType.MANAGER), created="2025-07-25T13:00:00.000+0000"),
+        ]
+        issue.fields.comment.comments = notified_comments
+        self.assertEqual(self.ns.get_next_notification_deadline(issue), datetime(2025, 7, 28, 13, tzinfo=timezone.utc))
+
+        issue.fields.labels = [ERT_ALL_NOTIFIED_ONQA_PENDING_LABEL]
+        self.assertIsNone(self.ns.get_next_notification_deadline(issue))
+
+    def test_get_on_qa_filter_incremental(self):
+        base_filter = self.ns.get_on_qa_filter(None)
+        updated_after = datetime(2025, 7, 17, 8, 30, tzinfo=timezone.utc)
+        self.assertEqual(
+            self.ns.get_on_qa_filter(None, updated_after),
+            base_filter + " AND updated >= '2025-07-17 08:30'"
+        )
+        self.assertEqual(
+            self.ns.get_on_qa_filter(None, updated_after, ["OCPBUGS-1", "OCPBUGS-2"]),
+            base_filter + " AND (updated >= '2025-07-17 08:30' OR key in (OCPBUGS-1, OCPBUGS-2))"
+        )
+
+    def test_state_save_and_load(self):
+        state = NotificatorState(self.state_file)
+        state.watermark = datetime(2025, 7, 17, 8, 30, tzinfo=timezone.utc)
+        state.deadlines = {
+            "OCPBUGS-1": datetime(2025, 7, 18, 8, 30, tzinfo=timezone.utc),
+            "OCPBUGS-2": None,
+        }
+        state.save()
+
+        loaded = NotificatorState(self.state_file).load()
+        self.assertEqual(loaded.watermark, state.watermark)
+        self.assertEqual(loaded.deadlines, state.deadlines)
+        self.assertEqual(loaded.get_due_issue_keys(datetime(2025, 7, 18, 9, tzinfo=timezone.utc)), ["OCPBUGS-1"])
+        self.assertEqual(loaded.get_due_issue_keys(datetime(2025, 7, 18, 8, tzinfo=timezone.utc)), [])
+
+        with open(self.state_file, "w") as f:
+            f.write("not a json")
+        corrupted = NotificatorState(self.state_file).load()
+        self.assertIsNone(corrupted.watermark)
+        self.assertEqual(corrupted.deadlines, {})
+
+    def test_process_on_qa_issues_incremental(self):
+        now = datetime.now(timezone.utc)
+        issue = self._create_issue("OCPBUGS-1", now.isoformat())
+        self.jira.enhanced_search_issues.return_value = [issue]
+
+        state = NotificatorState(self.state_file)
+        state.watermark = now - timedelta(hours=1)
+        state.deadlines = {
+            "OCPBUGS-2": now - timedelta(minutes=1),
+            "OCPBUGS-3": now + timedelta(hours=1),
+        }
+
+        self.assertEqual(self.ns.process_on_qa_issues(None, state), [])
+
+        jql = self.jira.enhanced_search_issues.call_args.args[0]
+        self.assertIn("key in (OCPBUGS-2)", jql)
+        self.assertNotIn("OCPBUGS-3", jql)
+        self.assertGreaterEqual(state.watermark, now)
+        # OCPBUGS-2 was due but is no longer in ON_QA state, OCPBUGS-3 is not due yet
+        self.assertEqual(set(state.deadlines.keys()), {"OCPBUGS-1", "OCPBUGS-3"})
+        self.assertTrue(os.path.exists(self.state_file))
+
+    def test_fetch_latest_on_qa_transition_datetime(self):
+        issue = Mock(spec=["key", "raw"])
+        issue.key = "OCPBUGS-1"
+        on_qa = {"created": "2025-07-17T08:30:00.000+0000", "items": [{"field": "status", "toString": "ON_QA"}]}
+        other = {"created": "2025-07-18T08:30:00.000+0000", "items": [{"field": "labels", "toString": "test"}]}
+        self.jira.find.side_effect = [
+            Mock(raw={"values": [other, on_qa], "isLast": False}),
+            Mock(raw={"values": [other], "isLast": True}),
+        ]
+        self.assertEqual(self.ns.get_latest_on_qa_transition_datetime(issue), datetime(2025, 7, 17, 8, 30, tzinfo=timezone.utc))
+        self.assertEqual(self.jira.find.call_args_list[1].args, ("issue/{0}/changelog?startAt=2&maxResults=100", "OCPBUGS-1"))
+        self.assertEqual(self.ns.changelog_cache["OCPBUGS-1"].history_count, 3)
+
+        # the changelog is fetched once per run
+        self.assertEqual(self.ns.get_latest_on_qa_transition_datetime(issue), datetime(2025, 7, 17, 8, 30, tzinfo=timezone.utc))
+        self.assertEqual(self.jira.find.call_count, 2)
+
+        # only new histories are fetched in the next run
+        self.ns._fetched_changelogs.clear()
+        new_on_qa = {"created": "2025-07-19T08:30:00.000+0000", "items": [{"field": "status", "toString": "ON_QA"}]}
+        self.jira.find.side_effect = [Mock(raw={"values": [new_on_qa], "isLast": True})]
+        self.assertEqual(self.ns.get_latest_on_qa_transition_datetime(issue), datetime(2025, 7, 19, 8, 30, tzinfo=timezone.utc))
+        self.assertEqual(self.jira.find.call_args.args[0], "issue/{0}/changelog?startAt=3&maxResults=100")
+
+        state = NotificatorState(self.state_file)
+        state.deadlines = {"OCPBUGS-1": None}
+        state.changelogs = self.ns.changelog_cache
+        state.save()
+        loaded = NotificatorState(self.state_file).load()
+        self.assertEqual(loaded.changelogs["OCPBUGS-1"].history_count, 4)
+        self.assertEqual(loaded.changelogs["OCPBUGS-1"].latest_on_qa, datetime(2025, 7, 19, 8, 30, tzinfo=timezone.utc))
+
+    def test_process_on_qa_issues_incremental_error(self):
+        issue = self._create_issue("OCPBUGS-1", datetime.now(timezone.utc).isoformat())
+        issue.changelog.histories = None
+        self.jira.enhanced_search_issues.return_value = [issue]
+
+        state = NotificatorState(self.state_file)
+        with self.assertRaises(RuntimeError):
+            self.ns.process_on_qa_issues(None, state)
+        self.assertIsNone(state.watermark)
+        self.assertFalse(os.path.exists(self.state_file))
+
+
+class TestJiraNotificatorConcurrency(unittest.TestCase):
+
+    def setUp(self):
+        self.jira = Mock()
+        self.ns = NotificationService(self.jira, False, max_workers=4)
+        self.ns.github = None
+
+    def test_process_notification_is_idempotent(self):
+        issue = Mock()
+        issue.key = "OCPBUGS-1"
+        notification = Notification(issue, NotificationType.QA_CONTACT, "text")
+        self.ns.process_notification(notification)
+        self.ns.process_notification(notification)
+        self.jira.add_comment.assert_called_once_with(issue, "text")
+
+        self.ns.process_notification(Notification(issue, NotificationType.TEAM_LEAD, "text"))
+        self.assertEqual(self.jira.add_comment.call_count, 2)
+
+    def test_process_on_qa_issues_concurrently(self):
+        issues = []
+        for i in range(10):
+            issue = Mock()
+            issue.key = f"OCPBUGS-{i}"
+            issue.raw = {"key": issue.key}
+            issues.append(issue)
+        # duplicate issue returned by paginated search
+        self.jira.enhanced_search_issues.return_value = issues + [issues[0]]
+
+        processed = []
+
+        def check(issue):
+            processed.append(issue.key)
+            if issue.key == "OCPBUGS-3":
+                raise ValueError("failure")
+            return Notification(issue, NotificationType.QA_CONTACT, "text")
+
+        self.ns.check_issue_and_notify_responsible_people = check
+        with self.assertRaises(RuntimeError):
+            self.ns.process_on_qa_issues(None)
+        self.assertEqual(sorted(processed), sorted(issue.key for issue in issues))
+
+        issues.pop(3)
+        self.jira.enhanced_search_issues.return_value = issues
+        notifications = self.ns.process_on_qa_issues(None)
+        self.assertEqual([n.issue.key for n in notifications], [issue.key for issue in issues])
+
+
+class TestJiraNotificatorPrLabels(unittest.TestCase):
+
+    def setUp(self):
+        self.jira = Mock()
+        self.ns = NotificationService(self.jira, True)
+        self.ns.github = Mock()
+        self.requester = self.ns.github.requester
+
+    def _create_issue(self, key, urls):
+        issue = Mock()
+        issue.key = key
+        self.links[key] = [Mock(object=Mock(url=url)) for url in urls]
+        return issue
+
+    def test_prefetch_pr_labels(self):
+        self.links = {}
+        self.jira.remote_links.side_effect = lambda issue: self.links[issue.key]
+        verified = self._create_issue("OCPBUGS-1", ["https://github.com/openshift/repo-a/pull/1"])
+        later = self._create_issue("OCPBUGS-2", [
+            "https://github.com/openshift/repo-a/pull/1",
+            "https://github.com/openshift/repo-b/pull/2",
+        ])
+        not_openshift = self._create_issue("OCPBUGS-3", ["https://github.com/other/repo/pull/3"])
+        self.requester.graphql_query.return_value = ({}, {
+            "data": {
+                "pr0": {"pullRequest": {"updatedAt": "2025-07-17T08:30:00Z", "labels": {"nodes": [{"name": "verified"}]}}},
+                "pr1": {"pullRequest": {"updatedAt": "2025-07-17T08:30:00Z", "labels": {"nodes": [{"name": "verified"}, {"name": "verified-later"}]}}},
+            }
+        })
+
+        self.ns.prefetch_pr_labels([verified, later, not_openshift])
+
+        self.requester.graphql_query.assert_called_once()
+        query = self.requester.graphql_query.call_args.args[0]
+        self.assertIn('pr0: repository(owner: "openshift", name: "repo-a")', query)
+        self.assertIn('pr1: repository(owner: "openshift", name: "repo-b")', query)
+        self.assertTrue(self.ns.is_pre_merge_verified(verified))
+        self.assertFalse(self.ns.is_pre_merge_verified(later))
+        self.assertFalse(self.ns.is_pre_merge_verified(not_openshift))
+        self.assertEqual(self.jira.remote_links.call_count, 3)
+        self.ns.github.get_repo.assert_not_called()
+
+    def test_get_pr_labels_fallback(self):
+        self.links = {}
+        self.jira.remote_links.side_effect = lambda issue: self.links[issue.key]
+        issue = self._create_issue("OCPBUGS-1", ["https://github.com/openshift/repo-a/pull/1"])
+        self.requester.graphql_query.side_effect = Exception("GraphQL failure")
+        label = Mock()
+        label.name = "verified"
+        pr = self.ns.github.get_repo.return_value.get_pull.return_value
+        pr.get_labels.return_value = [label]
+        pr.updated_at = datetime(2025, 7, 17, 8, 30, tzinfo=timezone.utc)
+
+        self.ns.prefetch_pr_labels([issue])
+
+        self.assertTrue(self.ns.is_pre_merge_verified(issue))
+        self.ns.github.get_repo.assert_called_once_with("openshift/repo-a")
+        self.assertTrue(self.ns.is_pre_merge_verified(issue))
+        self.ns.github.get_repo.assert_called_once()
+
+    def test_prefetch_pr_labels_reuses_state(self):
+        self.links = {}
+        self.jira.remote_links.side_effect = lambda issue: self.links[issue.key]
+        issue = self._create_issue("OCPBUGS-1", [
+            "https://github.com/openshift/repo-a/pull/1",
+            "https://github.com/openshift/repo-b/pull/2",
+        ])
+        self.ns.pr_labels_state = {
+            ("openshift", "repo-a", 1): PullRequestLabels("2025-07-17T08:30:00Z", {"verified"}),
+            ("openshift", "repo-b", 2): PullRequestLabels("2025-07-17T08:30:00Z", {"verified-later"}),
+        }
+        self.requester.graphql_query.side_effect = [
+            ({}, {"data": {
+                "pr0": {"pullRequest": {"updatedAt": "2025-07-17T08:30:00Z"}},
+                "pr1": {"pullRequest": {"updatedAt": "2025-07-18T08:30:00Z"}},
+            }}),
+            ({}, {"data": {
+                "pr0": {"pullRequest": {"updatedAt": "2025-07-18T08:30:00Z", "labels": {"nodes": [{"name": "verified"}]}}},
+            }}),
+        ]
+
+        self.ns.prefetch_pr_labels([issue])
+
+        # labels are queried only for the updated PR
+        first_query = self.requester.graphql_query.call_args_list[0].args[0]
+        self.assertNotIn("labels", first_query)
+        second_query = self.requester.graphql_query.call_args_list[1].args[0]
+        self.assertIn('pr0: repository(owner: "openshift", name: "repo-b")', second_query)
+        self.assertIn("labels", second_query)
+        self.assertTrue(self.ns.is_pre_merge_verified(issue))
+        self.ns.github.get_repo.assert_not_called()
+
+    def test_state_save_and_load_pr_labels(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir, True)
+        state = NotificatorState(os.path.join(tmp_dir, "state.json"))
+        state.pr_labels = {("openshift", "repo-a", 1): PullRequestLabels("2025-07-17T08:30:00Z", {"verified", "lgtm"})}
+        state.save()
+
+        loaded = NotificatorState(state.path).load()
+        pr_labels = loaded.pr_labels[("openshift", "repo-a", 1)]
+        self.assertEqual(pr_labels.updated_at, "2025-07-17T08:30:00Z")
+        self.assertEqual(pr_labels.labels, {"verified", "lgtm"})
@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+
+from oar.core.json_cache import JsonFileCache
+
+
+class TestJsonFileCache(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, "cache.json")
+
+    def test_get_put_persisted(self):
+        cache = JsonFileCache(self.path)
+        self.assertEqual((None, False), cache.get("image:abc"))
+        cache.put("image:abc", {"freshness_grades": [{"grade": "A"}]})
+        cache.save()
+
+        cache = JsonFileCache(self.path)
+        self.assertEqual(({"freshness_grades": [{"grade": "A"}]}, True), cache.get("image:abc"))
+
+    def test_stale_entries(self):
+        cache = JsonFileCache(self.path, max_stale=60)
+        cache.put("image:stale", "A", ttl=-1)
+        cache.put("image:expired", "B", ttl=-61)
+        self.assertEqual(("A", False), cache.get("image:stale"))
+        self.assertEqual((None, False), cache.get("image:expired"))
+
+        cache.revalidate(["image:stale"], lambda keys: {key: ("C", 60) for key in keys})
+        cache.wait()
+        self.assertEqual(("C", True), cache.get("image:stale"))
+
+    def test_get_many(self):
+        cache = JsonFileCache(self.path, max_stale=60)
+        cache.put("image:fresh", "A")
+        cache.put("image:stale", "B", ttl=-1)
+        fetched = []
+
+        def fetch(keys):
+            fetched.append(keys)
+            # image:missing is not found, image:unknown failed to fetch
+            return {key: (key.upper(), None if key == "image:missing" else 60) for key in keys if key != "image:unknown"}
+
+        values = cache.get_many(["image:fresh", "image:stale", "image:new", "image:missing", "image:unknown"], fetch)
+        cache.wait()
+        self.assertEqual({"image:fresh": "A", "image:stale": "B", "image:new": "IMAGE:NEW", "image:missing": "IMAGE:MISSING"}, values)
+        self.assertEqual([["image:new", "image:missing", "image:unknown"], ["image:stale"]], fetched)
+        self.assertEqual(("IMAGE:STALE", True), cache.get("image:stale"))
+        self.assertEqual((None, False), cache.get("image:missing"))
+
+        # fetched values are saved
+        self.assertEqual(("IMAGE:NEW", True), JsonFileCache(self.path).get("image:new"))
+
+    def test_expired_entries_not_served_by_default(self):
+        cache = JsonFileCache(self.path)
+        cache.put("find-bugs:a", {}, ttl=-1)
+        self.assertEqual((None, False), cache.get("find-bugs:a"))
+
+    def test_get_instance(self):
+        cache = JsonFileCache.get_instance(self.path)
+        self.assertIs(cache, JsonFileCache.get_instance(self.path))
+        self.assertIsNot(cache, JsonFileCache.get_instance(f"{self.path}.other"))
+
+    def test_lru_eviction(self):
+        cache = JsonFileCache(self.path, max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertEqual((None, False), cache.get("b"))
+        self.assertEqual((1, True), cache.get("a"))
+        self.assertEqual((3, True), cache.get("c"))
+
+    def test_corrupted_file(self):
+        with open(self.path, "w") as f:
+            f.write("not json")
+        self.assertEqual((None, False), JsonFileCache(self.path).get("a"))
@@ -1,4 +1,7 @@
 import unittest
+import unittest.mock
+
+from ldap3.core.exceptions import LDAPSocketOpenError
 
 from oar.core.ldap import LdapHelper
 
@@ -70,3 +73,63 @@ class TestLdapHelper(unittest.TestCase):
 
     def test_get_group_members_emails_non_existent_group_name(self):
         self.assertEqual(0, len(self.ldap.get_group_members_emails("abcdxyz")))
+
+
+class FakeEntry:
+    def __init__(self, attributes):
+        self._attributes = attributes
+
+    def __contains__(self, name):
+        return name in self._attributes
+
+    def __getitem__(self, name):
+        return unittest.mock.Mock(value=self._attributes[name])
+
+
+class TestLdapHelperBatch(unittest.TestCase):
+    """Unit tests of pooled connections and batched manager lookups with mocked LDAP connection"""
+
+    def setUp(self):
+        LdapHelper._pool = None
+        LdapHelper._manager_cache = {}
+        self.addCleanup(setattr, LdapHelper, "_pool", None)
+        self.addCleanup(setattr, LdapHelper, "_manager_cache", {})
+        patcher = unittest.mock.patch("oar.core.ldap.Connection")
+        self.mock_connection = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.conn = self.mock_connection.return_value
+        self.conn.search.side_effect = self._search
+
+    def _search(self, search_base, search_filter, search_scope, attributes):
+        if search_filter.startswith("(|(rhatPrimaryMail="):
+            self.conn.entries = [
+                FakeEntry({"rhatPrimaryMail": "Alice@redhat.com", "manager": "uid=boss,ou=users,dc=redhat,dc=com"}),
+                FakeEntry({"rhatPrimaryMail": "bob@redhat.com", "manager": "uid=boss,ou=users,dc=redhat,dc=com"}),
+                FakeEntry({"rhatPrimaryMail": "carol@redhat.com"}),
+            ]
+        else:
+            self.conn.entries = [FakeEntry({"uid": "boss", "rhatPrimaryMail": "boss@redhat.com"})]
+
+    def test_get_manager_emails(self):
+        ldap = LdapHelper()
+        managers = ldap.get_manager_emails(["alice@redhat.com", "bob@redhat.com", "carol@redhat.com", None, "bob@redhat.com"])
+        self.assertEqual(managers, {
+            "alice@redhat.com": "boss@redhat.com",
+            "bob@redhat.com": "boss@redhat.com",
+            "carol@redhat.com": None,
+        })
+        self.assertEqual(self.conn.search.call_count, 2)
+        self.mock_connection.assert_called_once()
+
+        # results are cached and shared by instances
+        self.assertEqual(LdapHelper().get_manager_email("bob@redhat.com"), "boss@redhat.com")
+        self.assertIsNone(LdapHelper().get_manager_email(None))
+        self.assertEqual(self.conn.search.call_count, 2)
+
+    def test_reconnect_on_failure(self):
+        broken = unittest.mock.MagicMock()
+        broken.search.side_effect = LDAPSocketOpenError("connection reset")
+        self.mock_connection.side_effect = [broken, self.conn]
+        self.assertEqual(LdapHelper().get_manager_email("alice@redhat.com"), "boss@redhat.com")
+        broken.unbind.assert_called_once()
+        self.assertEqual(self.mock_connection.call_count, 2)
@@ -1,10 +1,14 @@
 import logging
+import os
+import tempfile
 import unittest
 import unittest.mock
 
+from slack_sdk.errors import SlackApiError
+
 import oar.core.util as util
 from oar.core.configstore import ConfigStore
-from oar.core.notification import NotificationManager, NotificationException
+from oar.core.notification import NotificationManager, NotificationException, NotificationQueue, SlackClient, SlackDirectory
 from oar.core.worksheet import WorksheetManager
 from tests import test_util
 
@@ -17,9 +21,7 @@ class TestNotificationManager(unittest.TestCase):
 
     @unittest.skip
     def test_send_gmail(self):
-        self.nm.mc.send_email(
-            self.cs.get_email_contact("trt"), self.cs.get_google_app_passwd()
-        )
+        self.nm._send_email(self.cs.get_email_contact("trt"), "test", "test")
 
     def test_get_slack_group_id(self):
         gid = self.nm.sc.get_group_id_by_name("openshift-qe")
@@ -172,3 +174,195 @@ class TestNotificationManager(unittest.TestCase):
             self.nm.share_unverified_cve_issues_to_managers([test_issue])
 
         self.nm.sc.post_message.assert_called_once()
+
+
+class TestSlackDirectory(unittest.TestCase):
+    """Unit tests of slack directory with mocked slack web client"""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, "slack_directory.json")
+        self.client = unittest.mock.MagicMock()
+        self.client.users_list.side_effect = [
+            {
+                "members": [
+                    {"id": "U1", "profile": {"email": "Rioliu@redhat.com"}},
+                    {"id": "U2", "profile": {"email": "left@redhat.com"}, "deleted": True},
+                ],
+                "response_metadata": {"next_cursor": "c1"},
+            },
+            {
+                "members": [{"id": "U3", "profile": {"email": "jhuttana@redhat.com"}}],
+                "response_metadata": {"next_cursor": ""},
+            },
+        ]
+        self.client.api_call.side_effect = self._api_call
+
+    def _api_call(self, api_method, params=None):
+        if api_method == "usergroups.list":
+            resp = unittest.mock.MagicMock()
+            resp.data = {"usergroups": [{"handle": "openshift-qe", "id": "S1"}]}
+            return resp
+        if params["email"] == "new@redhat.com":
+            return {"user": {"id": "U4"}}
+        raise SlackApiError("users_not_found", {"ok": False, "error": "users_not_found"})
+
+    def test_lookups_are_served_from_directory(self):
+        sc = SlackClient("token", SlackDirectory(self.path))
+        sc.client = self.client
+        self.assertEqual(sc.get_user_id_by_email("rioliu+jira@redhat.com"), "<@U1>")
+        self.assertEqual(sc.get_user_id_by_email("jhuttana@redhat.com"), "<@U3>")
+        self.assertEqual(sc.get_user_id_by_email("left@redhat.com"), "left@redhat.com")
+        self.assertEqual(sc.get_user_id_by_email("left@redhat.com"), "left@redhat.com")
+        self.assertEqual(sc.get_user_id_by_email("new@redhat.com"), "<@U4>")
+        self.assertEqual(sc.get_group_id_by_name("openshift-qe"), "<!subteam^S1>")
+        self.assertEqual(sc.get_group_id_by_name("openshift-qe"), "<!subteam^S1>")
+        with self.assertRaises(NotificationException):
+            sc.get_group_id_by_name("unknown-group")
+
+        self.assertEqual(self.client.users_list.call_count, 2)
+        lookups = [c for c in self.client.api_call.call_args_list if c.kwargs.get("api_method") == "users.lookupByEmail"]
+        self.assertEqual(len(lookups), 2)
+        group_loads = [c for c in self.client.api_call.call_args_list if c.args == ("usergroups.list",)]
+        self.assertEqual(len(group_loads), 1)
+
+    def test_directory_is_persisted(self):
+        directory = SlackDirectory(self.path)
+        self.assertEqual(directory.get_user_id(self.client, "new@redhat.com"), "U4")
+
+        directory = SlackDirectory(self.path)
+        client = unittest.mock.MagicMock()
+        self.assertEqual(directory.get_user_id(client, "new@redhat.com"), "U4")
+        self.assertEqual(directory.get_user_id(client, "rioliu@redhat.com"), "U1")
+        client.users_list.assert_not_called()
+        client.api_call.assert_not_called()
+
+        directory = SlackDirectory(self.path, ttl=0)
+        client.users_list.return_value = {"members": [{"id": "U5", "profile": {"email": "qe@redhat.com"}}]}
+        self.assertEqual(directory.get_user_id(client, "qe@redhat.com"), "U5")
+        client.users_list.assert_called_once()
+
+
+class TestNotificationQueue(unittest.TestCase):
+    """Unit tests of notification queue with mocked slack web client"""
+
+    def setUp(self):
+        self.client = unittest.mock.MagicMock()
+        self.queue = NotificationQueue(self.client, channel_interval=0)
+        self.addCleanup(self.queue.close, 5)
+
+    def test_deduplicate_and_split(self):
+        self.assertTrue(self.queue.enqueue_slack("#qe", "hello"))
+        self.assertFalse(self.queue.enqueue_slack("#qe", "hello"))
+        self.assertTrue(self.queue.enqueue_slack("#qe", "x" * 5000, thread_ts="1.2", split=True, chunk_template="```{}```"))
+        self.assertTrue(self.queue.join(5))
+
+        calls = self.client.chat_postMessage.call_args_list
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(calls[0].kwargs, {"channel": "#qe", "text": "hello"})
+        self.assertEqual(calls[1].kwargs["thread_ts"], "1.2")
+        self.assertEqual(calls[1].kwargs["text"], "```" + "x" * 2500 + "```")
+        metrics = self.queue.get_metrics()
+        self.assertEqual(metrics["sent"], 3)
+        self.assertEqual(metrics["deduplicated"], 1)
+        self.assertEqual(metrics["pending"], 0)
+
+    def test_retry_rate_limited_message(self):
+        rate_limited = unittest.mock.MagicMock(status_code=429, headers={"Retry-After": "0"})
+        self.client.chat_postMessage.side_effect = [SlackApiError("ratelimited", rate_limited), None]
+        self.queue.enqueue_slack("#qe", "hello")
+        self.assertTrue(self.queue.join(5))
+        self.assertEqual(self.client.chat_postMessage.call_count, 2)
+        metrics = self.queue.get_metrics()
+        self.assertEqual((metrics["sent"], metrics["rate_limited"], metrics["retried"], metrics["failed"]), (1, 1, 1, 0))
+
+    def test_failed_message_is_kept_in_spool(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        error = unittest.mock.MagicMock(status_code=404)
+        self.client.chat_postMessage.side_effect = SlackApiError("channel_not_found", error)
+        spool_queue = NotificationQueue(self.client, spool_dir=tmp_dir.name, channel_interval=0)
+        spool_queue.enqueue_slack("#unknown", "hello")
+        spool_queue.close(5)
+        self.assertEqual(spool_queue.get_metrics()["failed"], 1)
+        self.assertEqual(len([p for p in os.listdir(tmp_dir.name) if p.endswith(".failed")]), 1)
+        with self.assertRaises(NotificationException):
+            spool_queue.enqueue_slack("#qe", "hello")
+
+    def test_malformed_spooled_message_fails(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        with open(os.path.join(tmp_dir.name, "1-x.json"), "w") as f:
+            f.write('{"kind": "slack", "text": "hi"}')
+        spool_queue = NotificationQueue(self.client, spool_dir=tmp_dir.name, channel_interval=0)
+        spool_queue.close(5)
+        metrics = spool_queue.get_metrics()
+        self.assertEqual((metrics["failed"], metrics["retried"]), (1, 0))
+        self.assertEqual(os.listdir(tmp_dir.name), ["1-x.json.failed"])
+
+    def test_spooled_email_delivered_by_next_queue(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        # process exits before the email is delivered
+        with unittest.mock.patch.object(NotificationQueue, "_deliver"):
+            first_queue = NotificationQueue(self.client, spool_dir=tmp_dir.name, channel_interval=0)
+            first_queue.enqueue_email("trt@redhat.com", "passwd", "qe@redhat.com", "subject", "content")
+            first_queue.close(5)
+        self.assertEqual(len(os.listdir(tmp_dir.name)), 1)
+
+        with unittest.mock.patch.dict(os.environ, {"GOOGLE_APP_PASSWD": "env-passwd"}), \
+                unittest.mock.patch("oar.core.notification.MailClient") as mail_client:
+            next_queue = NotificationQueue(self.client, spool_dir=tmp_dir.name, channel_interval=0)
+            self.assertTrue(next_queue.join(5))
+            next_queue.close(5)
+
+        mail_client.assert_called_once_with("trt@redhat.com", "env-passwd", keep_alive=True)
+        mail_client.return_value.send_email.assert_called_once_with("qe@redhat.com", "subject", "content")
+        self.assertEqual(next_queue.get_metrics()["sent"], 1)
+        self.assertEqual(os.listdir(tmp_dir.name), [])
+
+    def test_notification_manager_enqueues_messages(self):
+        nm = NotificationManager.__new__(NotificationManager)
+        nm.sc = unittest.mock.MagicMock()
+        nm.queue = self.queue
+        nm._post_message("#qe", "hello")
+        self.assertTrue(self.queue.join(5))
+        nm.sc.post_message.assert_not_called()
+        self.client.chat_postMessage.assert_called_once_with(channel="#qe", text="hello")
+
+    def test_notification_manager_reuses_smtp_session(self):
+        nm = NotificationManager.__new__(NotificationManager)
+        nm.cs = unittest.mock.MagicMock(release="4.19.9")
+        nm.cs.get_email_contact.side_effect = lambda team: f"{team}@redhat.com"
+        nm.cs.get_google_app_passwd.return_value = "passwd"
+        nm.cs.get_slack_channel_from_contact.return_value = "#qe"
+        nm.sc = unittest.mock.MagicMock()
+        nm.mh = unittest.mock.MagicMock()
+        nm.mh.get_mail_content_for_new_report.return_value = "content"
+        nm.mh.get_slack_message_for_new_report.return_value = "new report"
+        nm.queue = self.queue
+
+        with unittest.mock.patch.dict(os.environ, {"GOOGLE_APP_PASSWD": "passwd"}), \
+                unittest.mock.patch("oar.core.notification.smtplib.SMTP_SSL") as smtp:
+            nm.share_new_report(unittest.mock.MagicMock())
+            nm._send_email("art@redhat.com", "another subject", "content")
+            self.assertTrue(self.queue.join(5))
+
+        # one SMTP session is reused by both emails
+        smtp.assert_called_once()
+        smtp.return_value.login.assert_called_once_with("trt@redhat.com", "passwd")
+        recipients = [c.args[1] for c in smtp.return_value.sendmail.call_args_list]
+        self.assertEqual(recipients, [["qe@redhat.com"], ["art@redhat.com"]])
+        self.client.chat_postMessage.assert_called_once_with(channel="#qe", text="new report")
+
+    def test_new_report_email_skipped_without_password(self):
+        nm = NotificationManager.__new__(NotificationManager)
+        nm.cs = unittest.mock.MagicMock(release="4.19.9")
+        nm.mh = unittest.mock.MagicMock()
+        nm.queue = self.queue
+        with unittest.mock.patch.dict(os.environ, {}, clear=True):
+            nm.share_new_report(unittest.mock.MagicMock())
+        self.assertTrue(self.queue.join(5))
+        nm.mh.get_mail_content_for_new_report.assert_not_called()
+        self.assertEqual(self.queue.get_metrics()["sent"], 1)
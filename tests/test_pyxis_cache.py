@@ -0,0 +1,40 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from oar.core.pyxis_cache import PYXIS_CACHE_TTL, PyxisCache, get_freshness_grades_ttl
+
+
+class TestPyxisCache(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, "pyxis_cache.json")
+
+    def test_defaults(self):
+        cache = PyxisCache(self.path)
+        cache.put("image:abc", "A")
+        self.assertEqual(("A", True), cache.get("image:abc"))
+        # expired grades are served while they are refreshed
+        cache.put("image:stale", "B", ttl=-1)
+        self.assertEqual(("B", False), cache.get("image:stale"))
+
+    def test_get_instance_from_env(self):
+        with patch.dict(os.environ, {"OAR_PYXIS_CACHE_FILE": self.path}):
+            cache = PyxisCache.get_instance()
+        self.assertIsInstance(cache, PyxisCache)
+        self.assertEqual(self.path, cache.path)
+        self.assertIs(cache, PyxisCache.get_instance(self.path))
+
+    def test_freshness_grades_ttl(self):
+        now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        grades = [
+            {"grade": "A", "start_date": "2024-12-01T00:00:00+00:00", "end_date": "2025-01-01T01:00:00+00:00"},
+            {"grade": "B", "start_date": "2025-01-01T01:00:00+00:00", "end_date": "2025-01-01T02:00:00+00:00"},
+        ]
+        self.assertEqual(7200, get_freshness_grades_ttl(grades, now))
+        self.assertEqual(0, get_freshness_grades_ttl(grades, now + timedelta(days=1)))
+        self.assertEqual(PYXIS_CACHE_TTL, get_freshness_grades_ttl(grades + [{"grade": "C", "start_date": "2025-01-01T02:00:00+00:00"}], now))
+        self.assertEqual(PYXIS_CACHE_TTL, get_freshness_grades_ttl([], now))
@@ -1,14 +1,17 @@
 import unittest
 import gitlab
 import os
+import tempfile
+import threading
 from unittest.mock import MagicMock, patch
-from oar.core.shipment import GitLabMergeRequest, ShipmentData, GitLabServer, ImageHealthData
+from oar.core.shipment import GitLabMergeRequest, ShipmentData, GitLabServer, ImageHealthData, ShipmentDocument
 from oar.core.exceptions import (
     GitLabServerException,
     ShipmentDataException,
     GitLabMergeRequestException
 )
 from oar.core.configstore import ConfigStore
+from oar.core.pyxis_cache import PyxisCache
 
 
 class TestGitLabServer(unittest.TestCase):
@@ -58,6 +61,54 @@ class TestGitLabServer(unittest.TestCase):
             self.server.get_username_by_email("test@example.com")
         self.assertIn("GitLab API error", str(context.exception))
 
+    def test_commit_files(self):
+        upstream = MagicMock(id=42)
+        fork = MagicMock()
+        fork.commits.create.return_value = MagicMock(id="abc123")
+        self.mock_gl.projects.get.side_effect = lambda name: upstream if name == "upstream/repo" else fork
+
+        commit_id = self.server.commit_files(
+            "fork/repo", "drop-bugs", "drop bugs", {"a.yaml": "a", "b.yaml": "b"},
+            start_branch="release", start_project_name="upstream/repo", last_commit_ids={"a.yaml": "a-commit"})
+
+        self.assertEqual(commit_id, "abc123")
+        fork.commits.create.assert_called_once_with({
+            'branch': 'drop-bugs',
+            'commit_message': 'drop bugs',
+            'actions': [
+                {'action': 'update', 'file_path': 'a.yaml', 'content': 'a', 'last_commit_id': 'a-commit'},
+                {'action': 'update', 'file_path': 'b.yaml', 'content': 'b'},
+            ],
+            'start_branch': 'release',
+            'start_project': 42,
+        })
+
+        # start_sha takes precedence over start_branch
+        self.server.commit_files("fork/repo", "drop-bugs", "drop bugs", {"a.yaml": "a"},
+                                 start_branch="release", start_sha="abc", start_project_name="upstream/repo")
+        data = fork.commits.create.call_args.args[0]
+        self.assertEqual(data['start_sha'], "abc")
+        self.assertNotIn('start_branch', data)
+
+    def test_commit_files_api_error(self):
+        self.mock_gl.projects.get.return_value.commits.create.side_effect = gitlab.exceptions.GitlabCreateError("conflict")
+        with self.assertRaises(GitLabServerException):
+            self.server.commit_files("fork/repo", "drop-bugs", "drop bugs", {"a.yaml": "a"})
+        with self.assertRaises(ValueError):
+            self.server.commit_files("fork/repo", "drop-bugs", "drop bugs", {})
+
+    def test_get_files(self):
+        def get_file(file_path, ref):
+            if file_path == "missing.yaml":
+                raise gitlab.exceptions.GitlabGetError("not found")
+            return MagicMock(decode=MagicMock(return_value=f"{ref}:{file_path}".encode()), last_commit_id="a-commit")
+        self.mock_gl.projects.get.return_value.files.get.side_effect = get_file
+
+        files = self.server.get_files(123, "abc123", ["a.yaml", "missing.yaml", "a.yaml"])
+
+        self.assertEqual(files, {"a.yaml": ("abc123:a.yaml", "a-commit")})
+        self.mock_gl.projects.get.assert_called_once_with(123)
+
     def test_get_username_by_email_real(self):
         """Test with real GitLab API (requires GITLAB_TOKEN env var)"""
         if not os.getenv('GITLAB_TOKEN'):
@@ -153,16 +204,42 @@ class TestGitLabMergeRequest(unittest.TestCase):
         # Setup mock project files to return string content directly
         self.mock_project.files.get.return_value = "test content"
         self.mock_mr.source_branch = "test-branch"
+        self.mock_mr.sha = "abc123"
 
         # Test with mock file path
         file_path = "test.txt"
         content = self.client.get_file_content(file_path)
         self.assertEqual(content, "test content")
+        # content is read at the head commit the cache is keyed by
         self.mock_project.files.get.assert_called_once_with(
             file_path=file_path,
-            ref="test-branch"
+            ref="abc123"
         )
 
+    def test_load_files_cached_by_sha(self):
+        self.mock_mr.source_branch = "test-branch"
+        self.mock_mr.sha = "abc123"
+        self.mock_project.files.get.side_effect = lambda file_path, ref: f"content of {file_path}"
+
+        contents = self.client.load_files(["a.yaml", "b.yaml", "a.yaml"])
+        self.assertEqual(contents, {"a.yaml": "content of a.yaml", "b.yaml": "content of b.yaml"})
+        self.assertEqual(self.mock_project.files.get.call_count, 2)
+
+        # another instance of the same MR head reuses the cached contents
+        other = GitLabMergeRequest.__new__(GitLabMergeRequest)
+        other.project_name = self.client.project_name
+        other.merge_request_id = 123
+        other.mr = self.mock_mr
+        other._project = self.mock_project
+        self.assertEqual(other.get_file_content("b.yaml"), "content of b.yaml")
+        other.load_files(["a.yaml", "c.yaml"])
+        self.assertEqual(self.mock_project.files.get.call_count, 3)
+
+        # new commit on source branch invalidates the cached contents
+        self.mock_mr.sha = "def456"
+        self.client.get_file_content("a.yaml")
+        self.assertEqual(self.mock_project.files.get.call_count, 4)
+
     def test_get_file_content_real_mr(self):
         """Test with real MR ID 15 and print content"""
         try:
@@ -396,6 +473,28 @@ class TestGitLabMergeRequest(unittest.TestCase):
             else:
                 self.fail(f"Failed to add suggestion to real MR: {str(e)}")
 
+    def test_get_release_info_cached_pipeline_work(self):
+        older = MagicMock(id=1, created_at="2025-08-01T00:00:00Z")
+        newer = MagicMock(id=2, created_at="2025-08-02T00:00:00Z")
+        self.mock_mr.pipelines.list.return_value = [older, newer]
+        pipeline = MagicMock(id=2, status="success", updated_at="2025-08-02T01:00:00Z")
+        self.mock_project.pipelines.get.return_value = pipeline
+        pipeline.jobs.list.return_value = [MagicMock(stage="stage-release-triggers", status="success")]
+        pipeline.bridges.list.return_value = [MagicMock(stage="prod-release-triggers", status="running")]
+
+        self.assertEqual(self.client.get_stage_release_info()['status'], "success")
+        self.assertEqual(self.client.get_prod_release_info()['status'], "running")
+        self.assertEqual(self.client.get_release_info("unknown")['status'], "not_found")
+        self.mock_project.pipelines.get.assert_called_with(2)
+        self.assertEqual(self.mock_project.pipelines.get.call_count, 3)
+        pipeline.jobs.list.assert_called_once()
+        pipeline.bridges.list.assert_called_once()
+
+        # jobs are listed again when the pipeline is updated
+        pipeline.updated_at = "2025-08-02T02:00:00Z"
+        self.client.get_prod_release_info()
+        self.assertEqual(pipeline.jobs.list.call_count, 2)
+
     def test_get_pipeline_stage_info_real_mr(self):
         """Test getting stage-release-triggers status from real MR (requires GITLAB_TOKEN env var)"""
         if not os.getenv('GITLAB_TOKEN'):
@@ -505,6 +604,49 @@ class TestGitLabMergeRequest(unittest.TestCase):
                 self.fail(f"Failed to test stage/prod release with labels: {str(e)}")
 
 
+class TestShipmentDocument(unittest.TestCase):
+    CONTENT = """shipment:
+  environments:
+    stage:
+      advisory:
+        internal_url: https://example.com/advisory.yaml
+  snapshot:
+    spec:
+      components:
+      - name: ose-cli
+        containerImage: quay.io/ocp/ose-cli@sha256:abc
+  data:
+    releaseNotes:
+      issues:
+        fixed:
+        - id: OCPBUGS-12
+          source: redhat.atlassian.net
+        - id: OCPBUGS-123
+          source: redhat.atlassian.net
+        - id: '456'
+          source: bugzilla.redhat.com
+"""
+
+    def test_index(self):
+        doc = ShipmentDocument("a.yaml", self.CONTENT)
+        self.assertEqual(doc.jira_issues, {"OCPBUGS-12", "OCPBUGS-123"})
+        self.assertEqual(doc.advisory_url, "https://example.com/advisory.yaml")
+        self.assertEqual(doc.images, ["quay.io/ocp/ose-cli@sha256:abc"])
+        self.assertEqual(doc.issues["OCPBUGS-123"].spans, [(16, 17)])
+        self.assertEqual(doc.issues["456"].source, "bugzilla.redhat.com")
+        self.assertEqual(doc.get_line_number("OCPBUGS-123"), 17)
+        self.assertEqual(doc.get_line_number("ose-cli"), 9)
+        self.assertIsNone(doc.get_line_number("OCPBUGS-999"))
+
+    def test_remove_issues(self):
+        doc = ShipmentDocument("a.yaml", self.CONTENT)
+        content = doc.remove_issues(["OCPBUGS-12", "OCPBUGS-999"])
+        self.assertNotIn("OCPBUGS-12\n", content)
+        self.assertIn("- id: OCPBUGS-123\n          source: redhat.atlassian.net", content)
+        self.assertEqual(len(content.split("\n")), len(self.CONTENT.split("\n")) - 2)
+        self.assertEqual(doc.remove_issues([]), self.CONTENT)
+
+
 class TestShipmentData(unittest.TestCase):
     @patch('oar.core.configstore.ConfigStore')
     def setUp(self, mock_config):
@@ -722,6 +864,206 @@ class TestShipmentDataMergedMR(unittest.TestCase):
         mock_mr.is_opened.assert_called_once()
 
 
+class TestShipmentDropBugs(unittest.TestCase):
+    """Tests for dropping bugs through GitLab API with git clone fallback"""
+
+    CONTENT = (
+        "shipment:\n"
+        "  data:\n"
+        "    releaseNotes:\n"
+        "      issues:\n"
+        "        fixed:\n"
+        "        - id: OCPBUGS-1\n"
+        "          source: issues.redhat.com\n"
+        "        - id: OCPBUGS-2\n"
+        "          source: issues.redhat.com\n"
+    )
+
+    def setUp(self):
+        self.shipment = ShipmentData.__new__(ShipmentData)
+        self.shipment._cs = MagicMock()
+        self.shipment._cs.release = "4.19.9"
+        self.shipment._mr = MagicMock()
+        self.shipment._mr.get_source_branch.return_value = "prepare-shipment-4.19.9"
+        self.shipment._mr.mr.sha = "release-sha"
+        self.shipment._mr.get_all_files.return_value = ["image.yaml", "extras.yaml"]
+        self.shipment._mr.load_files.return_value = {"image.yaml": self.CONTENT, "extras.yaml": "shipment: {}\n"}
+        patcher = patch('oar.core.shipment.JiraManager')
+        mock_jira = patcher.start()
+        self.addCleanup(patcher.stop)
+        mock_jira.return_value.get_unverified_issues_excluding_cve.return_value = ["OCPBUGS-2"]
+        patcher = patch('oar.core.shipment.GitLabServer')
+        self.gl = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        patcher = patch('oar.core.shipment.GitHelper')
+        self.mock_git_helper = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_drop_bugs_new_mr_with_api(self):
+        self.gl.get_mr_by_title.return_value = None
+
+        dropped = self.shipment.drop_bugs()
+
+        self.assertEqual(dropped, ["OCPBUGS-2"])
+        self.gl.commit_files.assert_called_once()
+        args, kwargs = self.gl.commit_files.call_args
+        self.assertEqual(args[0], "rioliu/ocp-shipment-data")
+        self.assertTrue(args[1].startswith("drop-bugs-for-4.19.9-"))
+        self.assertEqual(list(args[3]), ["image.yaml"])
+        self.assertIn("OCPBUGS-1", args[3]["image.yaml"])
+        self.assertNotIn("OCPBUGS-2", args[3]["image.yaml"])
+        # new branch is created from the commit the files are read at
+        self.assertEqual(kwargs["start_sha"], "release-sha")
+        self.assertNotIn("start_branch", kwargs)
+        self.assertEqual(kwargs["start_project_name"], "hybrid-platforms/art/ocp-shipment-data")
+        self.gl.create_merge_request.assert_called_once()
+        self.mock_git_helper.assert_not_called()
+
+    def test_drop_bugs_existing_mr_with_api(self):
+        mr = MagicMock()
+        mr.mr.source_project_id = 123
+        mr.mr.sha = "mr-head-sha"
+        mr.get_source_branch.return_value = "drop-bugs-for-4.19.9-1"
+        self.gl.get_mr_by_title.return_value = mr
+        self.gl.get_files.return_value = {
+            "image.yaml": (self.CONTENT, "image-commit"),
+            "extras.yaml": ("shipment: {}\n", "extras-commit"),
+        }
+
+        dropped = self.shipment.drop_bugs()
+
+        self.assertEqual(dropped, ["OCPBUGS-2"])
+        self.gl.get_files.assert_called_once_with(123, "mr-head-sha", ["image.yaml", "extras.yaml"])
+        args, kwargs = self.gl.commit_files.call_args
+        self.assertEqual(args[:2], (123, "drop-bugs-for-4.19.9-1"))
+        # commit fails instead of overwriting files changed on the branch after they are read
+        self.assertEqual(kwargs, {"last_commit_ids": {"image.yaml": "image-commit"}})
+        self.gl.create_merge_request.assert_not_called()
+        self.mock_git_helper.assert_not_called()
+
+    def test_drop_bugs_nothing_to_drop(self):
+        self.gl.get_mr_by_title.return_value = None
+        self.shipment._mr.load_files.return_value = {"extras.yaml": "shipment: {}\n"}
+
+        self.assertEqual(self.shipment.drop_bugs(), [])
+        self.gl.commit_files.assert_not_called()
+        self.gl.create_merge_request.assert_not_called()
+
+    def test_drop_bugs_falls_back_to_git(self):
+        self.gl.get_mr_by_title.return_value = None
+        self.gl.commit_files.side_effect = GitLabServerException("commit failed")
+        with tempfile.TemporaryDirectory() as repo_dir:
+            with open(os.path.join(repo_dir, "image.yaml"), "w") as f:
+                f.write(self.CONTENT)
+            gh = self.mock_git_helper.return_value
+            gh.checkout_repo.return_value = repo_dir
+
+            dropped = self.shipment.drop_bugs()
+
+            with open(os.path.join(repo_dir, "image.yaml")) as f:
+                self.assertNotIn("OCPBUGS-2", f.read())
+        self.assertEqual(dropped, ["OCPBUGS-2"])
+        gh.create_branch.assert_called_once()
+        gh.commit_changes.assert_called_once_with("drop bugs from shipment yaml files", files=["image.yaml"])
+        gh.push_changes.assert_called_once_with("ert-release-bot")
+        self.gl.create_merge_request.assert_called_once()
+
+
+class TestShipmentImageHealthScan(unittest.TestCase):
+    """Tests for deduplicated and batched Pyxis queries with mocked session"""
+
+    def setUp(self):
+        self.shipment = ShipmentData.__new__(ShipmentData)
+        self.shipment._mr = MagicMock()
+        self.shipment._mr.merge_request_id = 427
+        self.shipment._advisory_documents = {}
+        self.shipment._advisory_documents_lock = threading.Lock()
+        self.session = MagicMock()
+        patcher = patch('oar.core.shipment.get_pyxis_session', return_value=self.session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.cache = PyxisCache(os.path.join(tmp_dir.name, "pyxis_cache.json"))
+        patcher = patch('oar.core.shipment.PyxisCache.get_instance', return_value=self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _response(self, data):
+        response = MagicMock()
+        response.json.return_value = {"data": data}
+        return response
+
+    @patch('oar.core.shipment.ShipmentData.is_stage_release_success', return_value=True)
+    @patch('oar.core.shipment.ShipmentData._get_images_from_shipment')
+    def test_check_component_image_health_dedup(self, mock_images, mock_stage):
+        mock_images.return_value = [
+            {"component": "cli", "containerImage": "cli@sha256:123", "architecture": "amd64"},
+            {"component": "cli", "containerImage": "cli@sha256:123", "architecture": "amd64"},
+            {"component": "installer", "containerImage": "installer@sha256:456", "architecture": "arm64"},
+        ]
+        vuln_link = {"vulnerabilities": {"href": "/v1/images/id/def/vulnerabilities"}}
+
+        def get(url, **kwargs):
+            if "vulnerabilities" in url:
+                return self._response([{"cve_id": "CVE-2025-1"}])
+            return self._response([
+                {"image_id": "sha256:123", "freshness_grades": [{"start_date": "2025-01-01T00:00:00Z", "grade": "A"}]},
+                {"image_id": "sha256:456", "freshness_grades": [{"start_date": "2025-01-01T00:00:00Z", "grade": "F"}], "_links": vuln_link},
+            ])
+
+        self.session.get.side_effect = get
+        health_data = self.shipment.check_component_image_health()
+
+        self.assertEqual(health_data.total_scanned, 3)
+        self.assertEqual([c["name"] for c in health_data.unhealthy_components], ["installer"])
+        self.assertEqual(health_data.unhealthy_components[0]["vulnerabilities"], [{"cve_id": "CVE-2025-1"}])
+        # one batch query for unique digests and one vulnerabilities query
+        self.assertEqual(self.session.get.call_count, 2)
+        self.assertIn("image_id=in=(sha256:123,sha256:456)", self.session.get.call_args_list[0].args[0])
+
+        # grades and vulnerabilities are served from cache
+        self.assertEqual(self.shipment.check_component_image_health().unhealthy_count, 1)
+        self.assertEqual(self.session.get.call_count, 2)
+
+    @patch('oar.core.shipment.get_advisory_session')
+    def test_get_images_from_shipment(self, mock_session):
+        mr = MagicMock()
+        mr.get_all_files.return_value = ["a.image.yaml", "b.image.yaml", "c.fbc.yaml"]
+        documents = {
+            "a.image.yaml": MagicMock(advisory_url="https://example.com/ad1.yaml"),
+            "b.image.yaml": MagicMock(advisory_url="https://example.com/ad2.yaml"),
+        }
+        mr.get_shipment_document.side_effect = lambda file_path: documents[file_path]
+
+        def get(url, **kwargs):
+            response = MagicMock()
+            if url.endswith("ad2.yaml"):
+                response.raise_for_status.side_effect = ConnectionError("not found")
+            response.text = "spec:\n  content:\n    images:\n    - containerImage: cli@sha256:123\n"
+            return response
+
+        mock_session.return_value.get.side_effect = get
+        images = self.shipment._get_images_from_shipment(mr)
+        self.assertEqual(images, [{"containerImage": "cli@sha256:123"}])
+        mr.load_files.assert_called_once_with(["a.image.yaml", "b.image.yaml"])
+
+        # fetched advisory is cached, failed one is fetched again
+        self.shipment._get_images_from_shipment(mr)
+        urls = [c.args[0] for c in mock_session.return_value.get.call_args_list]
+        self.assertEqual(sorted(urls), sorted(["https://example.com/ad1.yaml"] + ["https://example.com/ad2.yaml"] * 2))
+
+    def test_query_images_freshness_fallback(self):
+        def get(url, **kwargs):
+            if "image_id=in=" in url:
+                raise ConnectionError("proxy error")
+            return self._response([{"image_id": "sha256:123", "freshness_grades": [{"grade": "A"}]}])
+
+        self.session.get.side_effect = get
+        freshness = self.shipment._query_images_freshness(["123"])
+        self.assertEqual(freshness, {"123": ([{"grade": "A"}], "")})
+
+
 class TestShipmentImageHealth(unittest.TestCase):
     """Tests for container image health checking functionality"""
 
@@ -736,7 +1078,7 @@ class TestShipmentImageHealth(unittest.TestCase):
 
     @patch('oar.core.shipment.ShipmentData.is_stage_release_success', return_value=True)
     @patch('oar.core.shipment.ShipmentData._query_pyxis_vulnerabilities')
-    @patch('oar.core.shipment.ShipmentData._query_pyxis_freshness')
+    @patch('oar.core.shipment.ShipmentData._query_pyxis_freshness_batch')
     @patch('oar.core.shipment.ShipmentData._get_images_from_shipment')
     def test_check_component_image_health(self, mock_components, mock_pyxis, mock_vulns, mock_stage):
         """Test checking container image health status"""
@@ -744,10 +1086,10 @@ class TestShipmentImageHealth(unittest.TestCase):
             {"component": "test-component1", "containerImage": "test1@sha256:123", "architecture": "amd64"},
             {"component": "test-component2", "containerImage": "test2@sha256:456", "architecture": "arm64"}
         ]
-        mock_pyxis.side_effect = [
-            ([{"start_date": "2025-01-01T00:00:00Z", "grade": "A"}, {"start_date": "2025-02-01T00:00:00Z", "grade": "C"}], "/v1/images/id/abc/vulnerabilities"),
-            ([{"start_date": "2025-02-01T00:00:00Z", "grade": "F"}], "/v1/images/id/def/vulnerabilities"),
-        ]
+        mock_pyxis.return_value = {
+            "123": ([{"start_date": "2025-01-01T00:00:00Z", "grade": "A"}, {"start_date": "2025-02-01T00:00:00Z", "grade": "C"}], "/v1/images/id/abc/vulnerabilities"),
+            "456": ([{"start_date": "2025-02-01T00:00:00Z", "grade": "F"}], "/v1/images/id/def/vulnerabilities"),
+        }
         mock_vulns.return_value = []
 
         health_data = self.shipment.check_component_image_health()
@@ -1,13 +1,17 @@
 from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from gspread.exceptions import WorksheetNotFound
+from gspread.utils import rowcol_to_a1
 from gspread_formatting import get_text_format_runs
 import time
 
 from oar.core.advisory import AdvisoryManager
 from oar.core.configstore import ConfigStore
 from oar.core.const import *
-from oar.core.exceptions import WorksheetException
+from oar.core.exceptions import JiraException, WorksheetException
 from oar.core.worksheet import WorksheetManager
 from oar.core.worksheet import TestReport
+from oar.core.worksheet import CachedSpreadsheet, clear_gspread_cache
 
 
 class TestWorksheetManager(TestCase):
@@ -277,3 +281,327 @@ class TestTestReport(TestCase):
             self.assertIn(expected_text, cell_value)
             # Verify no HYPERLINK formulas are present
             self.assertNotIn('=HYPERLINK(', cell_value)
+
+
+class TestTestReportSnapshot(TestCase):
+    """Unit tests of snapshot based TestReport with mocked worksheet and jira"""
+
+    def setUp(self):
+        self.ws = MagicMock()
+        self.cs = MagicMock()
+        self.cs.is_konflux_flow.return_value = False
+        self.fixed_rows = [
+            ["Overall Status", OVERALL_STATUS_GREEN],
+            ["Advisories", "rpm: 123"],
+            ["Build", "x86_64: 4.15.0-0.nightly"],
+            ["Jira", "ART-9191"],
+            [], [], [],
+            ["Take ownership", TASK_STATUS_PASS],
+            ["Bugs to verify", TASK_STATUS_NOT_STARTED],
+        ]
+        self.table_rows = []
+        self.ws.batch_get.side_effect = lambda ranges: [self.fixed_rows, self.table_rows]
+        self.tr = TestReport(self.ws, self.cs)
+
+    def _issue(self, key, qa_contact, status, cve_tracker=False):
+        issue = MagicMock()
+        issue.get_key.return_value = key
+        issue.get_qa_contact.return_value = qa_contact
+        issue.get_status.return_value = status
+        issue.is_on_qa.return_value = status == JIRA_STATUS_ON_QA
+        issue.is_cve_tracker.return_value = cve_tracker
+        return issue
+
+    def _flushed_cells(self):
+        cells = {}
+        for call in self.ws.batch_update.call_args_list:
+            for data in call.args[0]:
+                cells[data["range"]] = data["values"][0][0]
+        return cells
+
+    def test_get_values_from_snapshot(self):
+        self.assertEqual(self.tr.get_overall_status(), OVERALL_STATUS_GREEN)
+        self.assertEqual(self.tr.get_build_info(), "x86_64: 4.15.0-0.nightly")
+        self.assertEqual(self.tr.get_jira_info(), "ART-9191")
+        self.assertTrue(self.tr.is_task_pass(LABEL_TASK_OWNERSHIP))
+        self.assertTrue(self.tr.is_task_not_started(LABEL_TASK_BUGS_TO_VERIFY))
+        self.assertIsNone(self.tr.get_task_status(LABEL_TASK_DROP_BUGS))
+        self.ws.batch_get.assert_called_once_with([LABEL_REPORT_FIXED_RANGE, LABEL_REPORT_TABLE_RANGE])
+        self.ws.acell.assert_not_called()
+
+    def test_update_task_status(self):
+        self.tr.update_task_status(LABEL_TASK_BUGS_TO_VERIFY, TASK_STATUS_FAIL)
+        self.ws.batch_update.assert_called_once()
+        self.assertEqual(self._flushed_cells(), {
+            LABEL_TASK_BUGS_TO_VERIFY: TASK_STATUS_FAIL,
+            LABEL_OVERALL_STATUS: OVERALL_STATUS_RED,
+        })
+        self.assertTrue(self.tr.is_overall_status_red())
+
+        self.fixed_rows[0][1] = OVERALL_STATUS_RED
+        self.fixed_rows[8][1] = TASK_STATUS_FAIL
+        self.ws.batch_update.reset_mock()
+        self.tr.update_task_status(LABEL_TASK_BUGS_TO_VERIFY, TASK_STATUS_PASS)
+        self.ws.batch_update.assert_called_once()
+        self.assertEqual(self._flushed_cells(), {
+            LABEL_TASK_BUGS_TO_VERIFY: TASK_STATUS_PASS,
+            LABEL_OVERALL_STATUS: OVERALL_STATUS_GREEN,
+        })
+        self.assertEqual(self.ws.batch_get.call_count, 2)
+        self.ws.acell.assert_not_called()
+        self.ws.update_acell.assert_not_called()
+
+    def test_flush_and_refresh(self):
+        tr = TestReport(self.ws, self.cs, auto_flush=False)
+        tr.update_build_info("x86_64: 4.15.0-0.nightly-2")
+        tr.update_jira_info("ART-1")
+        self.ws.batch_update.assert_not_called()
+        self.assertEqual(tr.get_jira_info(), "ART-1")
+
+        # pending changes are kept when snapshot is refreshed
+        tr.refresh()
+        self.assertEqual(tr.get_build_info(), "x86_64: 4.15.0-0.nightly-2")
+
+        tr.flush()
+        self.ws.batch_update.assert_called_once()
+        self.assertEqual(self._flushed_cells(), {
+            LABEL_BUILD: "x86_64: 4.15.0-0.nightly-2",
+            LABEL_JIRA: tr._to_hyperlink("https://redhat.atlassian.net/browse/ART-1", "ART-1"),
+        })
+        tr.flush()
+        self.ws.batch_update.assert_called_once()
+
+    @patch("oar.core.worksheet.JiraManager")
+    def test_update_bug_list(self, mock_jm):
+        self.table_rows = [
+            ["OCPBUGS-1", "qa1@redhat.com", JIRA_STATUS_ON_QA],
+            ["OCPBUGS-2", "qa2@redhat.com", JIRA_STATUS_ON_QA],
+            ["OCPBUGS-3", "qa3@redhat.com", JIRA_STATUS_ON_QA],
+            ["OCPBUGS-4", "qa4@redhat.com"],
+        ]
+        mock_jm.return_value.get_issues.return_value = {
+            "OCPBUGS-1": self._issue("OCPBUGS-1", "qa1@redhat.com", JIRA_STATUS_ON_QA),
+            "OCPBUGS-2": self._issue("OCPBUGS-2", "new-qa@redhat.com", JIRA_STATUS_VERIFIED),
+            "OCPBUGS-3": self._issue("OCPBUGS-3", "qa3@redhat.com", JIRA_STATUS_ON_QA),
+            "OCPBUGS-5": self._issue("OCPBUGS-5", "qa5@redhat.com", JIRA_STATUS_ON_QA),
+            "OCPBUGS-6": self._issue("OCPBUGS-6", "qa6@redhat.com", JIRA_STATUS_VERIFIED),
+        }
+
+        self.tr.update_bug_list(
+            ["OCPBUGS-1", "OCPBUGS-2", "OCPBUGS-4", "OCPBUGS-5", "OCPBUGS-6", "OCPBUGS-7"],
+            ["OCPBUGS-1"],
+        )
+
+        self.ws.batch_get.assert_called_once()
+        self.ws.acell.assert_not_called()
+        self.ws.update_acell.assert_not_called()
+        mock_jm.return_value.get_issues.assert_called_once_with(
+            ["OCPBUGS-1", "OCPBUGS-2", "OCPBUGS-3", "OCPBUGS-4", "OCPBUGS-5", "OCPBUGS-6", "OCPBUGS-7"]
+        )
+        self.ws.batch_update.assert_called_once()
+        self.assertEqual(self._flushed_cells(), {
+            "E8": JIRA_STATUS_DROPPED,
+            "D9": "new-qa@redhat.com",
+            "E9": JIRA_STATUS_VERIFIED,
+            "E10": JIRA_STATUS_DROPPED,
+            "C12": self.tr._to_hyperlink("https://redhat.atlassian.net/browse/OCPBUGS-5", "OCPBUGS-5"),
+            "D12": "qa5@redhat.com",
+            "E12": JIRA_STATUS_ON_QA,
+        })
+        self.assertEqual(self.tr._get_bug_table()[-1], ["OCPBUGS-5", "qa5@redhat.com", JIRA_STATUS_ON_QA])
+
+    @patch("oar.core.worksheet.JiraManager")
+    def test_update_bug_list_without_changes(self, mock_jm):
+        self.table_rows = [["OCPBUGS-1", "qa1@redhat.com", JIRA_STATUS_ON_QA]]
+        mock_jm.return_value.get_issues.return_value = {
+            "OCPBUGS-1": self._issue("OCPBUGS-1", "qa1@redhat.com", JIRA_STATUS_ON_QA),
+        }
+        self.tr.update_bug_list(["OCPBUGS-1"])
+        self.ws.batch_update.assert_not_called()
+
+    def test_are_all_bugs_verified(self):
+        self.table_rows = [
+            ["OCPBUGS-1", "qa1@redhat.com", JIRA_STATUS_VERIFIED],
+            ["OCPBUGS-2", "qa2@redhat.com", JIRA_STATUS_DROPPED],
+            ["OCPBUGS-3", "qa3@redhat.com", JIRA_STATUS_CLOSED],
+        ]
+        self.assertTrue(self.tr.are_all_bugs_verified())
+
+        self.table_rows.append(["OCPBUGS-4", "qa4@redhat.com", JIRA_STATUS_ON_QA])
+        self.tr.refresh()
+        self.assertFalse(self.tr.are_all_bugs_verified())
+        self.ws.acell.assert_not_called()
+
+        self.table_rows = []
+        self.tr.refresh()
+        self.assertTrue(self.tr.are_all_bugs_verified())
+
+    def test_others_section(self):
+        self.table_rows = [
+            ["OCPBUGS-1", "", "", "", "", "OCPQE-1"],
+            ["OCPBUGS-2", "", "", "", "", ""],
+            ["OCPBUGS-3", "", "", "", "", "OCPQE-2"],
+        ]
+        self.assertEqual(self.tr._get_issues_from_others_section(), ["OCPQE-1", "", "OCPQE-2"])
+        self.tr.add_jira_to_others_section("OCPQE-3")
+        self.assertEqual(self._flushed_cells(), {"H9": self.tr._to_hyperlink("https://redhat.atlassian.net/browse/OCPQE-3", "OCPQE-3")})
+        self.assertEqual(self.tr._get_issues_from_others_section(), ["OCPQE-1", "OCPQE-3", "OCPQE-2"])
+
+    def test_hyperlinks_flushed_with_dirty_cells(self):
+        self.ws.id = 7
+        tr = TestReport(self.ws, self.cs, auto_flush=False)
+        tr.update_build_info("x86_64: 4.15.0-0.nightly-2")
+        tr.update_cell_with_hyperlinks(LABEL_AD_OR_SHIPMENT, [("rpm: 123", "https://errata/123", "123")])
+        tr.flush()
+
+        self.ws.batch_get.assert_not_called()
+        self.ws.batch_update.assert_not_called()
+        self.ws.spreadsheet.batch_update.assert_called_once()
+        requests = self.ws.spreadsheet.batch_update.call_args.args[0]["requests"]
+        self.assertEqual(len(requests), 2)
+        self.assertEqual(requests[0]["updateCells"]["rows"][0]["values"][0]["userEnteredValue"],
+                         {"stringValue": "x86_64: 4.15.0-0.nightly-2"})
+        self.assertEqual(requests[0]["updateCells"]["fields"], "userEnteredValue")
+        self.assertEqual(requests[1]["updateCells"]["range"]["sheetId"], 7)
+        self.assertEqual(tr.get_advisory_or_shipment_info(), "rpm: 123")
+
+    def test_hyperlinks_fallback_on_flush(self):
+        self.ws.spreadsheet.batch_update.side_effect = Exception("format runs are not supported")
+        self.assertEqual(self.tr.get_advisory_or_shipment_info(), "rpm: 123")
+        with self.assertLogs("oar.core.worksheet", level="WARNING") as cm:
+            self.tr.update_cell_with_hyperlinks(LABEL_AD_OR_SHIPMENT, [("rpm: 123", "https://errata/123", "123")])
+        self.assertIn("Advanced hyperlink formatting failed, falling back to plain text with URLs", cm.output[0])
+        self.assertEqual(self._flushed_cells(), {LABEL_AD_OR_SHIPMENT: "rpm: 123 (https://errata/123)"})
+        self.assertEqual(self.tr.get_advisory_or_shipment_info(), "rpm: 123 (https://errata/123)")
+
+
+class TestCreateTestReport(TestCase):
+    """Unit tests of one-shot test report creation with mocked spreadsheet and jira"""
+
+    @patch("oar.core.worksheet.ShipmentData")
+    @patch("oar.core.worksheet.JiraManager")
+    def test_create_test_report(self, mock_jm, mock_shipment):
+        cs = MagicMock()
+        cs.release = "4.15.4"
+        cs.is_konflux_flow.return_value = False
+        cs.get_candidate_builds.return_value = {"x86_64": "4.15.0-0.nightly-2024-03-20-032212"}
+        cs.get_advisories.return_value = {"rpm": 129357}
+        cs.get_jira_ticket.return_value = "ART-1"
+        mock_shipment.return_value.get_jira_issues.return_value = ["OCPBUGS-1", "OCPBUGS-2", "OCPBUGS-3"]
+        on_qa_issue = MagicMock()
+        on_qa_issue.is_on_qa.return_value = True
+        on_qa_issue.get_qa_contact.return_value = "qa1@redhat.com"
+        on_qa_issue.get_status.return_value = JIRA_STATUS_ON_QA
+        verified_issue = MagicMock()
+        verified_issue.is_on_qa.return_value = False
+        # OCPBUGS-3 is not accessible
+        mock_jm.return_value.get_issues.return_value = {"OCPBUGS-1": on_qa_issue, "OCPBUGS-2": verified_issue}
+
+        wm = WorksheetManager.__new__(WorksheetManager)
+        wm._cs = cs
+        wm._doc = MagicMock()
+        wm._doc.fetch_sheet_metadata.return_value = {"sheets": [{"properties": {"title": "template", "sheetId": 1}}]}
+        wm._spreadsheet = CachedSpreadsheet(wm._doc)
+        wm._template = wm._spreadsheet.worksheet("template")
+        new_sheet = wm._doc.duplicate_sheet.return_value
+        new_sheet.title = "4.15.4"
+
+        report = wm.create_test_report()
+
+        wm._doc.duplicate_sheet.assert_called_once_with(wm._template.id, new_sheet_name="4.15.4")
+        new_sheet.update_title.assert_not_called()
+        new_sheet.batch_get.assert_not_called()
+        new_sheet.batch_update.assert_not_called()
+        new_sheet.update_acell.assert_not_called()
+        new_sheet.spreadsheet.batch_update.assert_called_once()
+        mock_jm.return_value.get_issues.assert_called_once_with(["OCPBUGS-1", "OCPBUGS-2", "OCPBUGS-3"])
+
+        cells = {}
+        for request in new_sheet.spreadsheet.batch_update.call_args.args[0]["requests"]:
+            cell_range = request["updateCells"]["range"]
+            label = rowcol_to_a1(cell_range["startRowIndex"] + 1, cell_range["startColumnIndex"] + 1)
+            cells[label] = request["updateCells"]["rows"][0]["values"][0]
+        self.assertEqual(cells[LABEL_BUILD]["userEnteredValue"], {"stringValue": "x86_64: 4.15.0-0.nightly-2024-03-20-032212"})
+        self.assertEqual(cells[LABEL_JIRA]["userEnteredValue"],
+                         {"formulaValue": '=HYPERLINK("https://redhat.atlassian.net/browse/ART-1","ART-1")'})
+        self.assertIn("textFormatRuns", cells[LABEL_AD_OR_SHIPMENT])
+        self.assertEqual(cells["D8"]["userEnteredValue"], {"stringValue": "qa1@redhat.com"})
+        self.assertNotIn("C9", cells)
+        self.assertIn(LABEL_SIPPY_AUTO_RELEASE, cells)
+        self.assertTrue(report._auto_flush)
+        self.assertIs(wm.get_test_report()._ws, new_sheet)
+
+    @patch("oar.core.worksheet.ShipmentData")
+    @patch("oar.core.worksheet.JiraManager")
+    def test_create_test_report_jira_failure(self, mock_jm, mock_shipment):
+        cs = MagicMock()
+        cs.release = "4.15.4"
+        mock_shipment.return_value.get_jira_issues.return_value = ["OCPBUGS-1"]
+        mock_jm.return_value.get_issues.side_effect = JiraException("search jira issues failed")
+
+        wm = WorksheetManager.__new__(WorksheetManager)
+        wm._cs = cs
+        wm._doc = MagicMock()
+        wm._doc.fetch_sheet_metadata.return_value = {"sheets": [{"properties": {"title": "template", "sheetId": 1}}]}
+        wm._spreadsheet = CachedSpreadsheet(wm._doc)
+        wm._template = wm._spreadsheet.worksheet("template")
+        new_sheet = wm._doc.duplicate_sheet.return_value
+        new_sheet.title = "4.15.4"
+        new_sheet.id = 2
+
+        with self.assertRaises(WorksheetException):
+            wm.create_test_report()
+
+        # the incomplete sheet is deleted and evicted from cached metadata
+        wm._doc.del_worksheet.assert_called_once_with(new_sheet)
+        with self.assertRaises(WorksheetNotFound):
+            wm._spreadsheet.worksheet("4.15.4")
+        new_sheet.spreadsheet.batch_update.assert_not_called()
+
+
+class TestGspreadCache(TestCase):
+    """Unit tests of process-wide gspread client and cached worksheet metadata"""
+
+    def setUp(self):
+        clear_gspread_cache()
+        self.addCleanup(clear_gspread_cache)
+        self.cs = MagicMock()
+        self.cs.release = "4.15.4"
+        self.cs.get_google_sa_file.return_value = __file__
+        self.cs.get_report_template.return_value = "doc-key"
+
+    @patch("oar.core.worksheet.gspread.authorize")
+    @patch("oar.core.worksheet.Credentials")
+    def test_client_and_metadata_are_shared(self, mock_cred, mock_authorize):
+        doc = mock_authorize.return_value.open_by_key.return_value
+        doc.client = mock_authorize.return_value
+        doc.fetch_sheet_metadata.return_value = {"sheets": [
+            {"properties": {"title": "template", "sheetId": 1}},
+            {"properties": {"title": "4.15.4", "sheetId": 2}},
+        ]}
+
+        WorksheetManager(self.cs)
+        wm = WorksheetManager(self.cs)
+        report = wm.get_test_report()
+
+        mock_authorize.assert_called_once()
+        mock_authorize.return_value.open_by_key.assert_called_once_with("doc-key")
+        doc.fetch_sheet_metadata.assert_called_once()
+        self.assertEqual(report._ws.id, 2)
+
+    def test_metadata_reloaded_on_miss(self):
+        doc = MagicMock()
+        doc.fetch_sheet_metadata.return_value = {"sheets": [{"properties": {"title": "template", "sheetId": 1}}]}
+        spreadsheet = CachedSpreadsheet(doc)
+        self.assertEqual(spreadsheet.worksheet("template").id, 1)
+        self.assertRaises(WorksheetNotFound, spreadsheet.worksheet, "4.15.4")
+        self.assertEqual(doc.fetch_sheet_metadata.call_count, 2)
+
+        doc.fetch_sheet_metadata.return_value["sheets"].append({"properties": {"title": "4.15.4", "sheetId": 2}})
+        ws = spreadsheet.worksheet("4.15.4")
+        self.assertEqual(doc.fetch_sheet_metadata.call_count, 3)
+
+        spreadsheet.remove(ws)
+        doc.fetch_sheet_metadata.return_value["sheets"].pop()
+        self.assertRaises(WorksheetNotFound, spreadsheet.worksheet, "4.15.4")
+        self.assertEqual(doc.fetch_sheet_metadata.call_count, 4)